@@ -7,7 +7,7 @@ Includes lightweight mappings of job_listings and employer_profiles for read-onl
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -45,7 +45,13 @@ class JobSeekerProfile(Base):
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
-    __table_args__ = (UniqueConstraint("job_id", "job_seeker_id", name="uq_job_applications_job_seeker"),)
+    __table_args__ = (
+        UniqueConstraint("job_id", "job_seeker_id", name="uq_job_applications_job_seeker"),
+        # /applications/me: WHERE job_seeker_id = ? ORDER BY created_at DESC
+        Index("ix_job_applications_seeker_created_at", "job_seeker_id", text("created_at DESC")),
+        # Employer summaries and per-job counts: WHERE job_id IN (...) GROUP BY status
+        Index("ix_job_applications_job_status", "job_id", "status"),
+    )
 
     application_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     job_id: Mapped[int] = mapped_column(Integer, ForeignKey("job_listings.job_id", ondelete="CASCADE"), nullable=False, index=True)
@@ -63,13 +69,15 @@ class JobListing(Base):
     employer_id: Mapped[int] = mapped_column(Integer, index=True)
     job_title: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
 class EmployerProfile(Base):
     __tablename__ = "employer_profiles"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(Integer, index=True)
+    # Unique in profile_service (uq_employer_profiles_user_id): the join target for companyName
+    user_id: Mapped[int] = mapped_column(Integer, index=True, unique=True)
     company_name: Mapped[str] = mapped_column(String(200), nullable=False)
 
 
@@ -1,7 +1,8 @@
 """
 application_service/routes/application_routes.py
 
-REST API endpoints for applying to jobs and listing job seeker applications.
+REST API endpoints for applying to jobs and listing job seeker applications,
+and the employer dashboard's data endpoint.
 """
 
 from typing import Annotated
@@ -10,11 +11,13 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 try:
-    from project.auth import require_role
+    from project.auth import require_token_role
     from project.models import User
+    from project.responses import RowEncoder, json_response
 except ImportError:
-    from auth import require_role
+    from auth import require_token_role
     from models import User
+    from responses import RowEncoder, json_response
 
 from ..database import get_db
 from ..schemas import ApplicationCreate, ApplicationsMeResponse, ApplicationStatusUpdate
@@ -23,100 +26,141 @@ from ..service import ApplicationService
 
 router = APIRouter(prefix="", tags=["Applications"])
 
+# Response shapes over the service's (JobApplication, ...) rows; see project/responses.py.
+# ApplicationListItem
+_MY_APPLICATION = RowEncoder(
+    {
+        "applicationId": "JobApplication.application_id",
+        "jobId": "JobApplication.job_id",
+        "jobTitle": "job_title",
+        "companyName": lambda row: row.company_name or "",
+        "status": lambda row: ApplicationService.expose_status(row.JobApplication.status),
+        "appliedAt": "JobApplication.created_at",
+    }
+)
+# JobEmployerListItem, with the real count
+_EMPLOYER_JOB = RowEncoder(
+    {
+        "jobId": "job_id",
+        "jobTitle": "job_title",
+        "status": lambda row: ApplicationService.expose_status(row.status),
+        "createdAt": "created_at",
+        "applicationsCount": "applications",
+    }
+)
+_EMPLOYER_RECENT = RowEncoder(
+    {
+        "applicationId": "JobApplication.application_id",
+        "jobId": "JobApplication.job_id",
+        "candidateName": lambda row: row.full_name or (row.email or ""),
+        "jobTitle": "job_title",
+        "status": lambda row: ApplicationService.expose_status(row.JobApplication.status),
+        "appliedAt": "JobApplication.created_at",
+    }
+)
+
 
 @router.post("/applications", status_code=status.HTTP_201_CREATED)
 async def apply_to_job(
     payload: ApplicationCreate,
-    user: Annotated[User, Depends(require_role("job_seeker"))],
+    user: Annotated[User, Depends(require_token_role("job_seeker"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     app = await ApplicationService.apply(db=db, job_id=payload.jobId, job_seeker_id=user.id)
-    return {"applicationId": app.application_id, "status": ApplicationService.expose_status(app.status)}
+    return json_response(
+        {"applicationId": app.application_id, "status": ApplicationService.expose_status(app.status)},
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get("/applications/me", response_model=ApplicationsMeResponse)
 async def my_applications(
-    user: Annotated[User, Depends(require_role("job_seeker"))],
+    user: Annotated[User, Depends(require_token_role("job_seeker"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     rows = await ApplicationService.list_my_applications(db=db, job_seeker_id=user.id)
     summary = await ApplicationService.summarize_my_applications(db=db, job_seeker_id=user.id)
-
-    applications = []
-    for app, job_title, company_name in rows:
-        applications.append(
-            {
-                "applicationId": app.application_id,
-                "jobId": app.job_id,
-                "jobTitle": job_title,
-                "companyName": company_name or "",
-                "status": ApplicationService.expose_status(app.status),
-                "appliedAt": app.created_at,
-            }
-        )
-
-    return {"summary": summary, "applications": applications}
+    return json_response({"summary": summary, "applications": _MY_APPLICATION.items(rows)})
 
 
 @router.get("/applications/employer/recent")
 async def employer_recent_applications(
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
     limit: int = Query(default=5, ge=1, le=50),
 ):
     rows = await ApplicationService.list_employer_recent(db=db, employer_id=user.id, limit=limit)
-    items = []
-    for app, job_title, full_name, email in rows:
-        candidate = full_name or (email or "")
-        items.append(
-            {
-                "applicationId": app.application_id,
-                "jobId": app.job_id,
-                "candidateName": candidate,
-                "jobTitle": job_title,
-                "status": ApplicationService.expose_status(app.status),
-                "appliedAt": app.created_at,
-            }
-        )
-    return items
+    return json_response(_EMPLOYER_RECENT.items(rows))
 
 
 @router.get("/applications/employer/summary")
 async def employer_applications_summary(
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    return await ApplicationService.summarize_employer_applications(db=db, employer_id=user.id)
+    return json_response(await ApplicationService.summarize_employer_applications(db=db, employer_id=user.id))
 
 
 @router.get("/applications/employer/job-counts")
 async def employer_job_application_counts(
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     counts = await ApplicationService.employer_job_counts(db=db, employer_id=user.id)
     # JSON-friendly keys
-    return {str(k): v for k, v in counts.items()}
+    return json_response({str(k): v for k, v in counts.items()})
 
 
 @router.get("/applications/employer/{application_id}")
 async def employer_get_application(
     application_id: int,
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    return await ApplicationService.employer_get_application_detail(db=db, employer_id=user.id, application_id=application_id)
+    return json_response(
+        await ApplicationService.employer_get_application_detail(db=db, employer_id=user.id, application_id=application_id)
+    )
 
 
 @router.put("/applications/employer/{application_id}")
 async def employer_update_application(
     application_id: int,
     payload: ApplicationStatusUpdate,
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    return await ApplicationService.employer_update_application_status(
-        db=db, employer_id=user.id, application_id=application_id, status_value=payload.status
+    return json_response(
+        await ApplicationService.employer_update_application_status(
+            db=db, employer_id=user.id, application_id=application_id, status_value=payload.status
+        )
     )
 
 
+@router.get("/dashboard/employer/data", tags=["Dashboard"])
+async def employer_dashboard_data(
+    user: Annotated[User, Depends(require_token_role("employer"))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    recentLimit: int = Query(default=5, ge=1, le=50),
+):
+    """
+    Everything the employer dashboard shows, in one round trip:
+    {"user": {...}, "jobs": [...], "recentApplications": [...], "summary": {...}}.
+
+    jobs carry their applicationsCount from one grouped join, and the summary is
+    added up from those rows; both queries run on the request's session.
+    """
+    jobs = await ApplicationService.employer_jobs_overview(db=db, employer_id=user.id)
+    recent_rows = await ApplicationService.list_employer_recent(db=db, employer_id=user.id, limit=recentLimit)
+    return json_response(
+        {
+            "user": {"id": user.id, "email": user.email, "role": user.role},
+            "jobs": _EMPLOYER_JOB.items(jobs),
+            "recentApplications": _EMPLOYER_RECENT.items(recent_rows),
+            "summary": {
+                "totalJobs": len(jobs),
+                "activeJobs": sum(1 for job in jobs if (job.status or "").upper() == "ACTIVE"),
+                "totalApplications": sum(job.applications for job in jobs),
+                "pendingApplications": sum(int(job.pending) for job in jobs),
+            },
+        }
+    )
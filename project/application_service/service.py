@@ -7,10 +7,17 @@ Service-layer abstraction for application operations.
 from __future__ import annotations
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    from project.database import replica_reads
+    from project.singleflight import single_flight
+except ImportError:
+    from database import replica_reads
+    from singleflight import single_flight
+
 from .models import EmployerProfile, JobApplication, JobListing, JobSeekerProfile, User
 
 
@@ -41,6 +48,8 @@ class ApplicationService:
         return app
 
     @staticmethod
+    @single_flight("application.list_my_applications")
+    @replica_reads
     async def list_my_applications(*, db: AsyncSession, job_seeker_id: int):
         # Join for job title + company name
         stmt = (
@@ -59,6 +68,7 @@ class ApplicationService:
         return list(res.all())
 
     @staticmethod
+    @single_flight("application.list_employer_recent")
     async def list_employer_recent(*, db: AsyncSession, employer_id: int, limit: int = 5):
         stmt = (
             select(
@@ -79,6 +89,7 @@ class ApplicationService:
         return list(res.all())
 
     @staticmethod
+    @single_flight("application.summarize_employer_applications")
     async def summarize_employer_applications(*, db: AsyncSession, employer_id: int) -> dict:
         base = (
             select(JobApplication.status, func.count())
@@ -94,6 +105,31 @@ class ApplicationService:
         return {"total": total, "pending": pending}
 
     @staticmethod
+    @single_flight("application.employer_jobs_overview")
+    async def employer_jobs_overview(*, db: AsyncSession, employer_id: int) -> list:
+        """
+        An employer's jobs, newest first, each with its application counts, from one
+        grouped LEFT JOIN: (job_id, job_title, status, created_at, applications, pending) rows.
+        """
+        stmt = (
+            select(
+                JobListing.job_id,
+                JobListing.job_title,
+                JobListing.status,
+                JobListing.created_at,
+                func.count(JobApplication.application_id).label("applications"),
+                func.coalesce(func.sum(case((JobApplication.status == "PENDING", 1), else_=0)), 0).label("pending"),
+            )
+            .select_from(JobListing)
+            .join(JobApplication, JobApplication.job_id == JobListing.job_id, isouter=True)
+            .where(JobListing.employer_id == employer_id)
+            .group_by(JobListing.job_id, JobListing.job_title, JobListing.status, JobListing.created_at)
+            .order_by(JobListing.created_at.desc())
+        )
+        return list((await db.execute(stmt)).all())
+
+    @staticmethod
+    @single_flight("application.employer_job_counts")
     async def employer_job_counts(*, db: AsyncSession, employer_id: int) -> dict[int, int]:
         stmt = (
             select(JobApplication.job_id, func.count())
@@ -177,6 +213,8 @@ class ApplicationService:
         return detail
 
     @staticmethod
+    @single_flight("application.summarize_my_applications")
+    @replica_reads
     async def summarize_my_applications(*, db: AsyncSession, job_seeker_id: int) -> dict:
         total = (await db.execute(select(func.count()).select_from(JobApplication).where(JobApplication.job_seeker_id == job_seeker_id))).scalar_one()
         pending = (
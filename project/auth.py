@@ -2,9 +2,10 @@
 auth.py
 
 Security utilities:
-- bcrypt password hashing (Passlib)
+- bcrypt password hashing (Passlib), run on a bounded thread pool
 - JWT creation/verification
-- FastAPI dependencies for protected routes
+- Rotating, server-tracked refresh tokens (revoked on logout)
+- FastAPI dependencies for protected routes, backed by a per-process principal cache
 - Role-based access checks
 
 JWT is stored in an HTTP-only cookie for the UI routes.
@@ -12,28 +13,41 @@ JWT is stored in an HTTP-only cookie for the UI routes.
 
 import hashlib
 import os
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Literal, Optional
 
 import bcrypt
 from fastapi import Cookie, Depends, HTTPException, Request, status
 from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy import delete, event, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 # Support both package imports (`project.*`) and script-style imports when running
 # `python main.py` from inside the `project` folder.
 try:  # Package-style imports
-    from project.database import get_db
-    from project.models import User
+    from project.cache import TTLCache
+    from project.database import AsyncSessionLocal, get_db
+    from project.models import RefreshToken, User
+    from project.password_pool import PASSWORD_POOL_RETRY_AFTER, PasswordPoolSaturated, password_pool
 except ImportError:  # Script-style imports
-    from database import get_db
-    from models import User
+    from cache import TTLCache
+    from database import AsyncSessionLocal, get_db
+    from models import RefreshToken, User
+    from password_pool import PASSWORD_POOL_RETRY_AFTER, PasswordPoolSaturated, password_pool
 
 
 # -------------------------
 # Password hashing (bcrypt)
 # -------------------------
+# Work factor for new hashes (each +1 doubles the CPU cost).
+# Pick it with `python -m project.tools.calibrate_bcrypt`; existing hashes are
+# upgraded (or downgraded) transparently on the next successful login.
+BCRYPT_ROUNDS = min(max(int(os.getenv("BCRYPT_ROUNDS", "12")), 4), 31)
+
+
 def _prehash_password(password: str) -> bytes:
     """
     Pre-hash password with SHA-256 to avoid bcrypt's 72-byte limit.
@@ -51,7 +65,7 @@ def hash_password(password: str) -> str:
     """
     prehashed = _prehash_password(password)
     # Generate salt and hash
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(prehashed, salt)
     # Return as string (bcrypt hashes are base64 encoded)
     return hashed.decode("utf-8")
@@ -68,30 +82,121 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(prehashed, hashed_bytes)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True when a stored hash ("$2b$<cost>$...") was made with a different cost than BCRYPT_ROUNDS.
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return False
+
+
+def _password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please retry shortly.",
+        headers={"Retry-After": str(PASSWORD_POOL_RETRY_AFTER)},
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Async variant of hash_password for request handlers.
+    Runs on the password pool so bcrypt never blocks the event loop;
+    raises 503 (with Retry-After) when the pool is saturated.
+    """
+    try:
+        return await password_pool.run(hash_password, password)
+    except PasswordPoolSaturated:
+        raise _password_pool_busy()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Async variant of verify_password for request handlers (see hash_password_async).
+    """
+    try:
+        return await password_pool.run(verify_password, plain_password, hashed_password)
+    except PasswordPoolSaturated:
+        raise _password_pool_busy()
+
+
+async def rehash_password(*, user_id: int, plain_password: str, old_hash: str) -> None:
+    """
+    Background task: re-hash a just-verified password at BCRYPT_ROUNDS and store it.
+
+    Skipped when the password pool is busy (the next login retries). The update
+    only applies if the stored hash is still `old_hash`, so a concurrent
+    password change wins.
+    """
+    try:
+        new_hash = await password_pool.run(hash_password, plain_password)
+    except PasswordPoolSaturated:
+        return
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+
+
 # -------------------------
 # JWT settings
 # -------------------------
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-only-change-me")
 ALGORITHM = "HS256"
+# API clients and Auth.apiCall renew access tokens through /auth/refresh, but the
+# server-rendered pages and profile.js only check the access cookie, so keep the
+# default long enough not to bounce them to /login mid-session.
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
 
 # Cookie settings (Security Considerations)
 COOKIE_NAME = "access_token"
+REFRESH_COOKIE_NAME = "refresh_token"
 COOKIE_SECURE = os.getenv("COOKIE_SECURE", "false").lower() == "true"
 
 
-def create_access_token(*, subject: str, role: str) -> str:
+# Token format versions:
+# - 1: {"sub": email, "role"} - users resolved by email (still accepted during rollout)
+# - 2: adds {"ver": 2, "uid": users.id} - users resolved by primary key, claims trusted by API routes
+TOKEN_VERSION = 2
+
+
+def create_access_token(*, subject: str, role: str, user_id: Optional[int] = None) -> str:
     """
     Creates a signed JWT with an expiry.
-    subject: usually user email or user id (we use email for readability).
+    subject: user email (kept as `sub` so v1 readers can still decode new tokens).
     role: used for RBAC checks.
+    user_id: users.id; when given, a v2 token carrying `uid` is issued.
     """
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {"sub": subject, "role": role, "iat": int(now.timestamp()), "exp": expire}
+    if user_id is not None:
+        payload["ver"] = TOKEN_VERSION
+        payload["uid"] = int(user_id)
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
+def token_user_id(payload: dict) -> Optional[int]:
+    """
+    Returns the `uid` claim of a v2 token, or None for legacy email-only tokens.
+    Raises 401 when `ver` or `uid` is malformed.
+    """
+    version = payload.get("ver", 1)
+    uid = payload.get("uid")
+    try:
+        if type(version) is not int:
+            raise TypeError(version)
+        return int(uid) if version >= 2 and uid is not None else None
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload.")
+
+
 def decode_access_token(token: str) -> dict:
     """
     Validates signature + expiry.
@@ -120,23 +225,234 @@ def set_auth_cookie(response, token: str) -> None:
     )
 
 
+def set_refresh_cookie(response, token: str) -> None:
+    response.set_cookie(
+        key=REFRESH_COOKIE_NAME,
+        value=token,
+        httponly=True,
+        secure=COOKIE_SECURE,
+        samesite="lax",
+        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+        path="/",
+    )
+
+
 def clear_auth_cookie(response) -> None:
     response.delete_cookie(key=COOKIE_NAME, path="/")
+    response.delete_cookie(key=REFRESH_COOKIE_NAME, path="/")
+
+
+# -------------------------
+# Refresh tokens
+# -------------------------
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token.")
+
+
+def issue_refresh_token(db: AsyncSession, *, user_id: int, family_id: Optional[str] = None) -> str:
+    """
+    Creates a refresh token row (caller commits) and returns the raw token.
+    A new family is started unless `family_id` is given (rotation).
+    """
+    token = secrets.token_urlsafe(32)
+    db.add(
+        RefreshToken(
+            user_id=user_id,
+            token_hash=_token_digest(token),
+            family_id=family_id or secrets.token_hex(16),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return token
+
+
+async def purge_expired_refresh_tokens(db: AsyncSession, *, user_id: int) -> None:
+    await db.execute(
+        delete(RefreshToken).where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.expires_at < datetime.now(timezone.utc),
+        )
+    )
+
+
+async def revoke_refresh_family(db: AsyncSession, family_id: str) -> None:
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> tuple[User, str]:
+    """
+    Exchanges a refresh token for a new one in the same family (and commits).
+
+    Presenting an already-rotated token means it leaked or was replayed, so the
+    whole family is revoked and the caller must log in again.
+    """
+    now = datetime.now(timezone.utc)
+    result = await db.execute(select(RefreshToken).where(RefreshToken.token_hash == _token_digest(token)))
+    row = result.scalar_one_or_none()
+    if row is None:
+        raise _invalid_refresh_token()
+
+    expires_at = row.expires_at if row.expires_at.tzinfo else row.expires_at.replace(tzinfo=timezone.utc)
+    if row.revoked_at is not None or expires_at <= now:
+        if row.revoked_at is not None:
+            await revoke_refresh_family(db, row.family_id)
+            await db.commit()
+        raise _invalid_refresh_token()
+
+    # Conditional update so two concurrent refreshes can't both rotate the same token.
+    claimed = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == row.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    if claimed.rowcount != 1:
+        await db.rollback()
+        raise _invalid_refresh_token()
+
+    user = (await db.execute(select(User).where(User.id == row.user_id))).scalar_one_or_none()
+    if not user or not user.is_active:
+        await revoke_refresh_family(db, row.family_id)
+        await db.commit()
+        raise _invalid_refresh_token()
+
+    new_token = issue_refresh_token(db, user_id=user.id, family_id=row.family_id)
+    await db.commit()
+    return user, new_token
+
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> None:
+    """
+    Logout: revokes the token's whole family (and commits). Unknown tokens are ignored.
+    """
+    result = await db.execute(select(RefreshToken.family_id).where(RefreshToken.token_hash == _token_digest(token)))
+    family_id = result.scalar_one_or_none()
+    if family_id:
+        await revoke_refresh_family(db, family_id)
+        await db.commit()
+
+
+# -------------------------
+# Principal cache
+# -------------------------
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
+
+class Principal:
+    """
+    Compact, detached snapshot of an authenticated user.
+    Exposes the User attributes that routes and templates read.
+    """
+
+    __slots__ = ("id", "email", "role", "is_active", "created_at")
+
+    def __init__(self, *, id: int, email: str, role: str, is_active: bool, created_at: Optional[datetime]):
+        self.id = id
+        self.email = email
+        self.role = role
+        self.is_active = is_active
+        self.created_at = created_at
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# Every token digest -> principal cache in the process (values need an `id`),
+# so logout and user changes reach the profile service's cache as well.
+_principal_caches: list[TTLCache] = []
+
+
+def new_principal_cache() -> TTLCache:
+    """
+    A per-process cache of verified tokens, keyed by _token_digest(token).
+    Entries are dropped by revoke_access_token(), invalidate_principal() and
+    committed changes to a user's role or is_active.
+    """
+    cache = TTLCache(maxsize=PRINCIPAL_CACHE_MAX_ENTRIES, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+    _principal_caches.append(cache)
+    return cache
+
+
+# Keyed by SHA-256 of the raw token, so a hit skips both the JWT decode and the users query.
+principal_cache = new_principal_cache()
+
+
+# Access tokens logged out in this process. Other workers keep accepting them
+# until they expire, which ACCESS_TOKEN_EXPIRE_MINUTES keeps short.
+revoked_access_tokens = TTLCache(maxsize=PRINCIPAL_CACHE_MAX_ENTRIES, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+
+def revoke_access_token(token: str) -> None:
+    """
+    Logout: reject `token` in this process until it expires. Tokens that do not
+    verify are ignored, so junk strings can't push real revocations out of the LRU.
+    """
+    try:
+        payload = decode_access_token(token)
+    except HTTPException:
+        return
+    digest = _token_digest(token)
+    for cache in _principal_caches:
+        cache.pop(digest)
+    revoked_access_tokens.set(digest, True, ttl=float(payload.get("exp", 0)) - time.time())
+
+
+def invalidate_principal(user_id: int) -> None:
+    """
+    Drop cached principals for a user (call after deactivating it or changing its role).
+    """
+    for cache in _principal_caches:
+        cache.invalidate_where(lambda p: p.id == user_id)
+
+
+# session.info key: users whose role or is_active changed in the open transaction
+_CHANGED_PRINCIPALS = "changed_principals"
+
+
+@event.listens_for(Session, "after_flush")
+def _record_changed_principals(session: Session, flush_context) -> None:
+    # Catches ORM updates from any mapping of the users table; bulk Core UPDATEs
+    # must call invalidate_principal() themselves (or wait out the TTL).
+    for obj in list(session.dirty) + list(session.deleted):
+        if getattr(obj, "__tablename__", None) != "users":
+            continue
+        state = inspect(obj)
+        changed = obj in session.deleted or any(
+            state.attrs[name].history.has_changes() for name in ("role", "is_active") if name in state.attrs
+        )
+        if changed:
+            session.info.setdefault(_CHANGED_PRINCIPALS, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session: Session) -> None:
+    # Only once the new row is visible: dropping the entry at flush time let a
+    # concurrent request reload the old row into the cache for a full TTL.
+    for user_id in session.info.pop(_CHANGED_PRINCIPALS, ()):
+        invalidate_principal(user_id)
 
 
 # -------------------------
 # Dependencies
 # -------------------------
-async def get_current_user(
-    request: Request,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    # FastAPI >=0.115: default must be set outside of Annotated
-    token_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
-) -> User:
+def request_access_token(request: Request, token_cookie: Optional[str]) -> Optional[str]:
     """
-    Reads JWT from either:
-    - HTTP-only cookie (UI)
-    - Authorization: Bearer <token> header (API clients)
+    The access token from the cookie, else from an `Authorization: Bearer` header.
     """
     token = token_cookie
     if not token:
@@ -144,33 +460,100 @@ async def get_current_user(
         auth = request.headers.get("Authorization")
         if auth and auth.lower().startswith("bearer "):
             token = auth.split(" ", 1)[1].strip()
+    return token or None
+
 
+def _read_token(request: Request, token_cookie: Optional[str]) -> str:
+    token = request_access_token(request, token_cookie)
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated.")
+    return token
 
-    payload = decode_access_token(token)
-    email = payload.get("sub")
-    if not email:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload.")
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found.")
-    if not user.is_active:
+async def get_current_user(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    # FastAPI >=0.115: default must be set outside of Annotated
+    token_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
+) -> Principal:
+    """
+    Reads JWT from either:
+    - HTTP-only cookie (UI)
+    - Authorization: Bearer <token> header (API clients)
+
+    Verified principals are cached per token, so repeat calls skip the users query.
+    """
+    token = _read_token(request, token_cookie)
+
+    cache_key = _token_digest(token)
+    if revoked_access_tokens.get(cache_key):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+    principal = principal_cache.get(cache_key)
+    if principal is None:
+        payload = decode_access_token(token)
+        user_id = token_user_id(payload)
+        email = payload.get("sub")
+        if user_id is not None:
+            stmt = select(User).where(User.id == user_id)
+        elif email:
+            stmt = select(User).where(User.email == email)
+        else:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload.")
+
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found.")
+
+        principal = Principal.from_user(user)
+        # Never outlive the token itself.
+        principal_cache.set(cache_key, principal, ttl=float(payload.get("exp", 0)) - time.time())
+
+    if not principal.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user.")
-    return user
+    return principal
 
 
 Role = Literal["job_seeker", "employer"]
 
 
+async def get_token_user(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    # FastAPI >=0.115: default must be set outside of Annotated
+    token_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
+) -> Principal:
+    """
+    Claims-only variant of get_current_user for API routes that need just id and role.
+
+    A v2 token is trusted as-is (signature + expiry), with no users query; the
+    returned principal carries no created_at. Legacy tokens and cached
+    principals go through get_current_user.
+    """
+    token = _read_token(request, token_cookie)
+    cache_key = _token_digest(token)
+    if revoked_access_tokens.get(cache_key):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+    cached = principal_cache.get(cache_key)
+    if cached is not None:
+        if not cached.is_active:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user.")
+        return cached
+
+    payload = decode_access_token(token)
+    user_id = token_user_id(payload)
+    role = payload.get("role")
+    if user_id is None or not role:
+        return await get_current_user(request=request, db=db, token_cookie=token)
+    return Principal(id=user_id, email=payload.get("sub") or "", role=role, is_active=True, created_at=None)
+
+
 async def get_current_user_optional(
     request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     # FastAPI >=0.115: default must be set outside of Annotated
     token_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
-) -> Optional[User]:
+) -> Optional[Principal]:
     """
     UI-friendly dependency: returns None instead of raising 401/403.
     This still uses dependency injection, but lets UI routes redirect cleanly.
@@ -181,18 +564,33 @@ async def get_current_user_optional(
         return None
 
 
+def _check_role(user: Principal, allowed: tuple) -> Principal:
+    if user.role not in allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource.",
+        )
+    return user
+
+
 def require_role(*allowed: Role):
     """
     Dependency factory enforcing role-based access control.
     """
 
-    async def _checker(user: Annotated[User, Depends(get_current_user)]) -> User:
-        if user.role not in allowed:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have permission to access this resource.",
-            )
-        return user
+    async def _checker(user: Annotated[Principal, Depends(get_current_user)]) -> Principal:
+        return _check_role(user, allowed)
+
+    return _checker
+
+
+def require_token_role(*allowed: Role):
+    """
+    Like require_role, but trusts v2 token claims (see get_token_user) instead of loading the user.
+    """
+
+    async def _checker(user: Annotated[Principal, Depends(get_token_user)]) -> Principal:
+        return _check_role(user, allowed)
 
     return _checker
 
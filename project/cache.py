@@ -0,0 +1,82 @@
+"""
+cache.py
+
+Small in-process TTL + LRU cache with hit/miss counters.
+
+Entries expire after `ttl` seconds (or a per-entry override) and the least
+recently used entry is evicted once `maxsize` is reached. Not thread-safe:
+it is meant to be used from the event loop only.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    def __init__(self, *, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, *, ttl: Optional[float] = None) -> None:
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        if self._data.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Drop every entry whose value matches `predicate`. O(n); meant for rare events.
+        """
+        stale = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in stale:
+            del self._data[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self.invalidations += len(self._data)
+        self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxSize": self.maxsize,
+            "ttlSeconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
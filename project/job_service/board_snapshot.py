@@ -0,0 +1,197 @@
+"""
+job_service/board_snapshot.py
+
+Pre-encoded pages of the public job board (GET /jobs?status=ACTIVE).
+
+Every job seeker gets the same answer for the same page, so each page is
+kept as finished JSON bytes (plus a gzip copy) with a strong ETag, and a
+request is answered without a query, model construction or re-encoding.
+
+A page is current while the job generation (results_cache.job_generation)
+is the one it was built under and it is younger than BOARD_SNAPSHOT_TTL_SECONDS
+(the TTL covers other workers' writes this worker has not reconciled yet).
+After a write, the most recently served pages are rebuilt in the background
+from the primary, so the next request usually finds a fresh page; a request
+for a page that is still stale rebuilds it inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response, status
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .fields import LIST_FIELDS, row_encoder
+from .pagination import JobPage, page_size
+from .results_cache import job_generation
+from .service import JobService
+
+logger = logging.getLogger("job_portal.board_snapshot")
+
+BOARD_SNAPSHOT_MAX_PAGES = int(os.getenv("BOARD_SNAPSHOT_MAX_PAGES", "64"))
+BOARD_SNAPSHOT_TTL_SECONDS = float(os.getenv("BOARD_SNAPSHOT_TTL_SECONDS", "30"))
+# Pages rebuilt in the background after a write (most recently served first)
+BOARD_SNAPSHOT_REFRESH_PAGES = int(os.getenv("BOARD_SNAPSHOT_REFRESH_PAGES", "8"))
+# Writes arriving within this window share one background rebuild
+BOARD_SNAPSHOT_REFRESH_DELAY_SECONDS = float(os.getenv("BOARD_SNAPSHOT_REFRESH_DELAY_SECONDS", "0.5"))
+BOARD_SNAPSHOT_GZIP = os.getenv("BOARD_SNAPSHOT_GZIP", "1").lower() not in {"0", "false", "no"}
+# Smaller bodies are not worth compressing
+_GZIP_MIN_BYTES = 1024
+
+
+def board_page_body(page: JobPage, fields: Optional[tuple[str, ...]] = None) -> bytes:
+    """
+    JSON of one public board page: {"items": [...], "nextCursor": ..., "totalEstimate": ...}.
+    """
+    return to_json(
+        {
+            "items": row_encoder(fields or LIST_FIELDS).items(row for row, _ in page.rows),
+            "nextCursor": page.next_cursor,
+            "totalEstimate": page.total_estimate,
+        }
+    )
+
+
+class EncodedPage:
+    __slots__ = ("body", "gzip_body", "etag", "generation", "built_at")
+
+    def __init__(self, body: bytes, *, generation: int):
+        self.body = body
+        self.gzip_body = None
+        if BOARD_SNAPSHOT_GZIP and len(body) >= _GZIP_MIN_BYTES:
+            self.gzip_body = gzip.compress(body, compresslevel=6)
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.generation = generation
+        self.built_at = time.monotonic()
+
+    @property
+    def current(self) -> bool:
+        return self.generation == job_generation.value and time.monotonic() - self.built_at < BOARD_SNAPSHOT_TTL_SECONDS
+
+    def response(self, request: Request) -> Response:
+        use_gzip = self.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", "")
+        # Strong ETags name one exact representation, so the gzip body gets its own.
+        etag = self.etag[:-1] + '-gz"' if use_gzip else self.etag
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "private, no-cache"}
+        if etag in {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.gzip_body, media_type="application/json", headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class BoardSnapshot:
+    """
+    (page size, cursor, with_total, fields) -> EncodedPage, LRU-bounded, refreshed after writes.
+    """
+
+    def __init__(self, *, max_pages: int):
+        self.max_pages = max_pages
+        self._pages: OrderedDict[tuple, EncodedPage] = OrderedDict()
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.builds = 0
+        self.background_builds = 0
+        job_generation.subscribe(self._schedule_refresh)
+
+    def attach(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Enable background rebuilds (main.py lifespan); without it pages rebuild on request only.
+        """
+        self._session_factory = session_factory
+
+    def detach(self) -> None:
+        self._session_factory = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+
+    async def page(
+        self,
+        *,
+        db: AsyncSession,
+        limit: Optional[int],
+        cursor: Optional[str],
+        with_total: bool,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> EncodedPage:
+        key = (page_size(limit), cursor or "", with_total, fields)
+        encoded = self._pages.get(key)
+        if encoded is not None and encoded.current:
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return encoded
+        encoded = await self._build(db, key)
+        self.builds += 1
+        return encoded
+
+    async def _build(self, db: AsyncSession, key: tuple) -> EncodedPage:
+        size, cursor, with_total, fields = key
+        # Taken before the query: a write landing meanwhile leaves this page stale, not wrong.
+        generation = job_generation.value
+        page = await JobService.list_public_jobs(
+            db=db,
+            status_filter="ACTIVE",
+            limit=size,
+            cursor=cursor or None,
+            with_total=with_total,
+            fields=fields or LIST_FIELDS,
+        )
+        encoded = EncodedPage(board_page_body(page, fields), generation=generation)
+        self._pages[key] = encoded
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return encoded
+
+    def _schedule_refresh(self) -> None:
+        if self._session_factory is None or not self._pages:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+        except RuntimeError:
+            # No event loop (e.g. a CLI tool writing jobs); pages rebuild on request.
+            pass
+
+    async def _refresh(self) -> None:
+        try:
+            # Writes made while this runs do not schedule another refresh; go
+            # round again until a pass completes with no write in between.
+            while True:
+                await asyncio.sleep(BOARD_SNAPSHOT_REFRESH_DELAY_SECONDS)
+                generation = job_generation.value
+                keys = list(reversed(self._pages))[:BOARD_SNAPSHOT_REFRESH_PAGES]
+                async with self._session_factory() as db:
+                    # Straight after a write the replica may not have it yet.
+                    db.info["pin_primary"] = True
+                    for key in keys:
+                        await self._build(db, key)
+                        self.background_builds += 1
+                if job_generation.value == generation:
+                    break
+        except Exception:
+            logger.exception("Job board snapshot refresh failed")
+
+    def stats(self) -> dict:
+        return {
+            "pages": len(self._pages),
+            "maxPages": self.max_pages,
+            "hits": self.hits,
+            "builds": self.builds,
+            "backgroundBuilds": self.background_builds,
+        }
+
+
+board_snapshot = BoardSnapshot(max_pages=BOARD_SNAPSHOT_MAX_PAGES)
@@ -7,7 +7,13 @@ Uses the same PostgreSQL database by default to keep local development simple.
 
 import os
 from dotenv import find_dotenv, load_dotenv
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+try:
+    from project.database import get_engine, make_sessionmaker, request_session
+except ImportError:
+    from database import get_engine, make_sessionmaker, request_session
 
 load_dotenv(find_dotenv(usecwd=True))
 
@@ -21,15 +27,19 @@ def _get_database_url() -> str:
 
 DATABASE_URL = _get_database_url()
 
-engine: AsyncEngine = create_async_engine(DATABASE_URL, echo=False, future=True)
+# Shared with the other services when DATABASE_URL and pool settings match
+engine: AsyncEngine = get_engine(DATABASE_URL, service="job")
 
-AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = make_sessionmaker(
+    engine,
+    service="job",
+    replica_url=os.getenv("JOB_DATABASE_REPLICA_URL") or os.getenv("DATABASE_REPLICA_URL"),
 )
 
 
-async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
+async def get_db(request: Request) -> AsyncSession:
+    # Shares the request's session with the auth dependencies (see database.request_session)
+    async with request_session(request, AsyncSessionLocal) as session:
         yield session
 
 
@@ -0,0 +1,286 @@
+"""
+job_service/facets.py
+
+Facet counts for job search: how many of the matching jobs fall under each
+job type, canonical location and salary bucket, so the browse page can offer
+filters with counts.
+
+- SQL: one GROUPING SETS query over the search's WHERE clause on Postgres
+  (one GROUP BY over all facet columns, rolled up here, on other dialects)
+- memory: FacetBitmaps keeps a bitmap of index slots per facet value; each
+  count is a popcount of (matching jobs & value)
+
+Salary buckets are on salary_max within one period (the search's salary
+period, yearly by default), per currency, on a 1-2.5-5 scale so the same
+buckets read sensibly for "12 LPA" and "$95k".
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from sqlalchemy import case, func, literal_column, null, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import JobListing, Location
+
+# Most frequent locations returned in the location facet
+FACET_LOCATION_LIMIT = int(os.getenv("FACET_LOCATION_LIMIT", "20"))
+
+# Bucket lower bounds: 10, 25, 50, 100, 250, ... 500,000,000
+SALARY_BUCKET_EDGES = tuple(int(m * 10**e) for e in range(1, 9) for m in (1, 2.5, 5))
+
+
+def salary_bucket(amount: int) -> int:
+    return bisect.bisect_right(SALARY_BUCKET_EDGES, amount)
+
+
+def bucket_range(bucket: int) -> tuple[int, Optional[int]]:
+    """
+    [min, max) of a salary bucket; max is None for the last one.
+    """
+    low = SALARY_BUCKET_EDGES[bucket - 1] if bucket else 0
+    high = SALARY_BUCKET_EDGES[bucket] if bucket < len(SALARY_BUCKET_EDGES) else None
+    return low, high
+
+
+def _most_common(counter: Counter, limit: Optional[int] = None) -> list[tuple]:
+    # Counter.most_common breaks ties by insertion order, which differs between the SQL and memory paths.
+    return sorted(counter.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+@dataclass
+class FacetCounts:
+    period: str
+    job_types: Counter = field(default_factory=Counter)
+    locations: Counter = field(default_factory=Counter)
+    salaries: Counter = field(default_factory=Counter)  # (currency, bucket) -> count
+
+    def location_ids(self) -> list[int]:
+        return [location_id for location_id, _ in _most_common(self.locations, FACET_LOCATION_LIMIT)]
+
+    def to_dict(self, location_names: dict[int, str]) -> dict:
+        salary_buckets = []
+        for (currency, bucket), count in sorted(self.salaries.items(), key=lambda item: (item[0][0] or "", item[0][1])):
+            low, high = bucket_range(bucket)
+            salary_buckets.append({"currency": currency, "min": low, "max": high, "count": count})
+        return {
+            "jobType": [{"value": value, "count": count} for value, count in _most_common(self.job_types)],
+            "location": [
+                {"id": location_id, "name": location_names.get(location_id, ""), "count": count}
+                for location_id, count in _most_common(self.locations, FACET_LOCATION_LIMIT)
+            ],
+            "salary": {"period": self.period, "buckets": salary_buckets},
+        }
+
+
+# -------------------------
+# SQL
+# -------------------------
+def _bucket_column():
+    # Literals only: Postgres matches GROUP BY expressions textually, and bind
+    # parameters would be numbered differently in SELECT and GROUPING SETS.
+    return case(
+        (JobListing.salary_max.is_(None), null()),
+        *(
+            (JobListing.salary_max < literal_column(str(edge)), literal_column(str(i)))
+            for i, edge in enumerate(SALARY_BUCKET_EDGES)
+        ),
+        else_=literal_column(str(len(SALARY_BUCKET_EDGES))),
+    )
+
+
+async def sql_facet_counts(db: AsyncSession, conditions: list, *, period: str) -> FacetCounts:
+    """
+    Facet counts of the ACTIVE jobs matching `conditions` (a search's WHERE clauses), in one query.
+    """
+    counts = FacetCounts(period=period)
+    bucket = _bucket_column()
+    count = func.count()
+
+    if db.bind.dialect.name == "postgresql":
+        stmt = (
+            select(
+                func.grouping(JobListing.job_type),
+                func.grouping(JobListing.location_id),
+                JobListing.job_type,
+                JobListing.location_id,
+                JobListing.salary_period,
+                JobListing.salary_currency,
+                bucket,
+                count,
+            )
+            .where(*conditions)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(JobListing.job_type),
+                    tuple_(JobListing.location_id),
+                    tuple_(JobListing.salary_period, JobListing.salary_currency, bucket),
+                )
+            )
+        )
+        for no_type, no_location, job_type, location_id, salary_period, currency, bucket_value, n in (
+            await db.execute(stmt)
+        ).all():
+            if not no_type:
+                counts.job_types[job_type] += n
+            elif not no_location:
+                if location_id is not None:
+                    counts.locations[location_id] += n
+            elif salary_period == period and bucket_value is not None:
+                counts.salaries[(currency, bucket_value)] += n
+        return counts
+
+    stmt = (
+        select(
+            JobListing.job_type,
+            JobListing.location_id,
+            JobListing.salary_period,
+            JobListing.salary_currency,
+            bucket,
+            count,
+        )
+        .where(*conditions)
+        .group_by(
+            JobListing.job_type,
+            JobListing.location_id,
+            JobListing.salary_period,
+            JobListing.salary_currency,
+            bucket,
+        )
+    )
+    for job_type, location_id, salary_period, currency, bucket_value, n in (await db.execute(stmt)).all():
+        counts.job_types[job_type] += n
+        if location_id is not None:
+            counts.locations[location_id] += n
+        if salary_period == period and bucket_value is not None:
+            counts.salaries[(currency, bucket_value)] += n
+    return counts
+
+
+async def location_names(db: AsyncSession, location_ids: Iterable[int]) -> dict[int, str]:
+    ids = list(location_ids)
+    if not ids:
+        return {}
+    return dict((await db.execute(select(Location.id, Location.name).where(Location.id.in_(ids)))).all())
+
+
+# -------------------------
+# Memory
+# -------------------------
+def _to_bitmap(slots: Iterable[int]) -> int:
+    slots = list(slots)
+    if not slots:
+        return 0
+    buffer = bytearray((max(slots) >> 3) + 1)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def facet_keys(doc) -> list[tuple]:
+    keys = [("all",), ("job_type", doc.job_type), ("location", doc.location_id)]
+    if doc.salary_period and doc.salary_max is not None:
+        keys.append(("salary", doc.salary_period, doc.salary_currency, salary_bucket(doc.salary_max)))
+    return keys
+
+
+class FacetBitmaps:
+    """
+    Facet value -> index slots holding it. Every indexed job gets a small integer slot
+    (reused after removal); the per-value slot sets are turned into int bitmaps on first
+    use and cached until the value's membership changes.
+    """
+
+    __slots__ = ("slots", "job_ids", "free", "members", "_bitmaps")
+
+    def __init__(self) -> None:
+        self.slots: dict[int, int] = {}  # job_id -> slot
+        self.job_ids: list[Optional[int]] = []  # slot -> job_id
+        self.free: list[int] = []
+        self.members: dict[tuple, set[int]] = {}
+        self._bitmaps: dict[tuple, int] = {}
+
+    def add(self, doc) -> None:
+        if self.free:
+            slot = self.free.pop()
+            self.job_ids[slot] = doc.job_id
+        else:
+            slot = len(self.job_ids)
+            self.job_ids.append(doc.job_id)
+        self.slots[doc.job_id] = slot
+        for key in facet_keys(doc):
+            self.members.setdefault(key, set()).add(slot)
+            self._bitmaps.pop(key, None)
+
+    def remove(self, doc) -> None:
+        slot = self.slots.pop(doc.job_id, None)
+        if slot is None:
+            return
+        for key in facet_keys(doc):
+            members = self.members[key]
+            members.discard(slot)
+            if not members:
+                del self.members[key]
+            self._bitmaps.pop(key, None)
+        self.job_ids[slot] = None
+        self.free.append(slot)
+
+    def bitmap(self, key: tuple) -> int:
+        bits = self._bitmaps.get(key)
+        if bits is None:
+            bits = self._bitmaps[key] = _to_bitmap(self.members.get(key, ()))
+        return bits
+
+    def of_jobs(self, job_ids: Iterable[int]) -> int:
+        return _to_bitmap(self.slots[job_id] for job_id in job_ids)
+
+    def matching(self, search_filter, docs: dict) -> int:
+        """
+        Bitmap of the jobs passing a search.SearchFilter.
+        """
+        bits = self.bitmap(("all",))
+        if search_filter.location_ids is not None:
+            locations = 0
+            for location_id in search_filter.location_ids:
+                locations |= self.bitmap(("location", location_id))
+            bits &= locations
+        if search_filter.job_type:
+            bits &= self.bitmap(("job_type", search_filter.job_type))
+        salary = search_filter.salary
+        if salary is not None:
+            salaries = 0
+            for key in self.members:
+                if key[0] != "salary" or key[1] != salary.period or (salary.currency and key[2] != salary.currency):
+                    continue
+                low, high = bucket_range(key[3])
+                if salary.min_salary is None or low >= salary.min_salary:
+                    salaries |= self.bitmap(key)
+                elif high is None or high > salary.min_salary:
+                    # The bucket holding min_salary: check its jobs one by one.
+                    salaries |= _to_bitmap(
+                        slot for slot in self.members[key] if docs[self.job_ids[slot]].salary_max >= salary.min_salary
+                    )
+            bits &= salaries
+        return bits
+
+    def counts(self, bits: int, *, period: str) -> FacetCounts:
+        counts = FacetCounts(period=period)
+        for key in list(self.members):
+            kind = key[0]
+            if kind == "all" or (kind == "salary" and key[1] != period) or (kind == "location" and key[1] is None):
+                continue
+            count = (bits & self.bitmap(key)).bit_count()
+            if not count:
+                continue
+            if kind == "job_type":
+                counts.job_types[key[1]] = count
+            elif kind == "location":
+                counts.locations[key[1]] = count
+            else:
+                counts.salaries[(key[2], key[3])] = count
+        return counts
@@ -0,0 +1,106 @@
+"""
+job_service/fields.py
+
+Column projection for job reads.
+
+List and detail queries select the columns their response shows instead
+of whole JobListing entities (the Text columns are most of a row), and
+GET /jobs and GET /jobs/{job_id} accept a sparse fieldset:
+
+    GET /jobs?status=ACTIVE&fields=jobTitle,companyName
+    GET /jobs/42?fields=jobTitle,jobDescription
+
+which narrows the SELECT further (companyName alone decides whether
+employer_profiles is joined). `jobId` is always returned.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+try:
+    from project.responses import RowEncoder
+except ImportError:
+    from responses import RowEncoder
+
+from .models import EmployerProfile, JobListing
+
+# Response field -> column
+FIELD_COLUMNS = {
+    "jobId": JobListing.job_id,
+    "jobTitle": JobListing.job_title,
+    "companyName": EmployerProfile.company_name,
+    "location": JobListing.location,
+    "jobType": JobListing.job_type,
+    "salaryRange": JobListing.salary_range,
+    "status": JobListing.status,
+    "jobDescription": JobListing.job_description,
+    "qualifications": JobListing.qualifications,
+    "responsibilities": JobListing.responsibilities,
+    "createdAt": JobListing.created_at,
+    "updatedAt": JobListing.updated_at,
+}
+
+# JobPublicListItem
+LIST_FIELDS = ("jobId", "jobTitle", "companyName", "location", "jobType", "salaryRange", "createdAt")
+# JobDetail
+DETAIL_FIELDS = tuple(FIELD_COLUMNS)
+# JobEmployerListItem (applicationsCount is filled in by the route)
+EMPLOYER_LIST_FIELDS = ("jobId", "jobTitle", "status", "createdAt")
+
+
+def parse_fields(raw: Optional[str], allowed: tuple[str, ...]) -> Optional[tuple[str, ...]]:
+    """
+    Requested fields in `allowed` order (jobId always first), or None when `raw` is empty.
+    """
+    if not raw or not raw.strip():
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(allowed)}.",
+        )
+    return tuple(name for name in allowed if name in requested or name == "jobId")
+
+
+def columns(fields: tuple[str, ...], *, always: tuple[str, ...] = ()) -> list:
+    """
+    Columns to select for `fields`, plus `always` (e.g. the keyset columns).
+    """
+    names = list(fields) + [name for name in always if name not in fields]
+    return [FIELD_COLUMNS[name] for name in names]
+
+
+def needs_company(fields: tuple[str, ...]) -> bool:
+    return "companyName" in fields
+
+
+def _lower(value: Optional[str]) -> str:
+    return (value or "").lower()
+
+
+def _or_empty(value: Optional[str]) -> str:
+    return value or ""
+
+
+# Status is exposed lowercase like everywhere else; a missing company is "".
+_TRANSFORMS = {"status": _lower, "companyName": _or_empty}
+
+
+@lru_cache(maxsize=128)
+def row_encoder(fields: tuple[str, ...]) -> RowEncoder:
+    """
+    RowEncoder of `fields` over projected rows (or anything with the same attribute names).
+    """
+    getters = {}
+    for name in fields:
+        get = attrgetter(FIELD_COLUMNS[name].key)
+        transform = _TRANSFORMS.get(name)
+        getters[name] = get if transform is None else (lambda row, get=get, transform=transform: transform(get(row)))
+    return RowEncoder(getters)
@@ -0,0 +1,200 @@
+"""
+job_service/locations.py
+
+Canonical locations for job listings.
+
+`JobListing.location` stays the employer's free text; `location_id` points at
+a canonical `locations` row so "Bengaluru", "Bangalore, KA" and "bangalore"
+all filter as one place:
+
+- every normalized spelling seen is stored in `location_aliases`, so repeat
+  spellings resolve with one primary-key lookup
+- a new spelling is matched to an existing location by its first
+  comma-separated part, a small table of known renames, then trigram
+  similarity (pg_trgm on Postgres, the same measure in Python on SQLite)
+- search filters resolve the user's text the same way (without creating
+  anything) and become `location_id IN (...)` lookups
+
+Resolution runs on a sync Session or Connection so the create/update path
+(via AsyncSession.run_sync) and the migration backfill share one code path.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Optional, Union
+
+from sqlalchemy import Connection, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .models import JobListing, Location, LocationAlias
+
+Executor = Union[Session, Connection]
+
+# New spellings at least this similar to a known one are merged into it.
+MERGE_SIMILARITY = 0.6
+# Search filters accept looser matches ("bengal" -> Bengaluru).
+SEARCH_SIMILARITY = 0.35
+
+# Renamed / commonly alternated city names (keys are normalized).
+KNOWN_ALIASES = {
+    "bangalore": "bengaluru",
+    "bombay": "mumbai",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "gurgaon": "gurugram",
+    "new delhi": "delhi",
+    "poona": "pune",
+    "trivandrum": "thiruvananthapuram",
+    "work from home": "remote",
+    "wfh": "remote",
+    "anywhere": "remote",
+}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def location_key(raw: Optional[str]) -> str:
+    """
+    Lowercase ASCII words joined by single spaces: "Bengaluru,  KA" -> "bengaluru ka".
+    """
+    ascii_text = unicodedata.normalize("NFKD", raw or "").encode("ascii", "ignore").decode()
+    return " ".join(_WORD_RE.findall(ascii_text.lower()))
+
+
+def canonical_key(raw: Optional[str]) -> str:
+    """
+    Key of the place itself: first comma-separated part, with known renames applied.
+    """
+    primary = location_key((raw or "").split(",")[0])
+    return KNOWN_ALIASES.get(primary, primary)
+
+
+def _display_name(raw: str, key: str) -> str:
+    renamed = KNOWN_ALIASES.get(location_key(raw.split(",")[0]))
+    if renamed:
+        return renamed.title()
+    return " ".join(raw.split(",")[0].split()) or key.title()
+
+
+def trigrams(value: str) -> set[str]:
+    # Same construction as pg_trgm: each word padded with two leading and one trailing space.
+    grams: set[str] = set()
+    for word in value.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+
+def _dialect_name(executor: Executor) -> str:
+    bind = executor.get_bind() if isinstance(executor, Session) else executor
+    return bind.dialect.name
+
+
+def _similar_locations(executor: Executor, key: str, threshold: float) -> list[tuple[int, float]]:
+    """
+    (location_id, best alias similarity) for aliases at least `threshold` similar to `key`.
+    """
+    if _dialect_name(executor) == "postgresql":
+        score = func.similarity(LocationAlias.alias, key)
+        # `%` is the pg_trgm operator the GIN index serves (at pg_trgm.similarity_threshold).
+        stmt = select(LocationAlias.location_id, score).where(LocationAlias.alias.op("%")(key))
+        rows = executor.execute(stmt).all()
+    else:
+        rows = [
+            (location_id, similarity(alias, key))
+            for alias, location_id in executor.execute(select(LocationAlias.alias, LocationAlias.location_id)).all()
+        ]
+    best: dict[int, float] = {}
+    for location_id, score in rows:
+        if score >= threshold and score > best.get(location_id, 0.0):
+            best[location_id] = float(score)
+    return sorted(best.items(), key=lambda item: -item[1])
+
+
+def _lookup(executor: Executor, key: str, primary: str) -> Optional[int]:
+    location_id = executor.execute(select(LocationAlias.location_id).where(LocationAlias.alias == key)).scalar()
+    if location_id is None:
+        location_id = executor.execute(select(Location.id).where(Location.key == primary)).scalar()
+    return location_id
+
+
+def resolve_location_sync(executor: Executor, raw: str) -> Optional[int]:
+    """
+    Canonical location id for `raw`, creating the location and/or aliases when new.
+    """
+    key = location_key(raw)
+    if not key:
+        return None
+    primary = canonical_key(raw) or key
+
+    location_id = _lookup(executor, key, primary)
+    if location_id is None:
+        similar = _similar_locations(executor, primary, MERGE_SIMILARITY)
+        location_id = similar[0][0] if similar else None
+
+    aliases = {key, primary}
+    aliases -= set(executor.execute(select(LocationAlias.alias).where(LocationAlias.alias.in_(aliases))).scalars())
+    if location_id is not None and not aliases:
+        return location_id
+
+    # Another request may insert the same location/alias concurrently; a savepoint
+    # keeps the outer transaction usable and the retry reads the winner's row.
+    try:
+        with executor.begin_nested():
+            if location_id is None:
+                location_id = executor.execute(
+                    insert(Location).values(name=_display_name(raw, primary), key=primary).returning(Location.id)
+                ).scalar_one()
+            executor.execute(insert(LocationAlias), [{"alias": a, "location_id": location_id} for a in sorted(aliases)])
+    except IntegrityError:
+        location_id = _lookup(executor, key, primary)
+    return location_id
+
+
+def match_locations_sync(executor: Executor, raw: str) -> list[int]:
+    """
+    Location ids a search filter `raw` refers to (read-only): exact spelling first, then fuzzy.
+    """
+    key = location_key(raw)
+    if not key:
+        return []
+    location_id = _lookup(executor, key, canonical_key(raw) or key)
+    if location_id is not None:
+        return [location_id]
+    return [location_id for location_id, _ in _similar_locations(executor, canonical_key(raw) or key, SEARCH_SIMILARITY)]
+
+
+async def resolve_location(db: AsyncSession, raw: str) -> Optional[int]:
+    return await db.run_sync(resolve_location_sync, raw)
+
+
+async def match_locations(db: AsyncSession, raw: str) -> list[int]:
+    return await db.run_sync(match_locations_sync, raw)
+
+
+def backfill_job_locations(conn: Connection) -> int:
+    """
+    Resolve location_id for every job listing that has none. Returns the rows updated.
+    """
+    raws = conn.execute(select(JobListing.location).where(JobListing.location_id.is_(None)).distinct()).scalars().all()
+    updated = 0
+    for raw in raws:
+        location_id = resolve_location_sync(conn, raw)
+        if location_id is not None:
+            updated += conn.execute(
+                update(JobListing)
+                .where(JobListing.location == raw, JobListing.location_id.is_(None))
+                .values(location_id=location_id)
+            ).rowcount
+    return updated
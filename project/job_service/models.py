@@ -7,7 +7,7 @@ Also includes lightweight mappings for related tables (users/employer_profiles)
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -28,6 +28,22 @@ class User(Base):
 
 class JobListing(Base):
     __tablename__ = "job_listings"
+    __table_args__ = (
+        # Public browse (keyset pages): WHERE status = ? ORDER BY created_at DESC, job_id DESC
+        Index("ix_job_listings_status_created_id", "status", text("created_at DESC"), text("job_id DESC")),
+        # Employer dashboard: WHERE employer_id = ? ORDER BY created_at DESC
+        Index("ix_job_listings_employer_created_at", "employer_id", text("created_at DESC")),
+        # Location filter: WHERE location_id IN (...) AND status = ? ORDER BY created_at DESC
+        Index("ix_job_listings_location_status_created_at", "location_id", "status", text("created_at DESC")),
+        # Salary filter/sort: WHERE status = ? AND salary_period = ? AND salary_max >= ? ORDER BY salary_max DESC, job_id DESC
+        Index(
+            "ix_job_listings_status_period_salary",
+            "status",
+            "salary_period",
+            text("salary_max DESC"),
+            text("job_id DESC"),
+        ),
+    )
 
     job_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     employer_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -39,7 +55,15 @@ class JobListing(Base):
 
     job_type: Mapped[str] = mapped_column(String(32), nullable=False)
     location: Mapped[str] = mapped_column(String(200), nullable=False)
+    # Canonical location (see locations.py), resolved from `location` on create/update
+    location_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     salary_range: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    # Parsed from salary_range on create/update (see salary.py); amounts are per salary_period
+    # BIGINT: "300 cr" is 3,000,000,000, past a 32-bit INTEGER
+    salary_min: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    salary_max: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    salary_currency: Mapped[str | None] = mapped_column(String(3), nullable=True)
+    salary_period: Mapped[str | None] = mapped_column(String(8), nullable=True)
 
     # Stored uppercase for reliable filtering, exposed as lowercase in API for UI compatibility
     status: Mapped[str] = mapped_column(String(16), nullable=False, default="ACTIVE", index=True)
@@ -50,6 +74,30 @@ class JobListing(Base):
     )
 
 
+class Location(Base):
+    """
+    Canonical location, e.g. "Bengaluru" for "Bangalore, KA" and "bengaluru".
+    """
+
+    __tablename__ = "locations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    key: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
+
+
+class LocationAlias(Base):
+    """
+    Normalized spelling seen in job listings -> canonical location.
+    Postgres adds a pg_trgm GIN index on `alias` for fuzzy lookups (migration 4).
+    """
+
+    __tablename__ = "location_aliases"
+
+    alias: Mapped[str] = mapped_column(String(200), primary_key=True)
+    location_id: Mapped[int] = mapped_column(ForeignKey("locations.id", ondelete="CASCADE"), nullable=False, index=True)
+
+
 class EmployerProfile(Base):
     """
     Lightweight mapping of employer_profiles (owned by profile_service) for companyName lookups.
@@ -58,7 +106,10 @@ class EmployerProfile(Base):
     __tablename__ = "employer_profiles"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(Integer, index=True)
+    # Unique in profile_service (uq_employer_profiles_user_id): the join target for companyName
+    user_id: Mapped[int] = mapped_column(Integer, index=True, unique=True)
     company_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    # Conditional GETs of a job also change when the company name does
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
@@ -0,0 +1,156 @@
+"""
+job_service/pagination.py
+
+Keyset pagination helpers for the public job list and job search.
+
+Pages are ordered by (created_at DESC, job_id DESC); search can also order
+by (score DESC, created_at DESC, job_id DESC) or (salary_max DESC, job_id
+DESC). The client gets an opaque
+cursor naming the last row it saw; the next page continues strictly after
+that key, so each page is an index range scan no matter how deep the client
+pages (unlike OFFSET, which reads and discards every earlier row).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from .models import JobListing
+
+JOB_PAGE_DEFAULT_SIZE = int(os.getenv("JOB_PAGE_DEFAULT_SIZE", "20"))
+JOB_PAGE_MAX_SIZE = int(os.getenv("JOB_PAGE_MAX_SIZE", "100"))
+# Where the planner has no row estimate (SQLite), count at most this many rows.
+JOB_COUNT_ESTIMATE_CAP = int(os.getenv("JOB_COUNT_ESTIMATE_CAP", "1000"))
+# Rows fetched per round trip when a whole result is streamed (server-side cursor)
+JOB_STREAM_BATCH_SIZE = int(os.getenv("JOB_STREAM_BATCH_SIZE", "500"))
+
+# Search orderings: best match, newest first, highest salary_max first
+SORTS = ("relevance", "newest", "salary")
+
+
+@dataclass
+class JobPage:
+    # (JobListing, company_name) or (JobListing, company_name, score) rows
+    rows: list[tuple]
+    next_cursor: Optional[str] = None
+    total_estimate: Optional[int] = None
+    # job_type / location / salary bucket counts (see facets.py), when asked for
+    facets: Optional[dict] = None
+
+
+def page_size(limit: Optional[int]) -> int:
+    """
+    Requested page size clamped to [1, JOB_PAGE_MAX_SIZE].
+    """
+    if not limit:
+        return min(JOB_PAGE_DEFAULT_SIZE, JOB_PAGE_MAX_SIZE)
+    return max(1, min(limit, JOB_PAGE_MAX_SIZE))
+
+
+# -------------------------
+# Cursors
+# -------------------------
+def encode_cursor(
+    *, created_at: datetime, job_id: int, score: Optional[float] = None, salary: Optional[int] = None
+) -> str:
+    payload: dict[str, Any] = {"c": created_at.isoformat(), "i": job_id}
+    if score is not None:
+        payload["s"] = score
+    if salary is not None:
+        payload["m"] = salary
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
+    """
+    {"created_at", "job_id", "score", "salary"}, or None for the first page.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        return {
+            "created_at": datetime.fromisoformat(payload["c"]),
+            "job_id": int(payload["i"]),
+            "score": float(payload["s"]) if "s" in payload else None,
+            "salary": int(payload["m"]) if "m" in payload else None,
+        }
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+
+def _time_param(db: AsyncSession, value: datetime):
+    if db.bind.dialect.name != "sqlite":
+        return value
+    # SQLite compares the stored text; CURRENT_TIMESTAMP defaults have no fractional
+    # part, so bind the cursor in that exact format or equal timestamps never compare equal.
+    text_value = value.strftime("%Y-%m-%d %H:%M:%S")
+    if value.microsecond:
+        text_value += f".{value.microsecond:06d}"
+    return literal(text_value)
+
+
+def after_cursor(db: AsyncSession, cursor: dict) -> ColumnElement[bool]:
+    """
+    Rows strictly after `cursor` in (created_at DESC, job_id DESC) order.
+    """
+    created_at = _time_param(db, cursor["created_at"])
+    return or_(
+        JobListing.created_at < created_at,
+        and_(JobListing.created_at == created_at, JobListing.job_id < cursor["job_id"]),
+    )
+
+
+def after_ranked_cursor(db: AsyncSession, rank: ColumnElement, cursor: dict) -> ColumnElement[bool]:
+    """
+    Rows strictly after `cursor` in (rank DESC, created_at DESC, job_id DESC) order.
+    """
+    score = cursor["score"] if cursor["score"] is not None else 0.0
+    return or_(rank < score, and_(rank == score, after_cursor(db, cursor)))
+
+
+def after_salary_cursor(cursor: dict) -> ColumnElement[bool]:
+    """
+    Rows strictly after `cursor` in (salary_max DESC, job_id DESC) order.
+    """
+    salary = cursor["salary"] or 0
+    return or_(
+        JobListing.salary_max < salary,
+        and_(JobListing.salary_max == salary, JobListing.job_id < cursor["job_id"]),
+    )
+
+
+# -------------------------
+# Count estimates
+# -------------------------
+async def estimate_count(db: AsyncSession, stmt: Select) -> int:
+    """
+    Approximate number of rows `stmt` would return, without a full COUNT(*).
+
+    Postgres: the planner's row estimate (EXPLAIN, no execution).
+    Elsewhere: an exact count capped at JOB_COUNT_ESTIMATE_CAP.
+    """
+    stmt = stmt.order_by(None).limit(None).offset(None)
+    if db.bind.dialect.name == "postgresql":
+        compiled = stmt.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+        # Passing the statement lets a replica_reads session route the EXPLAIN to the replica.
+        conn = await db.connection(bind_arguments={"clause": stmt})
+        plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    capped = stmt.with_only_columns(JobListing.job_id).limit(JOB_COUNT_ESTIMATE_CAP).subquery()
+    return int((await db.execute(select(func.count()).select_from(capped))).scalar_one())
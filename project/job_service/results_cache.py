@@ -0,0 +1,57 @@
+"""
+job_service/results_cache.py
+
+Per-process cache of job search result pages, keyed by the normalized query.
+
+Anything that can change a search result bumps `job_generation`: JobService
+create/update/delete, employer company renames, and the search index
+picking up another worker's writes on reconcile. The generation is part of
+every key, so one bump makes all older entries unreachable at once (they
+age out of the LRU), and a search that was already running when the write
+landed stores its page under the old generation where nobody reads it.
+
+The counter is per process: other workers see a write only on their next
+reconcile (or, with SEARCH_BACKEND=sql, once the TTL expires a page), so
+with several workers results can lag by up to SEARCH_INDEX_RECONCILE_SECONDS.
+The index they search lags just as long, so a counter shared through the
+database would not shorten that (see DOCUMENTATION.md, "Query Indexes").
+"""
+
+import os
+from typing import Callable
+
+try:
+    from project.cache import TTLCache
+except ImportError:
+    from cache import TTLCache
+
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "30"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "2000"))
+
+
+class GenerationCounter:
+    __slots__ = ("value", "_listeners")
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    def bump(self) -> None:
+        self.value += 1
+        for listener in self._listeners:
+            listener()
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """
+        Call `listener` (synchronously, keep it cheap) after every bump.
+        """
+        self._listeners.append(listener)
+
+
+job_generation = GenerationCounter()
+
+search_results = TTLCache(maxsize=SEARCH_CACHE_MAX_ENTRIES, ttl=SEARCH_CACHE_TTL_SECONDS)
+
+
+def stats() -> dict:
+    return {**search_results.stats(), "generation": job_generation.value}
@@ -4,53 +4,91 @@ job_service/routes/job_api_routes.py
 REST API endpoints for the Job Listing microservice.
 """
 
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Support both package imports (`project.*`) and script-style imports.
 try:
-    from project.auth import get_current_user, require_role
+    from project.auth import get_token_user, require_token_role
+    from project.database import detached_session
     from project.models import User
+    from project.responses import RowEncoder, Validators, json_response, stream_response
 except ImportError:
-    from auth import get_current_user, require_role
+    from auth import get_token_user, require_token_role
+    from database import detached_session
     from models import User
+    from responses import RowEncoder, Validators, json_response, stream_response
 
-from ..database import get_db
-from ..schemas import JobCreate, JobDetail, JobEmployerListItem, JobPublicListItem, JobUpdate
+from ..board_snapshot import board_snapshot
+from ..database import AsyncSessionLocal, get_db
+from ..fields import DETAIL_FIELDS, LIST_FIELDS, needs_company, parse_fields, row_encoder
+from ..schemas import JobCreate, JobType, JobUpdate
+from ..salary import SALARY_MAX_AMOUNT, SalaryFilter
+from ..search import job_search_index
 from ..service import JobService
+from ..suggest import SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT
 
 
 router = APIRouter(prefix="", tags=["Jobs"])
 
+# Response shapes (see project/responses.py); item shapes of GET /jobs and
+# GET /jobs/{job_id} come from fields.row_encoder.
+_JOB_WRITTEN = RowEncoder(
+    {
+        "jobId": "job_id",
+        "jobTitle": "job_title",
+        "status": lambda job: JobService.expose_status(job.status),
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+    }
+)
+# JobEmployerListItem
+_EMPLOYER_JOB = RowEncoder(
+    {
+        "jobId": "job_id",
+        "jobTitle": "job_title",
+        "status": lambda job: JobService.expose_status(job.status),
+        "createdAt": "created_at",
+        "applicationsCount": lambda job: 0,
+    }
+)
+
 
 @router.post("/jobs", status_code=status.HTTP_201_CREATED)
 async def create_job(
     payload: JobCreate,
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     job = await JobService.create_job(db=db, employer_id=user.id, payload=payload)
-    return {
-        "jobId": job.job_id,
-        "jobTitle": job.job_title,
-        "status": JobService.expose_status(job.status),
-        "createdAt": job.created_at,
-        "updatedAt": job.updated_at,
-    }
+    return json_response(_JOB_WRITTEN.item(job), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/jobs")
 async def list_jobs(
-    user: Annotated[User, Depends(get_current_user)],
+    request: Request,
+    user: Annotated[User, Depends(get_token_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     employerId: Optional[int] = Query(default=None),
     status: Optional[str] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = Query(default=None, max_length=512),
+    includeTotal: bool = Query(default=False),
+    fields: Optional[str] = Query(default=None, max_length=300),
+    stream: Optional[Literal["ndjson", "json"]] = Query(default=None),
 ):
     """
     - Employer view: GET /jobs?employerId=<id> (restricted to that employer)
-    - Public browse: GET /jobs?status=ACTIVE (authenticated user)
+    - Public browse: GET /jobs?status=ACTIVE (authenticated user), paginated:
+      {"items": [...], "nextCursor": ..., "totalEstimate": ...}. Pass nextCursor back as
+      `cursor` for the next page; `limit` is capped at JOB_PAGE_MAX_SIZE.
+      ACTIVE pages are served pre-encoded with an ETag (see board_snapshot.py).
+      `fields=jobTitle,companyName` returns (and selects) only those item fields.
+    - Export: add stream=ndjson (one item per line) or stream=json (one array) to get
+      every matching job in page order, read through a server-side cursor;
+      limit/cursor/includeTotal do not apply.
     """
     if employerId is not None:
         # Employer-only listing (owner)
@@ -59,79 +97,182 @@ async def list_jobs(
         if user.id != employerId:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed.")
         jobs = await JobService.list_employer_jobs(db=db, employer_id=employerId)
-        return [
-            JobEmployerListItem(
-                jobId=j.job_id,
-                jobTitle=j.job_title,
-                status=JobService.expose_status(j.status),
-                createdAt=j.created_at,
-                applicationsCount=0,
-            ).model_dump()
-            for j in jobs
-        ]
-
-    # Public list (job seekers) - filter by status
-    rows = await JobService.list_public_jobs(db=db, status_filter=status)
-    items: list[dict] = []
-    for job, company_name in rows:
-        items.append(
-            JobPublicListItem(
-                jobId=job.job_id,
-                jobTitle=job.job_title,
-                companyName=company_name or "",
-                location=job.location,
-                jobType=job.job_type,
-                salaryRange=job.salary_range,
-                createdAt=job.created_at,
-            ).model_dump()
+        return json_response(_EMPLOYER_JOB.items(jobs))
+
+    # Public list (job seekers) - filter by status, one keyset page at a time
+    item_fields = parse_fields(fields, LIST_FIELDS)
+    if stream is not None:
+        # Validated before the 200 goes out; the generator only reads.
+        status_value = JobService.normalize_status(status) if status else None
+        encoder = row_encoder(item_fields or LIST_FIELDS)
+
+        async def items():
+            async with detached_session(request, AsyncSessionLocal) as stream_db:
+                async for row in JobService.stream_public_jobs(
+                    db=stream_db, status_value=status_value, fields=item_fields or LIST_FIELDS
+                ):
+                    yield encoder.item(row)
+
+        return stream_response(items(), fmt=stream)
+    if status is not None and status.strip().upper() == "ACTIVE":
+        encoded = await board_snapshot.page(
+            db=db, limit=limit, cursor=cursor, with_total=includeTotal, fields=item_fields
         )
-    return items
+        return encoded.response(request)
+    page = await JobService.list_public_jobs(
+        db=db,
+        status_filter=status,
+        limit=limit,
+        cursor=cursor,
+        with_total=includeTotal,
+        fields=item_fields or LIST_FIELDS,
+    )
+    return json_response(
+        {
+            "items": row_encoder(item_fields or LIST_FIELDS).items(row for row, _ in page.rows),
+            "nextCursor": page.next_cursor,
+            "totalEstimate": page.total_estimate,
+        }
+    )
+
+
+# Declared before /jobs/{job_id} so "search" is not parsed as a job id.
+@router.get("/jobs/search")
+async def search_jobs(
+    request: Request,
+    user: Annotated[User, Depends(get_token_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    keyword: Optional[str] = Query(default=None, max_length=200),
+    location: Optional[str] = Query(default=None, max_length=200),
+    jobType: Optional[JobType] = Query(default=None),
+    minSalary: Optional[int] = Query(default=None, ge=0, le=SALARY_MAX_AMOUNT),
+    currency: Optional[str] = Query(default=None, min_length=3, max_length=3),
+    period: Optional[Literal["hour", "day", "week", "month", "year"]] = Query(default=None),
+    sort: Optional[Literal["relevance", "newest", "salary"]] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = Query(default=None, max_length=512),
+    includeTotal: bool = Query(default=False),
+    includeFacets: bool = Query(default=False),
+    stream: Optional[Literal["ndjson", "json"]] = Query(default=None),
+):
+    """
+    Ranked full-text search over ACTIVE jobs, paginated like the public browse.
+    keyword supports "quoted phrases" and prefix* terms. jobType filters exactly; minSalary/currency/period filter
+    on the parsed salary (salary_max >= minSalary, same period, yearly by default);
+    sort=salary orders by it. includeFacets=true adds "facets": job type, location and
+    salary bucket counts over all matches (not just this page).
+    stream=ndjson|json returns every match instead (like GET /jobs?stream=), scored by SQL.
+    """
+    salary = None
+    if minSalary is not None or currency or period or sort == "salary":
+        salary = SalaryFilter(
+            period=period or "year", min_salary=minSalary, currency=currency.upper() if currency else None
+        )
+    # JobSearchItem: a public list item plus its score
+    encoder = row_encoder(LIST_FIELDS)
+    if stream is not None:
+        # Query parsing and location resolution happen here, before the 200 goes out.
+        plan = await JobService.plan_search(
+            db=db, q=keyword, location=location, job_type=jobType, salary=salary, sort=sort
+        )
+
+        async def items():
+            if plan is None:
+                return
+            async with detached_session(request, AsyncSessionLocal) as stream_db:
+                async for row, score in JobService.stream_search_jobs(db=stream_db, plan=plan):
+                    item = encoder.item(row)
+                    item["score"] = round(score, 6)
+                    yield item
+
+        return stream_response(items(), fmt=stream)
+    page = await JobService.search_jobs(
+        db=db,
+        q=keyword,
+        location=location,
+        job_type=jobType,
+        salary=salary,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+        with_total=includeTotal,
+        with_facets=includeFacets,
+    )
+    items = []
+    for job, _, score in page.rows:
+        item = encoder.item(job)
+        item["score"] = round(score, 6)
+        items.append(item)
+    return json_response(
+        {
+            "items": items,
+            "nextCursor": page.next_cursor,
+            "totalEstimate": page.total_estimate,
+            "facets": page.facets,
+        }
+    )
+
+
+# Also ahead of /jobs/{job_id}.
+@router.get("/jobs/suggest")
+async def suggest_jobs(
+    user: Annotated[User, Depends(get_token_user)],
+    q: str = Query(min_length=1, max_length=100),
+    kind: Optional[Literal["title", "company", "location"]] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1),
+):
+    """
+    Typeahead for the search box: job titles, companies and locations of ACTIVE jobs
+    starting (at any word) with `q`, most common first. Answered from memory.
+    """
+    suggestions = job_search_index.suggest(
+        q,
+        limit=min(limit or SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT),
+        kinds=(kind,) if kind else None,
+    )
+    return json_response({"items": [{"text": s.text, "kind": s.kind, "count": s.count} for s in suggestions]})
 
 
 @router.get("/jobs/{job_id}")
 async def view_job(
     job_id: int,
-    user: Annotated[User, Depends(get_current_user)],
+    request: Request,
+    user: Annotated[User, Depends(get_token_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    fields: Optional[str] = Query(default=None, max_length=300),
 ):
-    job, company_name = await JobService.get_job(db=db, job_id=job_id)
-    return JobDetail(
-        jobId=job.job_id,
-        jobTitle=job.job_title,
-        companyName=company_name or "",
-        location=job.location,
-        jobType=job.job_type,
-        salaryRange=job.salary_range,
-        status=JobService.expose_status(job.status),
-        jobDescription=job.job_description,
-        qualifications=job.qualifications,
-        responsibilities=job.responsibilities,
-        createdAt=job.created_at,
-        updatedAt=job.updated_at,
-    ).model_dump()
+    """
+    Full job detail, or only the comma-separated `fields` (e.g. fields=jobTitle,jobDescription).
+    Sends ETag/Last-Modified; a matching If-None-Match (or If-Modified-Since) gets a 304
+    after a timestamp lookup, without loading the job.
+    """
+    detail_fields = parse_fields(fields, DETAIL_FIELDS) or DETAIL_FIELDS
+    versions = await JobService.job_version(db=db, job_id=job_id, with_company=needs_company(detail_fields))
+    validators = Validators(
+        "job", job_id, *versions, ",".join(detail_fields), last_modified=max(v for v in versions if v is not None)
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+    job, _ = await JobService.get_job(db=db, job_id=job_id, fields=detail_fields)
+    # JobDetail, or the requested part of it
+    return json_response(row_encoder(detail_fields).item(job), headers=validators.headers())
 
 
 @router.put("/jobs/{job_id}")
 async def edit_job(
     job_id: int,
     payload: JobUpdate,
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     job = await JobService.update_job(db=db, job_id=job_id, employer_id=user.id, payload=payload)
-    return {
-        "jobId": job.job_id,
-        "jobTitle": job.job_title,
-        "status": JobService.expose_status(job.status),
-        "createdAt": job.created_at,
-        "updatedAt": job.updated_at,
-    }
+    return json_response(_JOB_WRITTEN.item(job))
 
 
 @router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
     job_id: int,
-    user: Annotated[User, Depends(require_role("employer"))],
+    user: Annotated[User, Depends(require_token_role("employer"))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     await JobService.delete_job(db=db, job_id=job_id, employer_id=user.id)
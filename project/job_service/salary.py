@@ -0,0 +1,222 @@
+"""
+job_service/salary.py
+
+Parses the free-text `salary_range` of a job listing into numeric bounds.
+
+    "10-15 LPA"              -> 1000000..1500000 INR / year
+    "₹5,00,000 - ₹8,00,000"  -> 500000..800000 INR / year
+    "$80k-$100k"             -> 80000..100000 USD / year
+    "€3000/month"            -> 3000..3000 EUR / month
+    "50000-80000"            -> 50000..80000 ? / year
+    "Up to 12 LPA"           -> None..1200000 INR / year
+    "3-5 years exp, 10 LPA"  -> 1000000..1000000 INR / year
+    "2024 grad, 6 LPA"       -> 600000..600000 INR / year
+    "50000"                  -> no bounds (bare number)
+    "10 LPA + 2 LPA bonus"   -> no bounds (two amounts, ambiguous)
+    "Negotiable"             -> no bounds
+
+A number is an amount only next to a currency ("₹", "Rs", "USD"), a unit
+("k", "L", "LPA", "cr"), a period ("/month", "per hour") or a range
+separator ("-", "to"); one followed by years/yrs/exp is experience, not
+pay. Text with no amount, or with more than one amount or range, yields no
+bounds rather than a guess. After changing these rules, re-parse stored
+rows with `python -m project.tools.backfill_salaries --all`.
+
+Amounts are whole currency units in the listing's own period (no conversion).
+A missing period is taken as yearly, a missing currency stays unknown.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from .models import JobListing
+
+PERIODS = ("hour", "day", "week", "month", "year")
+
+# Largest amount the BIGINT salary columns hold; anything above is not a salary anyway.
+SALARY_MAX_AMOUNT = 2**63 - 1
+
+_CURRENCY_SYMBOLS = {"₹": "INR", "$": "USD", "€": "EUR", "£": "GBP"}
+_CURRENCY_WORDS = {
+    "inr": "INR",
+    "rs": "INR",
+    "rupees": "INR",
+    "usd": "USD",
+    "eur": "EUR",
+    "euro": "EUR",
+    "euros": "EUR",
+    "gbp": "GBP",
+    "aud": "AUD",
+    "cad": "CAD",
+    "sgd": "SGD",
+}
+_PERIOD_WORDS = {
+    "hour": "hour", "hours": "hour", "hr": "hour", "hrs": "hour", "hourly": "hour", "ph": "hour",
+    "day": "day", "daily": "day", "pd": "day",
+    "week": "week", "weekly": "week", "wk": "week", "pw": "week",
+    "month": "month", "monthly": "month", "mo": "month", "pm": "month",
+    "year": "year", "yearly": "year", "yr": "year", "annum": "year", "annual": "year", "annually": "year",
+    "pa": "year", "lpa": "year", "ctc": "year",
+}
+_MULTIPLIERS = {
+    "k": 1_000,
+    "m": 1_000_000,
+    "mn": 1_000_000,
+    "l": 100_000,
+    "lakh": 100_000,
+    "lakhs": 100_000,
+    "lac": 100_000,
+    "lacs": 100_000,
+    "lpa": 100_000,
+    "cr": 10_000_000,
+    "crore": 10_000_000,
+    "crores": 10_000_000,
+}
+
+_AMOUNT_RE = re.compile(
+    r"(?P<currency>[₹$€£]|\b(?:rs|inr|usd|eur|gbp|aud|cad|sgd)\b\.?)?\s*"
+    r"(?P<number>\d+(?:,\d+)*(?:\.\d+)?)\s*"
+    r"(?P<suffix>k|mn|m|lakhs?|lacs?|lpa|l|crores?|cr)?(?![a-z])",
+    re.IGNORECASE,
+)
+# The word after an amount: "3000/month", "50 per hour", "50000 INR", "5 years"
+_NEXT_WORD_RE = re.compile(r"\s*(/\s*|per\s+)?([a-z]+)")
+_RANGE_SEPARATOR_RE = re.compile(r"\s*(?:-|–|—|to)\s*")
+_EXPERIENCE_WORDS = {"year", "years", "yr", "yrs", "exp", "experience"}
+# "3-5 years", "2+ yrs": not a period either
+_EXPERIENCE_RE = re.compile(r"\d\+?\s*(?:years?|yrs?|exp|experience)\b")
+_WORD_RE = re.compile(r"[a-z]+")
+# "$50/h", "3000/m"
+_SHORT_PERIOD_RE = re.compile(r"/\s*([hdwmy])\b")
+_SHORT_PERIODS = {"h": "hour", "d": "day", "w": "week", "m": "month", "y": "year"}
+_UP_TO_RE = re.compile(r"\b(up\s*to|upto|max(imum)?|below|under)\b")
+
+
+@dataclass(frozen=True)
+class ParsedSalary:
+    salary_min: Optional[int]
+    salary_max: Optional[int]
+    currency: Optional[str]
+    period: str
+
+    def columns(self) -> dict:
+        return {
+            "salary_min": self.salary_min,
+            "salary_max": self.salary_max,
+            "salary_currency": self.currency,
+            "salary_period": self.period,
+        }
+
+
+EMPTY_SALARY_COLUMNS = {"salary_min": None, "salary_max": None, "salary_currency": None, "salary_period": None}
+
+
+def parse_salary_range(raw: Optional[str]) -> Optional[ParsedSalary]:
+    """
+    Numeric bounds of a salary text, or None when it names no amount or more than one.
+    """
+    if not raw:
+        return None
+    text = raw.strip().lower()
+    words = _WORD_RE.findall(_EXPERIENCE_RE.sub(" ", text))
+
+    currency = next((code for symbol, code in _CURRENCY_SYMBOLS.items() if symbol in raw), None)
+    if currency is None:
+        currency = next((_CURRENCY_WORDS[w] for w in words if w in _CURRENCY_WORDS), None)
+    period = next((_PERIOD_WORDS[w] for w in words if w in _PERIOD_WORDS), None)
+    short_period = _SHORT_PERIOD_RE.search(text)
+    if period is None and short_period:
+        period = _SHORT_PERIODS[short_period.group(1)]
+
+    amounts = _amount_groups(text)
+    if len(amounts) != 1:
+        return None
+    amounts = amounts[0]
+
+    # "10-15 LPA", "80-100k": a trailing unit applies to a bare leading number too.
+    unit = amounts[-1][1]
+    if unit is None and "lpa" in words:
+        unit = "lpa"
+    values = [value * _MULTIPLIERS.get(suffix or unit or "", 1) for value, suffix in amounts]
+    if "lpa" in words or unit in {"l", "lakh", "lakhs", "lac", "lacs", "lpa", "cr", "crore", "crores"}:
+        currency = currency or "INR"
+
+    low, high = int(round(min(values))), int(round(max(values)))
+    if high > SALARY_MAX_AMOUNT:
+        return None
+    if len(values) == 1 and _UP_TO_RE.search(text):
+        return ParsedSalary(salary_min=None, salary_max=high, currency=currency, period=period or "year")
+    return ParsedSalary(salary_min=low, salary_max=high, currency=currency, period=period or "year")
+
+
+def _amount_groups(text: str) -> list[list[tuple[float, Optional[str]]]]:
+    """
+    (value, suffix) amounts in lowercased `text`, grouped: one per single
+    amount, two per range. A single number counts only with a currency, unit
+    or period next to it; a group with a number followed by years/yrs/exp is
+    dropped.
+    """
+    groups: list[list[tuple[float, Optional[str]]]] = []
+    current: list[tuple[float, Optional[str]]] = []
+    anchored = experience = False
+    previous_end = 0
+
+    for match in _AMOUNT_RE.finditer(text):
+        in_range = len(current) == 1 and _RANGE_SEPARATOR_RE.fullmatch(text, previous_end, match.start())
+        if not in_range:
+            if current and (anchored or len(current) == 2) and not experience:
+                groups.append(current)
+            current, anchored, experience = [], False, False
+
+        suffix = (match.group("suffix") or "").lower() or None
+        following = _NEXT_WORD_RE.match(text, match.end())
+        joiner, word = following.groups() if following else (None, None)
+        if match.group("currency") or suffix or joiner:
+            anchored = True
+        elif word in _EXPERIENCE_WORDS:
+            experience = True
+        elif word in _CURRENCY_WORDS or word in _PERIOD_WORDS:
+            anchored = True
+        current.append((float(match.group("number").replace(",", "")), suffix))
+        previous_end = match.end()
+
+    if current and (anchored or len(current) == 2) and not experience:
+        groups.append(current)
+    return groups
+
+
+def salary_columns(raw: Optional[str]) -> dict:
+    """
+    salary_min/salary_max/salary_currency/salary_period values for a JobListing.
+    """
+    parsed = parse_salary_range(raw)
+    return parsed.columns() if parsed else dict(EMPTY_SALARY_COLUMNS)
+
+
+@dataclass(frozen=True)
+class SalaryFilter:
+    """
+    Search restriction on the parsed columns: same period (and currency, if given), salary_max >= min_salary.
+    """
+
+    period: str = "year"
+    min_salary: Optional[int] = None
+    currency: Optional[str] = None
+
+    def clauses(self) -> list:
+        clauses = [JobListing.salary_period == self.period, JobListing.salary_max.is_not(None)]
+        if self.min_salary is not None:
+            clauses.append(JobListing.salary_max >= self.min_salary)
+        if self.currency:
+            clauses.append(JobListing.salary_currency == self.currency)
+        return clauses
+
+    def matches(self, period: Optional[str], currency: Optional[str], salary_max: Optional[int]) -> bool:
+        if period != self.period or salary_max is None:
+            return False
+        if self.min_salary is not None and salary_max < self.min_salary:
+            return False
+        return not self.currency or currency == self.currency
@@ -56,6 +56,10 @@ class JobPublicListItem(BaseModel):
     createdAt: datetime
 
 
+class JobSearchItem(JobPublicListItem):
+    score: float = 0.0
+
+
 class JobDetail(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,744 @@
+"""
+job_service/search.py
+
+Full-text search over job_listings.
+
+Query syntax (all parts are AND-ed):
+    python developer       -> both words, in any field
+    "data engineer"        -> the words next to each other, in that order
+    engin*                 -> any word starting with "engin"
+
+/jobs/search is answered from a per-process inverted index of ACTIVE jobs
+(JobSearchIndex) that also carries everything a result row shows, so a warm
+search makes no database round trip:
+- built in the background at startup (main.py lifespan)
+- kept current by JobService create/update/delete
+- reconciled against the database every SEARCH_INDEX_RECONCILE_SECONDS, which
+  picks up writes made by other workers and fixes anything missed
+
+Until the index is ready (or with SEARCH_BACKEND=sql) search runs in SQL: the
+generated `search_vector` tsvector column (title weight A, qualifications/
+responsibilities B, description C) with a GIN index on Postgres (migration
+3), plain LIKE matching elsewhere.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+import os
+import re
+import time
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import and_, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .facets import FacetBitmaps
+from .models import EmployerProfile, JobListing, Location
+from .pagination import JobPage, encode_cursor
+from .results_cache import job_generation
+from .salary import SalaryFilter
+from .suggest import SuggestIndex, Suggestion
+
+logger = logging.getLogger("job_portal.search")
+
+# "memory": in-process index, SQL while it is cold; "sql": always SQL (no index is built)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "memory").lower()
+SEARCH_INDEX_RECONCILE_SECONDS = float(os.getenv("SEARCH_INDEX_RECONCILE_SECONDS", "60"))
+# A filter-only (no keyword) search walks the newest-first list; after this many
+# non-matching jobs it is cheaper to let the SQL indexes answer.
+SEARCH_INDEX_SCAN_BUDGET = int(os.getenv("SEARCH_INDEX_SCAN_BUDGET", "5000"))
+
+# Same configuration as the search_vector column in migrations.py
+TS_CONFIG = "english"
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Short list of English stop words; positions still advance over them so phrases line up.
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the to was were will with".split()
+)
+
+
+# -------------------------
+# Query parsing
+# -------------------------
+@dataclass(frozen=True)
+class SearchTerm:
+    # (offset, word) pairs; offsets keep the gaps left by dropped stop words
+    words: tuple[tuple[int, str], ...]
+    prefix: bool = False
+
+    @property
+    def is_phrase(self) -> bool:
+        return len(self.words) > 1
+
+
+def tokenize(value: Optional[str]) -> list[tuple[int, str]]:
+    """
+    Lowercase word tokens with their positions, stop words removed.
+    """
+    if not value:
+        return []
+    return [
+        (position, word)
+        for position, word in enumerate(_WORD_RE.findall(value.lower()))
+        if word not in STOP_WORDS
+    ]
+
+
+def parse_query(raw: Optional[str]) -> list[SearchTerm]:
+    terms: list[SearchTerm] = []
+    for phrase, bare in _QUERY_RE.findall(raw or ""):
+        if phrase:
+            words = tokenize(phrase)
+            if words:
+                first = words[0][0]
+                terms.append(SearchTerm(words=tuple((p - first, w) for p, w in words)))
+            continue
+        prefix = bare.endswith("*")
+        words = [w for w in _WORD_RE.findall(bare.lower())]
+        if prefix and len(words) == 1:
+            # Stop words are fine as prefixes ("an*" -> "analyst")
+            terms.append(SearchTerm(words=((0, words[0]),), prefix=True))
+            continue
+        # "full-time" tokenizes like the indexed text: a phrase of its parts
+        words = [w for w in words if w not in STOP_WORDS]
+        if words:
+            terms.append(SearchTerm(words=tuple(enumerate(words))))
+    return terms
+
+
+def to_tsquery_text(terms: Iterable[SearchTerm]) -> str:
+    """
+    Render parsed terms for to_tsquery(). Words are [a-z0-9]+, so no escaping is needed.
+    """
+    parts = []
+    for term in terms:
+        if term.prefix:
+            parts.append(f"{term.words[0][1]}:*")
+        elif term.is_phrase:
+            rendered = term.words[0][1]
+            for (previous, _), (offset, word) in zip(term.words, term.words[1:]):
+                rendered += f" <{offset - previous}> {word}"
+            parts.append(f"({rendered})")
+        else:
+            parts.append(term.words[0][1])
+    return " & ".join(parts)
+
+
+# -------------------------
+# SQL fallback
+# -------------------------
+search_vector = literal_column("job_listings.search_vector")
+
+
+def postgres_match(terms: list[SearchTerm]):
+    """
+    (where clause, rank expression) for a tsvector search.
+    """
+    query = func.to_tsquery(TS_CONFIG, to_tsquery_text(terms))
+    return search_vector.op("@@")(query), func.ts_rank_cd(search_vector, query)
+
+
+def like_match(terms: list[SearchTerm]):
+    """
+    (where clause, rank expression) without full-text support: each term as a substring
+    of some indexed field, unranked. Only used while the in-memory index is cold.
+    """
+    columns = [getattr(JobListing, name) for name, _ in INDEXED_FIELDS]
+    clauses = []
+    for term in terms:
+        # Words are [a-z0-9]+, so nothing needs LIKE-escaping.
+        pattern = "%" + " ".join(word for _, word in term.words) + "%"
+        clauses.append(or_(*(func.lower(column).like(pattern) for column in columns)))
+    return and_(*clauses), literal(0.0)
+
+
+def sql_match(db: AsyncSession, terms: list[SearchTerm]):
+    if db.bind.dialect.name == "postgresql":
+        return postgres_match(terms)
+    return like_match(terms)
+
+
+# -------------------------
+# In-memory index
+# -------------------------
+# Positions are stored as field * FIELD_SPAN + word position, so one integer carries both
+# and phrases can never match across two fields.
+FIELD_SPAN = 1 << 20
+# Indexed fields and their weights (mirroring ts_rank's A=1.0, B=0.4, C=0.2)
+INDEXED_FIELDS = (
+    ("job_title", 1.0),
+    ("qualifications", 0.4),
+    ("responsibilities", 0.4),
+    ("job_description", 0.2),
+)
+
+# Columns a JobDoc is built from (the index query selects exactly these)
+DOC_COLUMNS = (
+    "job_id",
+    "employer_id",
+    "job_title",
+    "location",
+    "location_id",
+    "job_type",
+    "salary_range",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "salary_period",
+    "created_at",
+    "updated_at",
+)
+
+
+def _document_positions(row) -> dict[str, array]:
+    positions: dict[str, array] = {}
+    for field_index, (name, _) in enumerate(INDEXED_FIELDS):
+        base = field_index * FIELD_SPAN
+        for position, word in tokenize(getattr(row, name)):
+            word_positions = positions.get(word)
+            if word_positions is None:
+                word_positions = positions[word] = array("I")
+            word_positions.append(base + position)
+    return positions
+
+
+class JobDoc:
+    """
+    One indexed ACTIVE job: the fields a search result shows, filter/sort values and its words.
+    Quacks like the JobListing rows the SQL path returns.
+    """
+
+    __slots__ = DOC_COLUMNS + ("company_name", "location_name", "created_key", "words")
+
+    def __init__(self, row, company_name: Optional[str], location_name: Optional[str], words: tuple[str, ...]):
+        for name in DOC_COLUMNS:
+            setattr(self, name, getattr(row, name))
+        self.company_name = company_name
+        self.location_name = location_name  # canonical name of location_id
+        self.created_key = self.created_at.timestamp() if self.created_at else 0.0
+        self.words = words
+
+    @property
+    def newest_key(self) -> tuple[float, int]:
+        return -self.created_key, -self.job_id
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """
+    Non-text restrictions of a search: canonical locations, job type and salary.
+    """
+
+    location_ids: Optional[frozenset[int]] = None
+    job_type: Optional[str] = None
+    salary: Optional[SalaryFilter] = None
+
+    def clauses(self) -> list:
+        clauses = []
+        if self.location_ids is not None:
+            clauses.append(JobListing.location_id.in_(sorted(self.location_ids)))
+        if self.job_type:
+            clauses.append(JobListing.job_type == self.job_type)
+        if self.salary is not None:
+            clauses.extend(self.salary.clauses())
+        return clauses
+
+    def matches(self, doc: JobDoc) -> bool:
+        if self.location_ids is not None and doc.location_id not in self.location_ids:
+            return False
+        if self.job_type and doc.job_type != self.job_type:
+            return False
+        return self.salary is None or self.salary.matches(doc.salary_period, doc.salary_currency, doc.salary_max)
+
+
+class InvertedIndex:
+    """
+    word -> {job_id: positions}, a sorted vocabulary for prefix lookups, the JobDocs,
+    their (created_at DESC, job_id DESC) order, facet bitmaps and typeahead suggestions.
+    """
+
+    __slots__ = ("postings", "vocabulary", "docs", "newest", "facets", "suggest")
+
+    def __init__(self) -> None:
+        self.postings: dict[str, dict[int, array]] = {}
+        self.vocabulary: list[str] = []
+        self.docs: dict[int, JobDoc] = {}
+        self.newest: list[tuple[float, int]] = []  # JobDoc.newest_key, ascending
+        self.facets = FacetBitmaps()
+        self.suggest = SuggestIndex()
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, row, company_name: Optional[str], location_name: Optional[str] = None) -> None:
+        self.remove(row.job_id)
+        positions = _document_positions(row)
+        for word, word_positions in positions.items():
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = {}
+                bisect.insort(self.vocabulary, word)
+            posting[row.job_id] = word_positions
+        doc = JobDoc(row, company_name, location_name, tuple(positions))
+        self.docs[doc.job_id] = doc
+        bisect.insort(self.newest, doc.newest_key)
+        self.facets.add(doc)
+        self.suggest.add_doc(doc)
+
+    def remove(self, job_id: int) -> None:
+        doc = self.docs.pop(job_id, None)
+        if doc is None:
+            return
+        for word in doc.words:
+            posting = self.postings[word]
+            posting.pop(job_id, None)
+            if not posting:
+                del self.postings[word]
+                i = bisect.bisect_left(self.vocabulary, word)
+                if i < len(self.vocabulary) and self.vocabulary[i] == word:
+                    del self.vocabulary[i]
+        i = bisect.bisect_left(self.newest, doc.newest_key)
+        if i < len(self.newest) and self.newest[i] == doc.newest_key:
+            del self.newest[i]
+        self.facets.remove(doc)
+        self.suggest.remove_doc(doc)
+
+    def set_company(self, employer_id: int, company_name: Optional[str]) -> None:
+        for doc in self.docs.values():
+            if doc.employer_id == employer_id and doc.company_name != company_name:
+                self.suggest.remove_doc(doc)
+                doc.company_name = company_name
+                self.suggest.add_doc(doc)
+
+    def _expand(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+        return self.vocabulary[start:end]
+
+    def _term_matches(self, term: SearchTerm) -> dict[int, list[int]]:
+        """
+        job_id -> positions where the term matches (first word of a phrase).
+        """
+        if term.prefix:
+            matches: dict[int, list[int]] = {}
+            for word in self._expand(term.words[0][1]):
+                for job_id, positions in self.postings[word].items():
+                    matches.setdefault(job_id, []).extend(positions)
+            return matches
+
+        postings = [self.postings.get(word) for _, word in term.words]
+        if any(p is None for p in postings):
+            return {}
+        if not term.is_phrase:
+            return dict(postings[0])
+
+        # Walk the rarest word's posting, then check the others at their offsets.
+        smallest = min(postings, key=len)
+        matches = {}
+        for job_id in smallest:
+            if not all(job_id in p for p in postings):
+                continue
+            following = [(offset, set(p[job_id])) for (offset, _), p in zip(term.words[1:], postings[1:])]
+            starts = [s for s in postings[0][job_id] if all(s + offset in pos for offset, pos in following)]
+            if starts:
+                matches[job_id] = starts
+        return matches
+
+    def search(self, terms: list[SearchTerm], search_filter: SearchFilter) -> list[tuple[int, float]]:
+        """
+        All matching job ids with their scores, best first (then newest, then highest job_id).
+        """
+        total = max(len(self.docs), 1)
+        scores: Optional[dict[int, float]] = None
+        for term in sorted(terms, key=lambda t: t.prefix):
+            matches = self._term_matches(term)
+            if scores is not None:
+                matches = {job_id: m for job_id, m in matches.items() if job_id in scores}
+            if not matches:
+                return []
+            idf = math.log(1 + total / len(matches))
+            term_scores = {
+                job_id: idf * sum(INDEXED_FIELDS[p // FIELD_SPAN][1] for p in positions)
+                for job_id, positions in matches.items()
+            }
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {job_id: scores[job_id] + score for job_id, score in term_scores.items()}
+
+        docs = self.docs
+        ranked = [(job_id, score) for job_id, score in (scores or {}).items() if search_filter.matches(docs[job_id])]
+        ranked.sort(key=lambda item: (-item[1], -docs[item[0]].created_key, -item[0]))
+        return ranked
+
+    def browse(
+        self, search_filter: SearchFilter, *, after: Optional[tuple[float, int]], count: int, budget: int
+    ) -> Optional[list[JobDoc]]:
+        """
+        Up to `count` matching docs newest first, strictly after the `after` key.
+        None when more than `budget` non-matching docs had to be skipped.
+        """
+        start = bisect.bisect_right(self.newest, after) if after is not None else 0
+        found: list[JobDoc] = []
+        skipped = 0
+        for _, negative_id in islice(self.newest, start, None):
+            doc = self.docs[-negative_id]
+            if search_filter.matches(doc):
+                found.append(doc)
+                if len(found) >= count:
+                    break
+            else:
+                skipped += 1
+                if skipped > budget:
+                    return None
+        return found
+
+
+class JobSearchIndex:
+    """
+    Process-wide owner of the InvertedIndex: startup build, incremental writes from
+    JobService, periodic reconciliation with the database.
+    """
+
+    def __init__(self, *, enabled: bool, reconcile_seconds: float, scan_budget: int):
+        self.enabled = enabled
+        self.reconcile_seconds = reconcile_seconds
+        self.scan_budget = scan_budget
+        self._index: Optional[InvertedIndex] = None
+        self._build_lock = asyncio.Lock()
+        self._building = False
+        # Writes that land while a build is running, replayed onto the new index
+        self._pending: list[tuple[str, object, Optional[str]]] = []
+        # Jobs written by this process while a reconcile pass runs; the pass leaves them alone.
+        self._touched: Optional[set[int]] = None
+        self._companies: dict[int, Optional[str]] = {}
+        self._location_names: dict[int, str] = {}
+        self.builds = 0
+        self.last_build_seconds = 0.0
+        self.reconciles = 0
+        self.reconcile_fixes = 0
+        self.searches = 0
+        self.search_seconds = 0.0
+        self.sql_fallbacks = 0
+        self.suggests = 0
+        self.suggest_seconds = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self._index is not None
+
+    # -------------------------
+    # JobService write hooks
+    # -------------------------
+    async def upsert(self, db: AsyncSession, job: JobListing) -> None:
+        if self._index is None and not self._building:
+            return
+        company_name = await self._company_name(db, job.employer_id)
+        if job.location_id is not None and job.location_id not in self._location_names:
+            self._location_names.update(await self._load_location_names(db, job.location_id))
+        if self._touched is not None:
+            self._touched.add(job.job_id)
+        if self._building:
+            self._pending.append(("upsert", job, company_name))
+        if self._index is not None:
+            self._apply(self._index, "upsert", job, company_name)
+
+    def remove(self, job_id: int) -> None:
+        if self._touched is not None:
+            self._touched.add(job_id)
+        if self._building:
+            self._pending.append(("remove", job_id, None))
+        if self._index is not None:
+            self._index.remove(job_id)
+
+    def set_company(self, employer_id: int, company_name: Optional[str]) -> None:
+        """
+        Employer profile write hook: show the new company name on that employer's jobs.
+        """
+        self._companies[employer_id] = company_name
+        job_generation.bump()
+        if self._index is not None:
+            self._index.set_company(employer_id, company_name)
+
+    async def _company_name(self, db: AsyncSession, employer_id: int) -> Optional[str]:
+        if employer_id not in self._companies:
+            stmt = select(EmployerProfile.company_name).where(EmployerProfile.user_id == employer_id)
+            self._companies[employer_id] = (await db.execute(stmt)).scalar()
+        return self._companies[employer_id]
+
+    def _apply(self, index: InvertedIndex, action: str, item, company_name: Optional[str]) -> None:
+        if action == "remove":
+            index.remove(item)
+        elif (item.status or "").upper() == "ACTIVE":
+            index.add(item, company_name, self._location_names.get(item.location_id))
+        else:
+            index.remove(item.job_id)
+
+    # -------------------------
+    # Build / reconcile
+    # -------------------------
+    @staticmethod
+    def _rows_stmt():
+        columns = {name for name in DOC_COLUMNS} | {name for name, _ in INDEXED_FIELDS}
+        return select(*(getattr(JobListing, name) for name in sorted(columns))).where(JobListing.status == "ACTIVE")
+
+    async def _load_companies(self, db: AsyncSession) -> dict[int, Optional[str]]:
+        rows = await db.execute(select(EmployerProfile.user_id, EmployerProfile.company_name))
+        return dict(rows.all())
+
+    @staticmethod
+    async def _load_location_names(db: AsyncSession, *location_ids: int) -> dict[int, str]:
+        stmt = select(Location.id, Location.name)
+        if location_ids:
+            stmt = stmt.where(Location.id.in_(location_ids))
+        return dict((await db.execute(stmt)).all())
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        async with self._build_lock:
+            self._building = True
+            self._pending = []
+            started = time.perf_counter()
+            try:
+                companies = await self._load_companies(db)
+                location_names = await self._load_location_names(db)
+                rows = (await db.execute(self._rows_stmt())).all()
+
+                def _build() -> InvertedIndex:
+                    index = InvertedIndex()
+                    for row in rows:
+                        index.add(row, companies.get(row.employer_id), location_names.get(row.location_id))
+                    return index
+
+                # Tokenizing a large catalog takes a while; keep it off the event loop.
+                index = await asyncio.to_thread(_build)
+                self._location_names = location_names
+                for action, item, company_name in self._pending:
+                    self._apply(index, action, item, company_name)
+                self._companies = companies
+                self._index = index
+                self.builds += 1
+                self.last_build_seconds = time.perf_counter() - started
+                logger.info("Built job search index: %s jobs in %.2fs", len(index), self.last_build_seconds)
+            finally:
+                self._building = False
+                self._pending = []
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """
+        Bring the index in line with the database: (job_id, updated_at) of every ACTIVE job is
+        compared with the index and only the differences are re-read. Returns the fixes made.
+        """
+        index = self._index
+        if index is None:
+            await self.rebuild(db)
+            return 0
+        self._touched = set()
+        try:
+            live = dict(
+                (await db.execute(select(JobListing.job_id, JobListing.updated_at).where(JobListing.status == "ACTIVE"))).all()
+            )
+            stale = [
+                job_id
+                for job_id, updated_at in live.items()
+                if job_id not in index.docs or index.docs[job_id].updated_at != updated_at
+            ]
+            gone = [job_id for job_id in index.docs if job_id not in live]
+
+            companies = await self._load_companies(db)
+            renamed = False
+            for employer_id, company_name in companies.items():
+                if self._companies.get(employer_id, company_name) != company_name:
+                    index.set_company(employer_id, company_name)
+                    renamed = True
+            self._companies = companies
+            self._location_names = await self._load_location_names(db)
+
+            rows = []
+            for i in range(0, len(stale), 500):
+                chunk = stale[i : i + 500]
+                rows.extend((await db.execute(self._rows_stmt().where(JobListing.job_id.in_(chunk)))).all())
+
+            # Anything this process wrote meanwhile is already newer than what was just read.
+            touched = self._touched
+            for job_id in gone:
+                if job_id not in touched:
+                    index.remove(job_id)
+            for row in rows:
+                if row.job_id not in touched:
+                    index.add(row, companies.get(row.employer_id), self._location_names.get(row.location_id))
+        finally:
+            self._touched = None
+
+        fixes = len(gone) + len(rows)
+        if fixes or renamed:
+            # Other workers' writes: cached result pages may show the old state.
+            job_generation.bump()
+        self.reconciles += 1
+        self.reconcile_fixes += fixes
+        if fixes:
+            logger.info("Reconciled job search index: %s jobs re-read, %s dropped", len(rows), len(gone))
+        return fixes
+
+    async def run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Background task (main.py lifespan): build now, then reconcile every reconcile_seconds.
+        """
+        if not self.enabled:
+            return
+        while True:
+            try:
+                # From the primary: a lagging replica would undo this worker's own
+                # recent upserts/removals (the pass only guards writes made during it).
+                async with session_factory() as db:
+                    await self.reconcile(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Search keeps working (from a stale index, or SQL when cold); retry next round.
+                logger.exception("Job search index maintenance failed")
+            await asyncio.sleep(self.reconcile_seconds)
+
+    # -------------------------
+    # Search
+    # -------------------------
+    def page(
+        self,
+        *,
+        terms: list[SearchTerm],
+        search_filter: SearchFilter,
+        sort: str,
+        after: Optional[dict],
+        size: int,
+        with_total: bool,
+        with_facets: bool = False,
+    ) -> Optional[JobPage]:
+        """
+        One page of search results from memory, or None when SQL should answer instead
+        (index cold or disabled, salary-ordered browse, over-budget filter scan).
+        Rows are (JobDoc, company_name, score).
+        """
+        index = self._index
+        # Filter-only salary ordering is an index range scan in SQL.
+        if index is None or (not terms and sort != "newest"):
+            self.sql_fallbacks += 1
+            return None
+
+        started = time.perf_counter()
+        page = JobPage(rows=[])
+        if terms:
+            ranked = index.search(terms, search_filter)
+            if with_total:
+                page.total_estimate = len(ranked)
+            order_key = self.order_key(sort)
+            if sort != "relevance":
+                ranked.sort(key=order_key)
+            if with_facets:
+                page.facets = self._facets(index, index.facets.of_jobs(job_id for job_id, _ in ranked), search_filter)
+            if after is not None:
+                ranked = ranked[bisect.bisect_right(ranked, self.cursor_key(sort, after), key=order_key) :]
+            found = [(index.docs[job_id], score) for job_id, score in ranked[: size + 1]]
+        else:
+            docs = index.browse(
+                search_filter,
+                after=self.cursor_key("newest", after) if after is not None else None,
+                count=size + 1,
+                budget=self.scan_budget,
+            )
+            if docs is None:
+                self.sql_fallbacks += 1
+                return None
+            if with_total or with_facets:
+                matching = index.facets.matching(search_filter, index.docs)
+                if with_total:
+                    page.total_estimate = matching.bit_count()
+                if with_facets:
+                    page.facets = self._facets(index, matching, search_filter)
+            found = [(doc, 0.0) for doc in docs]
+
+        page.rows = [(doc, doc.company_name, score) for doc, score in found[:size]]
+        if len(found) > size:
+            last, score = found[size - 1]
+            page.next_cursor = encode_cursor(
+                created_at=last.created_at,
+                job_id=last.job_id,
+                score=score if sort == "relevance" else None,
+                salary=last.salary_max if sort == "salary" else None,
+            )
+        self.searches += 1
+        self.search_seconds += time.perf_counter() - started
+        return page
+
+    def suggest(self, prefix: str, *, limit: int, kinds: Optional[Iterable[str]] = None) -> list[Suggestion]:
+        """
+        Typeahead suggestions (see suggest.py); empty until the index is ready.
+        """
+        if self._index is None:
+            return []
+        started = time.perf_counter()
+        suggestions = self._index.suggest.lookup(prefix, limit=limit, kinds=kinds)
+        self.suggests += 1
+        self.suggest_seconds += time.perf_counter() - started
+        return suggestions
+
+    def _facets(self, index: InvertedIndex, matching: int, search_filter: SearchFilter) -> dict:
+        period = search_filter.salary.period if search_filter.salary is not None else "year"
+        return index.facets.counts(matching, period=period).to_dict(self._location_names)
+
+    def order_key(self, sort: str) -> Callable[[tuple[int, float]], tuple]:
+        """
+        Ordering key of (job_id, score) search results for a sort mode (see pagination.SORTS).
+        """
+        docs = self._index.docs
+        if sort == "newest":
+            return lambda item: docs[item[0]].newest_key
+        if sort == "salary":
+            return lambda item: (-(docs[item[0]].salary_max or 0), -item[0])
+        return lambda item: (-item[1], -docs[item[0]].created_key, -item[0])
+
+    @staticmethod
+    def cursor_key(sort: str, cursor: dict) -> tuple:
+        """
+        order_key() of the row a cursor points at.
+        """
+        created_key = cursor["created_at"].timestamp()
+        if sort == "newest":
+            return -created_key, -cursor["job_id"]
+        if sort == "salary":
+            return -(cursor["salary"] or 0), -cursor["job_id"]
+        return -(cursor["score"] or 0.0), -created_key, -cursor["job_id"]
+
+    def stats(self) -> dict:
+        index = self._index
+        return {
+            "enabled": self.enabled,
+            "ready": index is not None,
+            "documents": len(index) if index is not None else 0,
+            "vocabulary": len(index.vocabulary) if index is not None else 0,
+            "builds": self.builds,
+            "lastBuildSeconds": round(self.last_build_seconds, 3),
+            "reconciles": self.reconciles,
+            "reconcileFixes": self.reconcile_fixes,
+            "searches": self.searches,
+            "avgSearchMs": round(1000 * self.search_seconds / self.searches, 3) if self.searches else 0.0,
+            "sqlFallbacks": self.sql_fallbacks,
+            "suggestions": len(index.suggest) if index is not None else 0,
+            "suggests": self.suggests,
+            "avgSuggestMs": round(1000 * self.suggest_seconds / self.suggests, 3) if self.suggests else 0.0,
+        }
+
+
+job_search_index = JobSearchIndex(
+    enabled=SEARCH_BACKEND not in {"sql", "postgres"},
+    reconcile_seconds=SEARCH_INDEX_RECONCILE_SECONDS,
+    scan_budget=SEARCH_INDEX_SCAN_BUDGET,
+)
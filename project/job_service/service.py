@@ -6,13 +6,103 @@ Service-layer abstraction for Job Listing operations.
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy import Select, delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    from project.database import replica_reads, use_replica
+    from project.singleflight import single_flight
+except ImportError:
+    from database import replica_reads, use_replica
+    from singleflight import single_flight
+
+from .facets import FacetCounts, location_names, sql_facet_counts
+from .fields import DETAIL_FIELDS, EMPLOYER_LIST_FIELDS, LIST_FIELDS, columns, needs_company
+from .locations import match_locations, resolve_location
 from .models import EmployerProfile, JobListing
+from .pagination import (
+    JOB_STREAM_BATCH_SIZE,
+    JobPage,
+    after_cursor,
+    after_ranked_cursor,
+    after_salary_cursor,
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+    page_size,
+)
+from .salary import SalaryFilter, salary_columns
+from .results_cache import job_generation, search_results
+from .search import SearchFilter, SearchTerm, job_search_index, parse_query, sql_match
+
+
+def _projected(fields: tuple[str, ...], *, always: tuple[str, ...] = ()) -> Select:
+    """
+    SELECT of the columns behind `fields`, joining employer_profiles only for companyName.
+    """
+    stmt = select(*columns(fields, always=always)).select_from(JobListing)
+    if needs_company(fields):
+        stmt = stmt.join(EmployerProfile, EmployerProfile.user_id == JobListing.employer_id, isouter=True)
+    return stmt
+
+
+async def _stream(db: AsyncSession, stmt: Select) -> AsyncIterator:
+    """
+    Rows of `stmt` from a server-side cursor, JOB_STREAM_BATCH_SIZE per round trip,
+    so memory stays flat however many rows match.
+    """
+    result = await db.stream(stmt.execution_options(yield_per=JOB_STREAM_BATCH_SIZE))
+    async for partition in result.partitions():
+        for row in partition:
+            yield row
+
+
+def _search_sort(terms: list[SearchTerm], sort: Optional[str], salary: Optional[SalaryFilter]):
+    """
+    (sort, salary) with defaults applied: relevance needs terms, salary order needs a period.
+    """
+    sort = sort or ("relevance" if terms else "newest")
+    if sort == "relevance" and not terms:
+        sort = "newest"
+    if sort == "salary" and salary is None:
+        salary = SalaryFilter()
+    return sort, salary
+
+
+def _search_conditions(db: AsyncSession, terms: list[SearchTerm], search_filter: SearchFilter):
+    """
+    (WHERE conditions, rank expression) of a SQL search over ACTIVE jobs.
+    """
+    conditions = [JobListing.status == "ACTIVE", *search_filter.clauses()]
+    rank = literal(0.0)
+    if terms:
+        match, rank = sql_match(db, terms)
+        conditions.append(match)
+    return conditions, rank
+
+
+def _search_order(sort: str, rank) -> tuple:
+    if sort == "relevance":
+        return rank.desc(), JobListing.created_at.desc(), JobListing.job_id.desc()
+    if sort == "salary":
+        return JobListing.salary_max.desc(), JobListing.job_id.desc()
+    return JobListing.created_at.desc(), JobListing.job_id.desc()
+
+
+def _company_name(row) -> Optional[str]:
+    return row.company_name if "company_name" in row._fields else None
+
+
+@dataclass(frozen=True)
+class SearchPlan:
+    terms: list[SearchTerm]
+    search_filter: SearchFilter
+    sort: str
 
 
 def _normalize_status(value: str) -> str:
@@ -44,48 +134,299 @@ class JobService:
             responsibilities=payload.responsibilities,
             job_type=payload.jobType,
             location=payload.location,
+            location_id=await resolve_location(db, payload.location),
             salary_range=payload.salaryRange,
+            **salary_columns(payload.salaryRange),
             status="ACTIVE",
         )
         db.add(job)
         await db.commit()
         await db.refresh(job)
+        job_generation.bump()
+        await job_search_index.upsert(db, job)
         return job
 
     @staticmethod
-    async def list_employer_jobs(*, db: AsyncSession, employer_id: int) -> list[JobListing]:
-        stmt: Select = select(JobListing).where(JobListing.employer_id == employer_id).order_by(JobListing.created_at.desc())
+    async def list_employer_jobs(*, db: AsyncSession, employer_id: int) -> list:
+        """
+        (job_id, job_title, status, created_at) rows, newest first.
+        """
+        stmt: Select = (
+            select(*columns(EMPLOYER_LIST_FIELDS))
+            .where(JobListing.employer_id == employer_id)
+            .order_by(JobListing.created_at.desc())
+        )
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
 
     @staticmethod
+    @single_flight("job.list_public_jobs")
+    @replica_reads
     async def list_public_jobs(
-        *, db: AsyncSession, status_filter: Optional[str] = None
-    ) -> list[tuple[JobListing, Optional[str]]]:
-        stmt = (
-            select(JobListing, EmployerProfile.company_name)
-            .select_from(JobListing)
-            .join(EmployerProfile, EmployerProfile.user_id == JobListing.employer_id, isouter=True)
-            .order_by(JobListing.created_at.desc())
-        )
+        *,
+        db: AsyncSession,
+        status_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        with_total: bool = False,
+        fields: tuple[str, ...] = LIST_FIELDS,
+    ) -> JobPage:
+        """
+        One keyset page of jobs, newest first (see pagination.py).
+
+        Only the columns of `fields` (see fields.py) are selected; rows are
+        (row, company_name), company_name being None unless requested.
+        """
+        size = page_size(limit)
+        after = decode_cursor(cursor)
+        stmt = _projected(fields, always=("jobId", "createdAt"))
         if status_filter:
             stmt = stmt.where(JobListing.status == _normalize_status(status_filter))
-        result = await db.execute(stmt)
-        return list(result.all())
+
+        page = JobPage(rows=[])
+        if with_total:
+            page.total_estimate = await estimate_count(db, stmt)
+        if after is not None:
+            stmt = stmt.where(after_cursor(db, after))
+        stmt = stmt.order_by(JobListing.created_at.desc(), JobListing.job_id.desc()).limit(size + 1)
+
+        rows = list((await db.execute(stmt)).all())
+        page.rows = [(row, _company_name(row)) for row in rows[:size]]
+        if len(rows) > size:
+            last = page.rows[-1][0]
+            page.next_cursor = encode_cursor(created_at=last.created_at, job_id=last.job_id)
+        return page
 
     @staticmethod
-    async def get_job(*, db: AsyncSession, job_id: int) -> tuple[JobListing, Optional[str]]:
-        stmt = (
-            select(JobListing, EmployerProfile.company_name)
-            .select_from(JobListing)
-            .join(EmployerProfile, EmployerProfile.user_id == JobListing.employer_id, isouter=True)
-            .where(JobListing.job_id == job_id)
-        )
+    async def stream_public_jobs(
+        *,
+        db: AsyncSession,
+        status_value: Optional[str] = None,
+        fields: tuple[str, ...] = LIST_FIELDS,
+    ) -> AsyncIterator:
+        """
+        Every job of list_public_jobs (all pages, same order) as projected rows, from a server-side cursor.
+
+        Streams send their status line before the first row, so nothing in here may
+        reject input: `status_value` is already normalized (normalize_status).
+        """
+        stmt = _projected(fields)
+        if status_value:
+            stmt = stmt.where(JobListing.status == status_value)
+        stmt = stmt.order_by(JobListing.created_at.desc(), JobListing.job_id.desc())
+        with use_replica(db):
+            async for row in _stream(db, stmt):
+                yield row
+
+    @staticmethod
+    @replica_reads
+    async def job_version(*, db: AsyncSession, job_id: int, with_company: bool = True) -> tuple[datetime, ...]:
+        """
+        updated_at of a job (and of its employer profile, which supplies companyName):
+        a primary-key lookup that validates a cached get_job response without loading it.
+        """
+        stmt = select(JobListing.updated_at).where(JobListing.job_id == job_id)
+        if with_company:
+            stmt = stmt.add_columns(EmployerProfile.updated_at).join_from(
+                JobListing, EmployerProfile, EmployerProfile.user_id == JobListing.employer_id, isouter=True
+            )
+        row = (await db.execute(stmt)).one_or_none()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+        return tuple(row)
+
+    @staticmethod
+    @single_flight("job.get_job")
+    @replica_reads
+    async def get_job(*, db: AsyncSession, job_id: int, fields: tuple[str, ...] = DETAIL_FIELDS) -> tuple:
+        """
+        (row, company_name) of one job, selecting only the columns of `fields`.
+        """
+        stmt = _projected(fields).where(JobListing.job_id == job_id)
         result = await db.execute(stmt)
         row = result.one_or_none()
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
-        return row[0], row[1]
+        return row, _company_name(row)
+
+    @staticmethod
+    @replica_reads
+    async def search_jobs(
+        *,
+        db: AsyncSession,
+        q: Optional[str],
+        location: Optional[str] = None,
+        job_type: Optional[str] = None,
+        salary: Optional[SalaryFilter] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        with_total: bool = False,
+        with_facets: bool = False,
+    ) -> JobPage:
+        """
+        One keyset page of ACTIVE jobs matching `q` (see search.py for the syntax).
+        Rows are (job, company_name, score); `job` is a JobListing, or a search.JobDoc
+        when the in-memory index answered.
+
+        sort: "relevance" (default with a query), "newest" (default without one) or
+        "salary" (highest salary_max first, within the salary filter's period).
+        with_facets adds job type / location / salary bucket counts of all matches (facets.py).
+        """
+        size = page_size(limit)
+        after = decode_cursor(cursor)
+        terms = parse_query(q)
+        sort, salary = _search_sort(terms, sort, salary)
+
+        # Generation first: a write landing mid-search leaves this page under the old key.
+        key = (
+            job_generation.value,
+            tuple(terms),
+            " ".join((location or "").lower().split()),
+            job_type,
+            salary,
+            sort,
+            size,
+            cursor or "",
+            with_total,
+            with_facets,
+        )
+        page = search_results.get(key)
+        if page is None:
+            page = await JobService._search_page(
+                db=db,
+                terms=terms,
+                location=location,
+                job_type=job_type,
+                salary=salary,
+                sort=sort,
+                size=size,
+                after=after,
+                with_total=with_total,
+                with_facets=with_facets,
+            )
+            search_results.set(key, page)
+        return page
+
+    @staticmethod
+    async def _search_page(
+        *,
+        db: AsyncSession,
+        terms: list[SearchTerm],
+        location: Optional[str],
+        job_type: Optional[str],
+        salary: Optional[SalaryFilter],
+        sort: str,
+        size: int,
+        after: Optional[dict],
+        with_total: bool,
+        with_facets: bool,
+    ) -> JobPage:
+        search_filter = await JobService._search_filter(db=db, location=location, job_type=job_type, salary=salary)
+        if search_filter is None:
+            return JobPage(
+                rows=[],
+                total_estimate=0 if with_total else None,
+                facets=FacetCounts(period=salary.period if salary else "year").to_dict({}) if with_facets else None,
+            )
+
+        page = job_search_index.page(
+            terms=terms,
+            search_filter=search_filter,
+            sort=sort,
+            after=after,
+            size=size,
+            with_total=with_total,
+            with_facets=with_facets,
+        )
+        if page is not None:
+            return page
+
+        conditions, rank = _search_conditions(db, terms, search_filter)
+        # The salary keyset column rides along with the list columns.
+        stmt = _projected(LIST_FIELDS).add_columns(JobListing.salary_max).where(*conditions)
+        page = JobPage(rows=[])
+        if with_total:
+            page.total_estimate = await estimate_count(db, stmt)
+        if with_facets:
+            counts = await sql_facet_counts(db, conditions, period=salary.period if salary else "year")
+            page.facets = counts.to_dict(await location_names(db, counts.location_ids()))
+        stmt = stmt.add_columns(rank.label("rank"))
+        if after is not None:
+            if sort == "relevance":
+                stmt = stmt.where(after_ranked_cursor(db, rank, after))
+            elif sort == "salary":
+                stmt = stmt.where(after_salary_cursor(after))
+            else:
+                stmt = stmt.where(after_cursor(db, after))
+        stmt = stmt.order_by(*_search_order(sort, rank))
+        rows = list((await db.execute(stmt.limit(size + 1))).all())
+        page.rows = [(row, row.company_name, float(row.rank)) for row in rows[:size]]
+
+        if len(rows) > size:
+            last, _, score = page.rows[-1]
+            page.next_cursor = encode_cursor(
+                created_at=last.created_at,
+                job_id=last.job_id,
+                score=score if sort == "relevance" else None,
+                salary=last.salary_max if sort == "salary" else None,
+            )
+        return page
+
+    @staticmethod
+    async def _search_filter(
+        *, db: AsyncSession, location: Optional[str], job_type: Optional[str], salary: Optional[SalaryFilter]
+    ) -> Optional[SearchFilter]:
+        """
+        The search filter, or None when `location` matches no known place (nothing can match).
+        """
+        location_ids: Optional[frozenset[int]] = None
+        if location and location.strip():
+            location_ids = frozenset(await match_locations(db, location))
+            if not location_ids:
+                return None
+        return SearchFilter(location_ids=location_ids, job_type=job_type, salary=salary)
+
+    @staticmethod
+    @replica_reads
+    async def plan_search(
+        *,
+        db: AsyncSession,
+        q: Optional[str],
+        location: Optional[str] = None,
+        job_type: Optional[str] = None,
+        salary: Optional[SalaryFilter] = None,
+        sort: Optional[str] = None,
+    ) -> Optional[SearchPlan]:
+        """
+        Parsed terms, resolved filter and sort of a search, for stream_search_jobs;
+        None when `location` matches no known place (nothing can match).
+        """
+        terms = parse_query(q)
+        sort, salary = _search_sort(terms, sort, salary)
+        search_filter = await JobService._search_filter(db=db, location=location, job_type=job_type, salary=salary)
+        if search_filter is None:
+            return None
+        return SearchPlan(terms=terms, search_filter=search_filter, sort=sort)
+
+    @staticmethod
+    async def stream_search_jobs(*, db: AsyncSession, plan: SearchPlan) -> AsyncIterator[tuple]:
+        """
+        Every match of a planned search (plan_search), in search_jobs order, as
+        (row, score), from a server-side cursor. Always answered by the database
+        (a consistent snapshot), so relevance scores are the SQL ones (0 on SQLite).
+        """
+        terms, search_filter, sort = plan.terms, plan.search_filter, plan.sort
+        with use_replica(db):
+            conditions, rank = _search_conditions(db, terms, search_filter)
+            stmt = (
+                _projected(LIST_FIELDS)
+                .add_columns(rank.label("rank"))
+                .where(*conditions)
+                .order_by(*_search_order(sort, rank))
+            )
+            async for row in _stream(db, stmt):
+                yield row, float(row.rank)
 
     @staticmethod
     async def require_owner(*, db: AsyncSession, job_id: int, employer_id: int) -> JobListing:
@@ -114,8 +455,10 @@ class JobService:
             data["job_type"] = payload.jobType
         if payload.location is not None:
             data["location"] = payload.location
+            data["location_id"] = await resolve_location(db, payload.location)
         if payload.salaryRange is not None:
             data["salary_range"] = payload.salaryRange
+            data.update(salary_columns(payload.salaryRange))
         if payload.status is not None:
             data["status"] = _normalize_status(payload.status)
 
@@ -123,6 +466,8 @@ class JobService:
             await db.execute(update(JobListing).where(JobListing.job_id == job_id).values(**data))
             await db.commit()
             await db.refresh(job)
+            job_generation.bump()
+            await job_search_index.upsert(db, job)
         return job
 
     @staticmethod
@@ -130,6 +475,8 @@ class JobService:
         await JobService.require_owner(db=db, job_id=job_id, employer_id=employer_id)
         await db.execute(delete(JobListing).where(JobListing.job_id == job_id))
         await db.commit()
+        job_generation.bump()
+        job_search_index.remove(job_id)
 
     @staticmethod
     async def count_employer_jobs(*, db: AsyncSession, employer_id: int) -> tuple[int, int]:
@@ -145,4 +492,8 @@ class JobService:
     def expose_status(db_value: str) -> str:
         return _expose_status(db_value)
 
+    @staticmethod
+    def normalize_status(value: str) -> str:
+        return _normalize_status(value)
+
 
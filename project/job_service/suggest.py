@@ -0,0 +1,137 @@
+"""
+job_service/suggest.py
+
+Typeahead suggestions for the job search box (GET /jobs/suggest?q=).
+
+Job titles, company names and canonical locations of ACTIVE jobs are kept
+in one sorted array of keys, one key per word a spelling can be typed from
+("senior data engineer", "data engineer", "engineer"), so "eng" finds
+"Senior Data Engineer" with a single binary search. Each suggestion is
+weighted by the number of jobs carrying it. The JobSearchIndex maintains it
+next to the job index, so a lookup never touches the database.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+from collections import Counter
+from itertools import islice
+from typing import Iterable, Optional
+
+from .locations import location_key
+
+KINDS = ("title", "company", "location")
+
+SUGGEST_DEFAULT_LIMIT = int(os.getenv("SUGGEST_DEFAULT_LIMIT", "8"))
+SUGGEST_MAX_LIMIT = 20
+# Keys examined per lookup; a one-letter prefix can match a large part of the array.
+SUGGEST_SCAN_LIMIT = int(os.getenv("SUGGEST_SCAN_LIMIT", "2000"))
+# Word starts indexed per spelling (long titles are rarely typed from their tenth word)
+_MAX_WORD_STARTS = 8
+
+
+class Suggestion:
+    __slots__ = ("kind", "ident", "text", "count", "spellings")
+
+    def __init__(self, kind: str, ident: str, text: str):
+        self.kind = kind
+        self.ident = ident
+        self.text = text
+        self.count = 0
+        self.spellings: Counter = Counter()  # normalized spelling -> jobs using it
+
+
+def _doc_entries(doc) -> list[tuple[str, str, str, set[str]]]:
+    """
+    (kind, ident, display text, spellings) of the suggestions a JobDoc contributes.
+    """
+    entries = []
+    title_key = location_key(doc.job_title)
+    if title_key:
+        entries.append(("title", title_key, doc.job_title.strip(), {title_key}))
+    company_key = location_key(doc.company_name)
+    if company_key:
+        entries.append(("company", company_key, doc.company_name.strip(), {company_key}))
+    place = doc.location_name or doc.location
+    place_key = location_key(place)
+    if place_key:
+        # Canonical locations group their spellings ("Bangalore" and "Bengaluru" are one entry).
+        ident = f"#{doc.location_id}" if doc.location_id is not None else place_key
+        spellings = {place_key, location_key(doc.location)} - {""}
+        entries.append(("location", ident, place.strip(), spellings))
+    return entries
+
+
+def _word_starts(spelling: str) -> list[str]:
+    words = spelling.split()
+    return [" ".join(words[i:]) for i in range(min(len(words), _MAX_WORD_STARTS))]
+
+
+class SuggestIndex:
+    """
+    Suggestions by (kind, ident), and the sorted (key, word_index, kind, ident) array.
+    """
+
+    __slots__ = ("entries", "keys")
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str], Suggestion] = {}
+        self.keys: list[tuple[str, int, str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_doc(self, doc) -> None:
+        for kind, ident, text, spellings in _doc_entries(doc):
+            entry = self.entries.get((kind, ident))
+            if entry is None:
+                entry = self.entries[(kind, ident)] = Suggestion(kind, ident, text)
+            entry.count += 1
+            for spelling in spellings:
+                entry.spellings[spelling] += 1
+                if entry.spellings[spelling] == 1:
+                    for i, key in enumerate(_word_starts(spelling)):
+                        bisect.insort(self.keys, (key, i, kind, ident))
+
+    def remove_doc(self, doc) -> None:
+        for kind, ident, _, spellings in _doc_entries(doc):
+            entry = self.entries.get((kind, ident))
+            if entry is None:
+                continue
+            entry.count -= 1
+            for spelling in spellings:
+                entry.spellings[spelling] -= 1
+                if entry.spellings[spelling] <= 0:
+                    del entry.spellings[spelling]
+                    for i, key in enumerate(_word_starts(spelling)):
+                        item = (key, i, kind, ident)
+                        j = bisect.bisect_left(self.keys, item)
+                        if j < len(self.keys) and self.keys[j] == item:
+                            del self.keys[j]
+            if entry.count <= 0:
+                del self.entries[(kind, ident)]
+
+    def lookup(self, prefix: str, *, limit: int, kinds: Optional[Iterable[str]] = None) -> list[Suggestion]:
+        """
+        Best suggestions for a typed prefix: matches from the first word before
+        mid-phrase ones, then by job count.
+        """
+        query = location_key(prefix)
+        if not query:
+            return []
+        wanted = set(kinds) if kinds else None
+        # Whether each suggestion matched from its first word
+        found: dict[tuple[str, str], bool] = {}
+        start = bisect.bisect_left(self.keys, (query,))
+        for key, word_index, kind, ident in islice(self.keys, start, start + SUGGEST_SCAN_LIMIT):
+            if not key.startswith(query):
+                break
+            if wanted is not None and kind not in wanted:
+                continue
+            found[(kind, ident)] = found.get((kind, ident), False) or word_index == 0
+        ranked = sorted(
+            found.items(),
+            key=lambda item: (not item[1], -self.entries[item[0]].count, self.entries[item[0]].text.lower()),
+        )
+        return [self.entries[ref] for ref, _ in ranked[:limit]]
@@ -1,64 +1,85 @@
+import asyncio
 from contextlib import asynccontextmanager
 import os
 import logging
 from dotenv import find_dotenv, load_dotenv
-from fastapi import FastAPI, Depends, Query
+from fastapi import FastAPI
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import ResponseValidationError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from typing import Optional
 
 load_dotenv(find_dotenv(usecwd=True))
 
 try: 
-    from database import engine, get_db
-    from models import Base, Job
+    from database import dispose_engines, engine, engine_stats, set_primary_pin
+    from migrations import ensure_schema
+    from password_pool import password_pool
+    from singleflight import single_flight_stats
+    from auth import principal_cache
+    from profile_service.security import principal_cache as profile_principal_cache
     from routes.auth_routes import router as auth_router
     from profile_service.routes.profile_routes import router as profile_router
     from profile_service.database import engine as profile_engine
-    from profile_service.models import Base as ProfileBase
-    from job_service.database import engine as job_engine
-    from job_service.models import Base as JobServiceBase
+    from job_service.database import AsyncSessionLocal as JobSessionLocal, engine as job_engine
+    from job_service.board_snapshot import board_snapshot
+    from job_service.search import job_search_index
+    from job_service import results_cache as job_results_cache
     from job_service.routes.job_api_routes import router as job_api_router
     from job_service.routes.job_ui_routes import router as job_ui_router
     from application_service.database import engine as application_engine
-    from application_service.models import Base as ApplicationBase
     from application_service.routes.application_routes import router as application_router
     from application_service.routes.application_ui_routes import router as application_ui_router
 except ImportError:
-    from project.database import engine, get_db
-    from project.models import Base, Job
+    from project.database import dispose_engines, engine, engine_stats, set_primary_pin
+    from project.migrations import ensure_schema
+    from project.password_pool import password_pool
+    from project.singleflight import single_flight_stats
+    from project.auth import principal_cache
+    from project.profile_service.security import principal_cache as profile_principal_cache
     from project.routes.auth_routes import router as auth_router
     from project.profile_service.routes.profile_routes import router as profile_router
     from project.profile_service.database import engine as profile_engine
-    from project.profile_service.models import Base as ProfileBase
-    from project.job_service.database import engine as job_engine
-    from project.job_service.models import Base as JobServiceBase
+    from project.job_service.database import AsyncSessionLocal as JobSessionLocal, engine as job_engine
+    from project.job_service.board_snapshot import board_snapshot
+    from project.job_service.search import job_search_index
+    from project.job_service import results_cache as job_results_cache
     from project.job_service.routes.job_api_routes import router as job_api_router
     from project.job_service.routes.job_ui_routes import router as job_ui_router
     from project.application_service.database import engine as application_engine
-    from project.application_service.models import Base as ApplicationBase
     from project.application_service.routes.application_routes import router as application_router
     from project.application_service.routes.application_ui_routes import router as application_ui_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    async with profile_engine.begin() as conn:
-        await conn.run_sync(ProfileBase.metadata.create_all)
-    async with job_engine.begin() as conn:
-        await conn.run_sync(JobServiceBase.metadata.create_all)
-    async with application_engine.begin() as conn:
-        await conn.run_sync(ApplicationBase.metadata.create_all)
+    # One version check per distinct engine (normally just one); DDL only runs when behind.
+    for schema_engine in {id(e): e for e in (engine, profile_engine, job_engine, application_engine)}.values():
+        await ensure_schema(schema_engine)
+    # Builds the job search index in the background (search uses SQL until it is ready), then reconciles it.
+    search_index_task = asyncio.create_task(job_search_index.run(JobSessionLocal))
+    board_snapshot.attach(JobSessionLocal)
     yield
+    board_snapshot.detach()
+    search_index_task.cancel()
+    try:
+        await search_index_task
+    except asyncio.CancelledError:
+        pass
+    password_pool.shutdown()
+    await dispose_engines()
 
 app = FastAPI(title="Job Listing Portal", lifespan=lifespan)
 
 logger = logging.getLogger("job_portal")
 
+@app.middleware("http")
+async def read_your_writes(request, call_next):
+    """
+    Pin clients that just wrote to the primary database (see database.READ_YOUR_WRITES_SECONDS).
+    """
+    response = await call_next(request)
+    set_primary_pin(request, response)
+    return response
+
 @app.exception_handler(ResponseValidationError)
 async def response_validation_exception_handler(request, exc: ResponseValidationError):
     """
@@ -102,28 +123,27 @@ app.include_router(job_api_router)
 app.include_router(application_router)
 app.include_router(application_ui_router)
 
-@app.get("/jobs/search", tags=["Job Search"])
-async def search_jobs(
-    keyword: Optional[str] = Query(None),
-    location: Optional[str] = Query(None),
-    min_salary: Optional[int] = Query(None),
-    db: AsyncSession = Depends(get_db)
-):
-    stmt = select(Job)
-    if keyword:
-        stmt = stmt.where(
-            or_(
-                Job.title.ilike(f"%{keyword}%"),
-                Job.description.ilike(f"%{keyword}%")
-            )
-        )
-    if location:
-        stmt = stmt.where(Job.location.ilike(f"%{location}%"))
-    if min_salary:
-        stmt = stmt.where(Job.salary >= min_salary)
+# Pool, cache and engine internals, unauthenticated: only enable where the
+# port is reachable by operators alone (or behind a proxy that guards it).
+INTERNAL_METRICS_ENABLED = os.getenv("INTERNAL_METRICS_ENABLED", "false").lower() == "true"
+
+async def internal_metrics():
+    """
+    Per-process counters for the in-memory performance helpers.
+    """
+    return {
+        "passwordPool": password_pool.stats(),
+        "principalCache": principal_cache.stats(),
+        "profilePrincipalCache": profile_principal_cache.stats(),
+        "dbEngines": engine_stats(),
+        "singleFlight": single_flight_stats(),
+        "jobSearchIndex": job_search_index.stats(),
+        "jobSearchCache": job_results_cache.stats(),
+        "jobBoardSnapshot": board_snapshot.stats(),
+    }
 
-    result = await db.execute(stmt)
-    return result.scalars().all()
+if INTERNAL_METRICS_ENABLED:
+    app.add_api_route("/internal/metrics", internal_metrics, methods=["GET"], include_in_schema=False)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,272 @@
+"""
+migrations.py
+
+Versioned schema bootstrap shared by every service.
+
+The auth, profile, job and application packages each declare their own
+DeclarativeBase, and several of them re-declare slim copies of shared tables
+(users, employer_profiles, job_listings) for joins. This module merges the
+authoritative table definitions into one MetaData and tracks the applied
+schema version in `schema_version`:
+
+- current version  -> one tiny SELECT, no DDL (the common worker start)
+- behind / fresh   -> take a lock, create missing tables, run the pending
+                      migrations in order, stamp the new version
+
+Migrations must be idempotent: a legacy database (created by the old
+per-service create_all) starts at version 0 and replays all of them.
+Run `python -m project.tools.migrate` to apply them ahead of a deploy.
+"""
+
+import logging
+import os
+from typing import Callable
+
+from sqlalchemy import Column, Connection, Integer, MetaData, Table, inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+try:
+    from project.models import Base as AuthBase
+    from project.profile_service.models import Base as ProfileBase
+    from project.job_service.models import Base as JobServiceBase
+    from project.application_service.models import Base as ApplicationBase
+    from project.job_service.locations import backfill_job_locations
+except ImportError:
+    from models import Base as AuthBase
+    from profile_service.models import Base as ProfileBase
+    from job_service.models import Base as JobServiceBase
+    from application_service.models import Base as ApplicationBase
+    from job_service.locations import backfill_job_locations
+
+
+logger = logging.getLogger("job_portal.migrations")
+
+# "auto": migrate on startup when behind (default); "check": refuse to start when
+# behind; "off": skip the check entirely (schema managed out of band).
+SCHEMA_BOOTSTRAP = os.getenv("SCHEMA_BOOTSTRAP", "auto").lower()
+
+# Arbitrary constant shared by all workers for pg_advisory_xact_lock.
+_ADVISORY_LOCK_KEY = 727_431_001
+
+
+# -------------------------
+# Merged metadata
+# -------------------------
+# table name -> the Base that owns its full definition
+_TABLE_OWNERS = {
+    "users": AuthBase,
+    "refresh_tokens": AuthBase,
+    "jobs": AuthBase,
+    "job_seeker_profiles": ProfileBase,
+    "employer_profiles": ProfileBase,
+    "job_listings": JobServiceBase,
+    "locations": JobServiceBase,
+    "location_aliases": JobServiceBase,
+    "job_applications": ApplicationBase,
+}
+
+metadata = MetaData()
+for _name, _base in _TABLE_OWNERS.items():
+    _base.metadata.tables[_name].to_metadata(metadata)
+
+schema_version_table = Table("schema_version", metadata, Column("version", Integer, nullable=False))
+
+
+# -------------------------
+# Migrations
+# -------------------------
+def _baseline(conn: Connection) -> None:
+    """
+    Version 1: the schema as the per-service create_all passes used to build it.
+    """
+    metadata.create_all(conn, checkfirst=True)
+
+
+def _create_indexes(*names: str) -> Callable[[Connection], None]:
+    """
+    CREATE INDEX for indexes declared in metadata; an unknown name is a bug, not a no-op.
+    """
+    declared = {index.name: index for table in metadata.sorted_tables for index in table.indexes}
+    unknown = sorted(set(names) - set(declared))
+    if unknown:
+        raise ValueError(f"Indexes not declared by any model: {', '.join(unknown)}")
+
+    def _apply(conn: Connection) -> None:
+        for name in names:
+            declared[name].create(conn, checkfirst=True)
+
+    return _apply
+
+
+def _add_columns(table_name: str, *names: str) -> Callable[[Connection], None]:
+    """
+    ALTER TABLE ... ADD COLUMN for columns of `table_name` the database lacks (as declared in metadata).
+    """
+
+    def _apply(conn: Connection) -> None:
+        existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+        compiler = conn.dialect.ddl_compiler(conn.dialect, None)
+        for name in names:
+            if name not in existing:
+                column = metadata.tables[table_name].c[name]
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {compiler.get_column_specification(column)}"))
+
+    return _apply
+
+
+def _job_search_vector(conn: Connection) -> None:
+    """
+    Version 3: generated tsvector + GIN index for job search (Postgres only;
+    SQLite deployments use the in-memory index in job_service/search.py).
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    conn.execute(
+        text(
+            """
+            ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english'::regconfig, coalesce(job_title, '')), 'A')
+                || setweight(to_tsvector('english'::regconfig, coalesce(qualifications, '')), 'B')
+                || setweight(to_tsvector('english'::regconfig, coalesce(responsibilities, '')), 'B')
+                || setweight(to_tsvector('english'::regconfig, coalesce(job_description, '')), 'C')
+            ) STORED
+            """
+        )
+    )
+    conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_job_listings_search_vector ON job_listings USING GIN (search_vector)")
+    )
+
+
+def _canonical_locations(conn: Connection) -> None:
+    """
+    Version 4: job_listings.location_id -> locations, trigram index on aliases, backfill.
+    """
+    _add_columns("job_listings", "location_id")(conn)
+    _create_indexes("ix_job_listings_location_status_created_at")(conn)
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_location_aliases_alias_trgm "
+                "ON location_aliases USING GIN (alias gin_trgm_ops)"
+            )
+        )
+    logger.info("Resolved canonical locations for %s job listings", backfill_job_locations(conn))
+
+
+def _keyset_browse_index(conn: Connection) -> None:
+    """
+    Version 5: the browse index gains job_id, the keyset tie-breaker (replaces the version 2 index).
+    """
+    conn.execute(text("DROP INDEX IF EXISTS ix_job_listings_status_created_at"))
+    _create_indexes("ix_job_listings_status_created_id")(conn)
+
+
+def _salary_bounds(conn: Connection) -> None:
+    """
+    Version 6: parsed salary columns + index. Existing rows are filled in by
+    `python -m project.tools.backfill_salaries` (batched, outside this transaction).
+    """
+    _add_columns("job_listings", "salary_min", "salary_max", "salary_currency", "salary_period")(conn)
+    _create_indexes("ix_job_listings_status_period_salary")(conn)
+
+
+def _bigint_salaries(conn: Connection) -> None:
+    """
+    Version 7: salary_min/salary_max become BIGINT (crore amounts overflow INTEGER).
+    SQLite's INTEGER is already 64-bit.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    conn.execute(
+        text(
+            "ALTER TABLE job_listings "
+            "ALTER COLUMN salary_min TYPE BIGINT, ALTER COLUMN salary_max TYPE BIGINT"
+        )
+    )
+
+
+# (version, description, sync function run inside the migration transaction)
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "baseline tables", _baseline),
+    (
+        2,
+        "composite indexes for browse, employer and applicant queries",
+        # Its ix_job_listings_status_created_at was replaced in version 5.
+        _create_indexes(
+            "ix_job_listings_employer_created_at",
+            "ix_job_applications_seeker_created_at",
+            "ix_job_applications_job_status",
+        ),
+    ),
+    (3, "full-text search vector on job_listings", _job_search_vector),
+    (4, "canonical locations for job listings", _canonical_locations),
+    (5, "keyset pagination index for the public job list", _keyset_browse_index),
+    (6, "parsed salary bounds on job_listings", _salary_bounds),
+    (7, "64-bit salary bounds", _bigint_salaries),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _read_version(conn: Connection) -> int:
+    if not inspect(conn).has_table("schema_version"):
+        return 0
+    return int(conn.execute(select(schema_version_table.c.version)).scalar() or 0)
+
+
+def _migrate(conn: Connection) -> int:
+    if conn.dialect.name == "postgresql":
+        # Serialise concurrent workers; the loser re-reads the version and finds nothing to do.
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+
+    current = _read_version(conn)
+    if current >= SCHEMA_VERSION:
+        return current
+
+    # Creating missing tables first keeps fresh databases and later
+    # (idempotent) migrations on the same code path.
+    metadata.create_all(conn, checkfirst=True)
+    for version, description, apply in MIGRATIONS:
+        if version > current:
+            logger.info("Applying schema migration %s: %s", version, description)
+            apply(conn)
+
+    conn.execute(schema_version_table.delete())
+    conn.execute(schema_version_table.insert().values(version=SCHEMA_VERSION))
+    return SCHEMA_VERSION
+
+
+async def current_version(engine: AsyncEngine) -> int:
+    try:
+        async with engine.connect() as conn:
+            return int((await conn.execute(select(schema_version_table.c.version))).scalar() or 0)
+    except DBAPIError:
+        # No schema_version table yet (fresh or legacy database)
+        return 0
+
+
+async def migrate(engine: AsyncEngine) -> int:
+    """
+    Bring the database to SCHEMA_VERSION. Returns the resulting version.
+    """
+    async with engine.begin() as conn:
+        return await conn.run_sync(_migrate)
+
+
+async def ensure_schema(engine: AsyncEngine) -> None:
+    """
+    Startup hook: skip DDL entirely when the schema is current (see SCHEMA_BOOTSTRAP).
+    """
+    if SCHEMA_BOOTSTRAP == "off":
+        return
+    if await current_version(engine) >= SCHEMA_VERSION:
+        return
+    if SCHEMA_BOOTSTRAP == "check":
+        raise RuntimeError(
+            f"Database schema is behind version {SCHEMA_VERSION}; run `python -m project.tools.migrate`."
+        )
+    await migrate(engine)
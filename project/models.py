@@ -24,6 +24,27 @@ class User(Base):
         server_default=func.now(),
     )
 
+class RefreshToken(Base):
+    """
+    Server-tracked refresh token. Only the SHA-256 of the token is stored.
+    Tokens rotate on every use; all rotations of one login share a family_id,
+    so reuse of a rotated token (or logout) can revoke the whole family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    family_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
 # --- YOUR TASK: JOB MODEL FOR SEARCH ---
 
 class Job(Base):
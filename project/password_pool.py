@@ -0,0 +1,117 @@
+"""
+password_pool.py
+
+Bounded thread pool for CPU-heavy password work (bcrypt hash/verify).
+
+bcrypt releases the GIL while it runs, so a small dedicated pool keeps the
+event loop free during login bursts. The pool admits at most
+`max_workers + max_queue` jobs; anything beyond that is rejected right away
+so callers can answer 503 instead of letting latency pile up for everyone.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PasswordPoolSaturated(Exception):
+    """Raised when the password pool has no free worker or queue slot."""
+
+
+class PasswordPool:
+    def __init__(self, *, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Slots are released from worker threads, so every counter is guarded by the lock.
+        self._admitted = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run `fn(*args)` on the pool. Raises PasswordPoolSaturated when full.
+        """
+        with self._lock:
+            if self._admitted >= self.capacity:
+                self._rejected += 1
+                raise PasswordPoolSaturated()
+            self._admitted += 1
+        enqueued_at = time.perf_counter()
+
+        def _job() -> T:
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                waited = started_at - enqueued_at
+                self._wait_total += waited
+                if waited > self._wait_max:
+                    self._wait_max = waited
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._run_total += time.perf_counter() - started_at
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password")
+        try:
+            future = self._executor.submit(_job)
+        except BaseException:
+            self._release()
+            raise
+        # The slot is held until the job itself is done (or cancelled before it
+        # started), not until this coroutine returns: a caller cancelled while its
+        # job runs must not let the pool admit more than `capacity` jobs.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            completed = self._completed
+            running = self._running
+            return {
+                "maxWorkers": self.max_workers,
+                "maxQueue": self.max_queue,
+                "running": running,
+                "queueDepth": max(self._admitted - running, 0),
+                "completed": completed,
+                "rejected": self._rejected,
+                "avgWaitMs": round(self._wait_total / completed * 1000, 3) if completed else 0.0,
+                "maxWaitMs": round(self._wait_max * 1000, 3),
+                "avgRunMs": round(self._run_total / completed * 1000, 3) if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        # The executor is recreated on the next run(), so a restarted app can reuse the pool.
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_POOL_MAX_QUEUE = int(os.getenv("PASSWORD_POOL_MAX_QUEUE", "32"))
+PASSWORD_POOL_RETRY_AFTER = int(os.getenv("PASSWORD_POOL_RETRY_AFTER", "1"))
+
+password_pool = PasswordPool(max_workers=PASSWORD_POOL_WORKERS, max_queue=PASSWORD_POOL_MAX_QUEUE)
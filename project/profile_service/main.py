@@ -21,17 +21,20 @@ load_dotenv()
 
 # Local imports
 from .database import engine
-from .models import Base
 from .routes.profile_routes import router as profile_router
 
+try:
+	from project.migrations import ensure_schema
+except ImportError:
+	from migrations import ensure_schema
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
 	"""
-	Create tables at startup. In production, prefer Alembic migrations.
+	Bring the shared schema up to date at startup (a no-op version check when current).
 	"""
-	async with engine.begin() as conn:
-		await conn.run_sync(Base.metadata.create_all)
+	await ensure_schema(engine)
 	yield
 
 
@@ -12,7 +12,7 @@ the same PostgreSQL database.
 """
 
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -29,6 +29,7 @@ class User(Base):
 
 	id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 	email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
+	is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 	# other fields are not needed for profile service context
 
 
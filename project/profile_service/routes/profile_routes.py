@@ -17,6 +17,13 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+	from project.job_service.search import job_search_index
+	from project.responses import Validators, json_response, model_response
+except ImportError:
+	from job_service.search import job_search_index
+	from responses import Validators, json_response, model_response
+
 from ..database import get_db
 from ..models import EmployerProfile, JobSeekerProfile
 from ..schemas import (
@@ -40,20 +47,36 @@ router = APIRouter()
 # Base URL for the Auth service login redirection
 AUTH_BASE_URL = os.getenv("AUTH_BASE_URL", "http://127.0.0.1:8000")
 
+async def _profile_validators(db: AsyncSession, model, kind: str, user_id: int) -> Validators:
+	"""
+	ETag/Last-Modified of a user's profile from (id, updated_at) only: a unique-index
+	lookup, so a dashboard re-poll answered with 304 never loads the profile row.
+	"""
+	result = await db.execute(select(model.id, model.updated_at).where(model.user_id == user_id))
+	version = result.one_or_none()
+	if not version:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found.")
+	return Validators(kind, version.id, version.updated_at, last_modified=version.updated_at)
+
+
 # -------------------------
 # API endpoints - Job Seeker
 # -------------------------
 @router.get("/profiles/jobseeker/me")
 async def get_my_job_seeker_profile(
+	request: Request,
 	user: Annotated[CurrentUser, Depends(require_role("job_seeker"))],
 	db: Annotated[AsyncSession, Depends(get_db)],
 ):
+	validators = await _profile_validators(db, JobSeekerProfile, "jobseeker", user.id)
+	if validators.matches(request):
+		return validators.not_modified()
 	result = await db.execute(select(JobSeekerProfile).where(JobSeekerProfile.user_id == user.id))
 	profile = result.scalar_one_or_none()
 	if not profile:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found.")
-	# Return plain dict to avoid response validation issues if ORM serialization isn't enabled.
-	return JobSeekerProfilePublic.model_validate(profile).model_dump()
+	# Validated once and encoded straight to bytes (no response_model pass, no jsonable_encoder).
+	return model_response(JobSeekerProfilePublic, profile, headers=validators.headers())
 
 
 @router.post("/profiles/jobseeker", status_code=status.HTTP_201_CREATED)
@@ -82,7 +105,7 @@ async def create_job_seeker_profile(
 		await db.rollback()
 		raise
 	await db.refresh(profile)
-	return JobSeekerProfilePublic.model_validate(profile).model_dump()
+	return model_response(JobSeekerProfilePublic, profile, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/profiles/jobseeker")
@@ -112,7 +135,7 @@ async def update_job_seeker_profile(
 
 	await db.commit()
 	await db.refresh(profile)
-	return JobSeekerProfilePublic.model_validate(profile).model_dump()
+	return model_response(JobSeekerProfilePublic, profile)
 
 
 @router.post("/profiles/jobseeker/resume")
@@ -146,7 +169,7 @@ async def upload_resume(
 	profile.resume_url = public_url
 
 	await db.commit()
-	return {"resume_url": public_url}
+	return json_response({"resume_url": public_url})
 
 
 # -------------------------
@@ -154,14 +177,18 @@ async def upload_resume(
 # -------------------------
 @router.get("/profiles/employer/me")
 async def get_my_employer_profile(
+	request: Request,
 	user: Annotated[CurrentUser, Depends(require_role("employer"))],
 	db: Annotated[AsyncSession, Depends(get_db)],
 ):
+	validators = await _profile_validators(db, EmployerProfile, "employer", user.id)
+	if validators.matches(request):
+		return validators.not_modified()
 	result = await db.execute(select(EmployerProfile).where(EmployerProfile.user_id == user.id))
 	profile = result.scalar_one_or_none()
 	if not profile:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found.")
-	return EmployerProfilePublic.model_validate(profile).model_dump()
+	return model_response(EmployerProfilePublic, profile, headers=validators.headers())
 
 
 @router.post("/profiles/employer", status_code=status.HTTP_201_CREATED)
@@ -189,7 +216,9 @@ async def create_employer_profile(
 		await db.rollback()
 		raise
 	await db.refresh(profile)
-	return EmployerProfilePublic.model_validate(profile).model_dump()
+	# Job search results and typeahead show the company name (other workers catch up on reconcile).
+	job_search_index.set_company(profile.user_id, profile.company_name)
+	return model_response(EmployerProfilePublic, profile, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/profiles/employer")
@@ -216,7 +245,9 @@ async def update_employer_profile(
 
 	await db.commit()
 	await db.refresh(profile)
-	return EmployerProfilePublic.model_validate(profile).model_dump()
+	# Job search results and typeahead show the company name (other workers catch up on reconcile).
+	job_search_index.set_company(profile.user_id, profile.company_name)
+	return model_response(EmployerProfilePublic, profile)
 
 
 # -------------------------
@@ -5,9 +5,13 @@ JWT verification and role-based dependencies for the Profile service.
 This mirrors the Auth service approach and expects the same SECRET_KEY
 and ALGORITHM configuration. Tokens are read from an HTTP-only cookie
 named 'access_token' or from the Authorization header (Bearer).
+Resolved users are cached per token (auth.new_principal_cache) to skip the
+users query on repeat calls.
 """
 
+import hashlib
 import os
+import time
 from datetime import datetime, timezone
 from typing import Annotated, Optional, Literal
 
@@ -16,6 +20,11 @@ from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+	from project.auth import new_principal_cache, revoked_access_tokens, token_user_id
+except ImportError:
+	from auth import new_principal_cache, revoked_access_tokens, token_user_id
+
 from .database import get_db
 from .models import User
 
@@ -38,10 +47,17 @@ def decode_access_token(token: str) -> dict:
 
 
 class CurrentUser:
-	def __init__(self, id: int, email: str, role: Role):
+	__slots__ = ("id", "email", "role", "is_active")
+
+	def __init__(self, id: int, email: str, role: Role, is_active: bool = True):
 		self.id = id
 		self.email = email
 		self.role = role
+		self.is_active = is_active
+
+
+# Kept in step with the Auth service's cache (logout, role and is_active changes)
+principal_cache = new_principal_cache()
 
 
 async def get_current_user(
@@ -50,7 +66,8 @@ async def get_current_user(
 	token_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
 ) -> CurrentUser:
 	"""
-	Read JWT from cookie or Authorization header. Resolve user id by email.
+	Read JWT from cookie or Authorization header. Resolve the user by the
+	`uid` claim (v2 tokens) or, for legacy tokens, by email.
 	"""
 	token = token_cookie
 	if not token:
@@ -61,18 +78,35 @@ async def get_current_user(
 	if not token:
 		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated.")
 
-	payload = decode_access_token(token)
-	email = payload.get("sub")
-	role = payload.get("role")
-	if not email or not role:
-		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload.")
-
-	result = await db.execute(select(User).where(User.email == str(email).lower()))
-	user = result.scalar_one_or_none()
-	if not user:
-		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found.")
-
-	return CurrentUser(id=user.id, email=user.email, role=role)  # type: ignore[arg-type]
+	cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+	# Logged out through /auth/logout (same digest as auth.revoke_access_token)
+	if revoked_access_tokens.get(cache_key):
+		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+	current = principal_cache.get(cache_key)
+	if current is None:
+		payload = decode_access_token(token)
+		user_id = token_user_id(payload)
+		email = payload.get("sub")
+		role = payload.get("role")
+		if (user_id is None and not email) or not role:
+			raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload.")
+
+		if user_id is not None:
+			stmt = select(User).where(User.id == user_id)
+		else:
+			# Legacy (v1) tokens only carry the email
+			stmt = select(User).where(User.email == str(email).lower())
+		result = await db.execute(stmt)
+		user = result.scalar_one_or_none()
+		if not user:
+			raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found.")
+
+		current = CurrentUser(id=user.id, email=user.email, role=role, is_active=user.is_active)  # type: ignore[arg-type]
+		principal_cache.set(cache_key, current, ttl=float(payload.get("exp", 0)) - time.time())
+
+	if not current.is_active:
+		raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user.")
+	return current
 
 
 def require_role(*allowed: Role):
@@ -6,9 +6,9 @@ Contains:
 - UI pages and UI routes (Jinja2 templates)
 """
 
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, BackgroundTasks, Cookie, Depends, HTTPException, Request, Response, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
@@ -19,33 +19,55 @@ from sqlalchemy.ext.asyncio import AsyncSession
 # `python main.py` from inside the `project` folder.
 try:  # Package-style imports
     from project.auth import (
+        COOKIE_NAME,
+        REFRESH_COOKIE_NAME,
         clear_auth_cookie,
         create_access_token,
         get_current_user,
         get_current_user_optional,
-        hash_password,
+        hash_password_async,
+        issue_refresh_token,
+        password_needs_rehash,
+        purge_expired_refresh_tokens,
+        rehash_password,
+        request_access_token,
         require_role,
+        revoke_access_token,
+        revoke_refresh_token,
+        rotate_refresh_token,
         set_auth_cookie,
-        verify_password,
+        set_refresh_cookie,
+        verify_password_async,
     )
     from project.database import get_db
     from project.models import User
-    from project.schemas import TokenResponse, UserCreate, UserLogin, UserPublic
+    from project.schemas import RefreshRequest, TokenResponse, UserCreate, UserLogin, UserPublic
     templates = Jinja2Templates(directory="project/templates")
 except ImportError:  # Script-style imports
     from auth import (
+        COOKIE_NAME,
+        REFRESH_COOKIE_NAME,
         clear_auth_cookie,
         create_access_token,
         get_current_user,
         get_current_user_optional,
-        hash_password,
+        hash_password_async,
+        issue_refresh_token,
+        password_needs_rehash,
+        purge_expired_refresh_tokens,
+        rehash_password,
+        request_access_token,
         require_role,
+        revoke_access_token,
+        revoke_refresh_token,
+        rotate_refresh_token,
         set_auth_cookie,
-        verify_password,
+        set_refresh_cookie,
+        verify_password_async,
     )
     from database import get_db
     from models import User
-    from schemas import TokenResponse, UserCreate, UserLogin, UserPublic
+    from schemas import RefreshRequest, TokenResponse, UserCreate, UserLogin, UserPublic
     templates = Jinja2Templates(directory="templates")
 
 router = APIRouter()
@@ -61,7 +83,7 @@ async def register_user(payload: UserCreate, db: Annotated[AsyncSession, Depends
     """
     user = User(
         email=str(payload.email).lower(),
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
         role=payload.role,
         is_active=True,
     )
@@ -82,23 +104,68 @@ async def login_user(
     payload: UserLogin,
     db: Annotated[AsyncSession, Depends(get_db)],
     response: Response,
+    background_tasks: BackgroundTasks,
 ):
     """
-    Verify credentials and issue a JWT.
+    Verify credentials and issue a short-lived JWT plus a refresh token.
 
-    The JWT is also set in an HTTP-only cookie for the UI.
+    Both are set in HTTP-only cookies for the UI; the refresh token is in the
+    JSON body only when the client sets `include_refresh_token`. Hashes made with a
+    different bcrypt cost than configured are re-hashed after the response.
     """
     result = await db.execute(select(User).where(User.email == str(payload.email).lower()))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(payload.password, user.hashed_password):
+    if not user or not await verify_password_async(payload.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password.")
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user.")
 
-    token = create_access_token(subject=user.email, role=user.role)
+    if password_needs_rehash(user.hashed_password):
+        background_tasks.add_task(
+            rehash_password,
+            user_id=user.id,
+            plain_password=payload.password,
+            old_hash=user.hashed_password,
+        )
+
+    token = create_access_token(subject=user.email, role=user.role, user_id=user.id)
+    await purge_expired_refresh_tokens(db, user_id=user.id)
+    refresh_token = issue_refresh_token(db, user_id=user.id)
+    await db.commit()
+
     set_auth_cookie(response, token)
-    return {"access_token": token, "token_type": "bearer"}
+    set_refresh_cookie(response, refresh_token)
+    return TokenResponse(
+        access_token=token, refresh_token=refresh_token if payload.include_refresh_token else None
+    ).model_dump()
+
+
+@router.post("/auth/refresh")
+async def refresh_session(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    response: Response,
+    payload: Optional[RefreshRequest] = None,
+    refresh_cookie: Annotated[Optional[str], Cookie(alias=REFRESH_COOKIE_NAME)] = None,
+):
+    """
+    Exchange a refresh token (cookie or JSON body) for a new access token.
+    The rotated refresh token is returned in the body only if it came in the body.
+
+    No password check: the refresh token is rotated, and replaying an old one
+    revokes the whole session.
+    """
+    from_body = payload.refresh_token if payload else None
+    presented = from_body or refresh_cookie
+    if not presented:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated.")
+
+    user, refresh_token = await rotate_refresh_token(db, presented)
+    token = create_access_token(subject=user.email, role=user.role, user_id=user.id)
+    set_auth_cookie(response, token)
+    set_refresh_cookie(response, refresh_token)
+    # A client that sent the token in the body gets its successor there; cookie clients don't.
+    return TokenResponse(access_token=token, refresh_token=refresh_token if from_body else None).model_dump()
 
 
 @router.get("/auth/me")
@@ -109,12 +176,37 @@ async def me(user: Annotated[User, Depends(get_current_user)]):
     return UserPublic.model_validate(user).model_dump()
 
 
+async def _revoke_session(
+    db: AsyncSession,
+    *,
+    access_token: Optional[str],
+    refresh_token: Optional[str],
+) -> None:
+    if refresh_token:
+        await revoke_refresh_token(db, refresh_token)
+    if access_token:
+        revoke_access_token(access_token)
+
+
 @router.post("/auth/logout")
-async def api_logout(response: Response):
+async def api_logout(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    response: Response,
+    payload: Optional[RefreshRequest] = None,
+    access_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
+    refresh_cookie: Annotated[Optional[str], Cookie(alias=REFRESH_COOKIE_NAME)] = None,
+):
     """
-    Stateless JWT logout (server can't revoke without a blacklist).
-    For UI usage we clear the auth cookie, effectively logging out the browser session.
+    Revoke the refresh token's session server-side, drop the access token
+    (cookie or Bearer header; only if it verifies) in this process, and clear
+    both cookies.
     """
+    await _revoke_session(
+        db,
+        access_token=request_access_token(request, access_cookie),
+        refresh_token=(payload.refresh_token if payload else None) or refresh_cookie,
+    )
     clear_auth_cookie(response)
     return {"detail": "Logged out."}
 
@@ -189,10 +281,15 @@ async def employer_dashboard(
 
 
 @router.get("/logout")
-async def logout():
+async def logout(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    access_cookie: Annotated[Optional[str], Cookie(alias=COOKIE_NAME)] = None,
+    refresh_cookie: Annotated[Optional[str], Cookie(alias=REFRESH_COOKIE_NAME)] = None,
+):
     """
-    UI logout: clear cookie then redirect to login.
+    UI logout: revoke the session, clear cookies, then redirect to login.
     """
+    await _revoke_session(db, access_token=access_cookie, refresh_token=refresh_cookie)
     response = RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
     clear_auth_cookie(response)
     return response
@@ -5,7 +5,7 @@ Pydantic models used by the authentication APIs.
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
@@ -22,6 +22,9 @@ class UserCreate(BaseModel):
 class UserLogin(BaseModel):
     email: EmailStr
     password: str = Field(min_length=1, max_length=128)
+    # API clients without a cookie jar ask for the refresh token in the body;
+    # browsers only get it as an HTTP-only cookie, out of reach of page scripts.
+    include_refresh_token: bool = False
 
 
 class UserPublic(BaseModel):
@@ -37,5 +40,12 @@ class UserPublic(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    # Only for clients that asked for it (see UserLogin / RefreshRequest)
+    refresh_token: Optional[str] = None
+
+
+class RefreshRequest(BaseModel):
+    # API clients send the refresh token here; browsers rely on the cookie.
+    refresh_token: Optional[str] = Field(default=None, max_length=128)
 
 
@@ -0,0 +1,105 @@
+"""
+singleflight.py
+
+Request coalescing for hot read paths: while a call for some key is in
+flight, identical calls wait for it and share its result (or exception)
+instead of running the same query again.
+
+    @staticmethod
+    @single_flight("job.get_job")
+    @replica_reads
+    async def get_job(*, db, job_id): ...
+
+Calls are identical when every keyword argument except `db` is equal and
+they agree on whether the session is pinned to the primary (so a client
+that just wrote never gets a replica read started by someone else).
+Followers get the leader's result objects as-is, so only wrap read-only
+methods whose callers do not mutate what they get back.
+
+Event-loop only, like cache.py.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled (client went away), not us: run it ourselves.
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the exception retrieved even when nobody else was waiting.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def stats(self) -> dict:
+        calls = self.leaders + self.coalesced
+        return {
+            "name": self.name,
+            "inFlight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalescedRatio": round(self.coalesced / calls, 4) if calls else 0.0,
+        }
+
+
+_flights: list[SingleFlight] = []
+
+
+def single_flight(name: str):
+    """
+    Coalesce concurrent identical calls of an async service method (called with `db=`).
+    """
+
+    def decorator(fn):
+        flight = SingleFlight(name)
+        _flights.append(flight)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            db = kwargs["db"]
+            key = (
+                bool(db.info.get("pin_primary")),
+                args,
+                tuple(sorted((arg, value) for arg, value in kwargs.items() if arg != "db")),
+            )
+            return await flight.do(key, lambda: fn(*args, **kwargs))
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
+
+
+def single_flight_stats() -> list[dict]:
+    return [flight.stats() for flight in _flights]
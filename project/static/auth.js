@@ -4,18 +4,45 @@
  */
 
 const Auth = {
+  _refreshing: null,
+
+  /**
+   * Renew the short-lived access cookie using the refresh cookie.
+   * Concurrent callers share one request so the refresh token is rotated once.
+   */
+  async refresh() {
+    if (!this._refreshing) {
+      this._refreshing = fetch('/auth/refresh', {
+        method: 'POST',
+        credentials: 'same-origin',
+      })
+        .then((response) => response.ok)
+        .catch(() => false)
+        .finally(() => {
+          this._refreshing = null;
+        });
+    }
+    return this._refreshing;
+  },
+
   /**
    * Get current user from API
    */
   async getCurrentUser() {
     try {
-      const response = await fetch('/auth/me', {
-        method: 'GET',
-        credentials: 'same-origin',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-      });
+      const request = () =>
+        fetch('/auth/me', {
+          method: 'GET',
+          credentials: 'same-origin',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+        });
+
+      let response = await request();
+      if (response.status === 401 && (await this.refresh())) {
+        response = await request();
+      }
 
       if (!response.ok) {
         if (response.status === 401) {
@@ -75,7 +102,10 @@ const Auth = {
       },
     };
 
-    const response = await fetch(url, { ...defaultOptions, ...options });
+    let response = await fetch(url, { ...defaultOptions, ...options });
+    if (response.status === 401 && (await this.refresh())) {
+      response = await fetch(url, { ...defaultOptions, ...options });
+    }
 
     if (response.status === 401) {
       window.location.href = '/login';
@@ -167,6 +197,11 @@ async function loginFlow() {
   const passwordEl = document.getElementById('loginPassword');
   const errEl = document.getElementById('loginError');
 
+  // A valid refresh cookie means the session only lapsed: skip the password prompt.
+  Auth.refresh().then((ok) => {
+    if (ok) window.location.href = '/dashboard';
+  });
+
   form.addEventListener('submit', async (e) => {
     e.preventDefault();
     hide(errEl);
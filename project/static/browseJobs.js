@@ -40,27 +40,11 @@ const BrowseJobs = {
     `;
   },
 
-  async loadJobs() {
-    const alerts = document.getElementById('browseJobsAlerts');
-    if (alerts) alerts.innerHTML = '';
-
-    this.setLoading();
-
-    try {
-      const res = await Auth.apiCall('/jobs?status=ACTIVE', { method: 'GET' });
-      const jobs = await res.json();
-
-      const tbody = document.getElementById('browseJobsTable');
-      if (!tbody) return;
-
-      if (!jobs || jobs.length === 0) {
-        this.setEmpty();
-        return;
-      }
+  // Cursor for the next page of /jobs (null once the last page is loaded)
+  nextCursor: null,
 
-      tbody.innerHTML = jobs
-        .map(
-          (job) => `
+  renderRow(job) {
+    return `
         <tr>
           <td><strong>${job.jobTitle}</strong></td>
           <td>${job.companyName || ''}</td>
@@ -72,14 +56,56 @@ const BrowseJobs = {
             <button class="btn btn-sm btn-primary" onclick="BrowseJobs.apply(${job.jobId})">Apply</button>
           </td>
         </tr>
-      `
-        )
-        .join('');
+      `;
+  },
+
+  updateMoreButton() {
+    const more = document.getElementById('browseJobsMore');
+    if (!more) return;
+    more.hidden = !this.nextCursor;
+    more.disabled = false;
+    more.onclick = () => this.loadJobs({ append: true });
+  },
+
+  async loadJobs({ append = false } = {}) {
+    const alerts = document.getElementById('browseJobsAlerts');
+    if (alerts) alerts.innerHTML = '';
+
+    if (!append) {
+      this.nextCursor = null;
+      this.setLoading();
+    }
+
+    const more = document.getElementById('browseJobsMore');
+    if (more) more.disabled = true;
+
+    try {
+      const params = new URLSearchParams({ status: 'ACTIVE' });
+      if (append && this.nextCursor) params.set('cursor', this.nextCursor);
+      const res = await Auth.apiCall(`/jobs?${params}`, { method: 'GET' });
+      const page = await res.json();
+      const jobs = page.items || [];
+      this.nextCursor = page.nextCursor || null;
+
+      const tbody = document.getElementById('browseJobsTable');
+      if (!tbody) return;
+
+      if (!append && jobs.length === 0) {
+        this.setEmpty();
+      } else {
+        const html = jobs.map((job) => this.renderRow(job)).join('');
+        if (append) {
+          tbody.insertAdjacentHTML('beforeend', html);
+        } else {
+          tbody.innerHTML = html;
+        }
+      }
     } catch (error) {
       console.error('Error loading jobs:', error);
       DashboardBase.showError(error.message || 'Failed to load jobs', alerts);
-      this.setEmpty();
+      if (!append) this.setEmpty();
     }
+    this.updateMoreButton();
   },
 
   async apply(jobId) {
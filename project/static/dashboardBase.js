@@ -8,10 +8,11 @@ const DashboardBase = {
 
   /**
    * Initialize dashboard
+   * @param {Object|null} user - current user when the page already has it (skips /auth/me)
    */
-  async init() {
+  async init(user = null) {
     // Load current user
-    this.currentUser = await Auth.getCurrentUser();
+    this.currentUser = user || (await Auth.getCurrentUser());
     
     if (!this.currentUser) {
       window.location.href = '/login';
@@ -5,34 +5,48 @@
 
 const EmployerDashboard = {
   jobs: [],
-  jobCounts: {},
   /**
    * Initialize employer dashboard
    */
   async init() {
-    // Initialize base dashboard first
-    await DashboardBase.init();
+    this.showLoading();
 
-    // Load dashboard data
-    await this.loadDashboardData();
+    // One request for the user, jobs (with application counts), recent applications and KPIs
+    const data = await this.fetchDashboardData();
+
+    // Initialize base dashboard with the user we already have
+    await DashboardBase.init(data ? data.user : null);
+    if (!DashboardBase.currentUser) return;
+
+    this.render(data);
   },
 
   /**
-   * Load dashboard data
+   * Reload dashboard data (after closing or deleting a job)
    */
   async loadDashboardData() {
-    await this.loadJobListings();
-    await this.loadRecentApplications();
+    this.render(await this.fetchDashboardData());
   },
 
   /**
-   * Load job listings (placeholder)
+   * Fetch everything the dashboard shows; null on failure
    */
-  async loadJobListings() {
-    const jobsContainer = document.getElementById('jobListingsTable');
-    if (!jobsContainer) return;
-
+  async fetchDashboardData() {
     try {
+      const res = await Auth.apiCall('/dashboard/employer/data?recentLimit=5', { method: 'GET' });
+      return await res.json();
+    } catch (error) {
+      console.error('Error loading dashboard data:', error);
+      return null;
+    }
+  },
+
+  /**
+   * Show loading rows in both tables
+   */
+  showLoading() {
+    const jobsContainer = document.getElementById('jobListingsTable');
+    if (jobsContainer) {
       jobsContainer.innerHTML = `
         <tr>
           <td colspan="5" class="empty-state-cell">
@@ -43,164 +57,147 @@ const EmployerDashboard = {
           </td>
         </tr>
       `;
-      const user = DashboardBase.currentUser || (await Auth.getCurrentUser());
-      if (!user) return;
-
-      const res = await Auth.apiCall(`/jobs?employerId=${user.id}`, { method: 'GET' });
-      const jobs = await res.json();
-      this.jobs = Array.isArray(jobs) ? jobs : [];
-
-      // Per-job application counts for this employer
-      try {
-        const countsRes = await Auth.apiCall('/applications/employer/job-counts', { method: 'GET' });
-        this.jobCounts = (await countsRes.json()) || {};
-      } catch (e) {
-        this.jobCounts = {};
-      }
-
-      if (this.jobs.length === 0) {
-        jobsContainer.innerHTML = `
-          <tr>
-            <td colspan="5" class="empty-state-cell">
-              <div class="empty-state">
-                <div class="empty-state-icon">💼</div>
-                <div class="empty-state-title">No job listings yet</div>
-                <div class="empty-state-text">Create your first job posting to get started!</div>
-              </div>
-            </td>
-          </tr>
-        `;
-        this.updateKPIs();
-        return;
-      }
+    }
 
-      // Render jobs table
-      jobsContainer.innerHTML = this.jobs
-        .map(
-          (job) => `
+    const applicationsContainer = document.getElementById('recentApplicationsTable');
+    if (applicationsContainer) {
+      applicationsContainer.innerHTML = `
         <tr>
-          <td><strong>${job.jobTitle}</strong></td>
-          <td>${(this.jobCounts && this.jobCounts[String(job.jobId)]) ? this.jobCounts[String(job.jobId)] : (job.applicationsCount ?? 0)}</td>
-          <td>${this.getStatusBadge(job.status)}</td>
-          <td>${DashboardBase.formatDate(job.createdAt)}</td>
-          <td>
-            <div class="action-buttons">
-              <button class="btn btn-sm btn-secondary" onclick="EmployerDashboard.editJob(${job.jobId})">
-                Edit
-              </button>
-              <button class="btn btn-sm btn-secondary" onclick="EmployerDashboard.closeJob(${job.jobId})">
-                Close Job
-              </button>
-              <button class="btn btn-sm btn-danger" onclick="EmployerDashboard.deleteJob(${job.jobId})">
-                Delete
-              </button>
+          <td colspan="5" class="empty-state-cell">
+            <div class="empty-state">
+              <div class="empty-state-icon">📄</div>
+              <div class="empty-state-title">Loading applications…</div>
             </div>
           </td>
         </tr>
-      `
-        )
-        .join('');
+      `;
+    }
+  },
 
-      this.updateKPIs();
-    } catch (error) {
-      console.error('Error loading job listings:', error);
-      DashboardBase.showError('Failed to load job listings', jobsContainer);
+  /**
+   * Render dashboard data (or errors when it could not be loaded)
+   */
+  render(data) {
+    if (!data) {
+      const jobsContainer = document.getElementById('jobListingsTable');
+      if (jobsContainer) DashboardBase.showError('Failed to load job listings', jobsContainer);
+      const applicationsContainer = document.getElementById('recentApplicationsTable');
+      if (applicationsContainer) DashboardBase.showError('Failed to load applications', applicationsContainer);
+      return;
     }
+
+    this.jobs = Array.isArray(data.jobs) ? data.jobs : [];
+    this.renderJobListings(this.jobs);
+    this.renderRecentApplications(Array.isArray(data.recentApplications) ? data.recentApplications : []);
+    this.updateKPIs(data.summary || {});
   },
 
   /**
-   * Load recent applications (placeholder)
+   * Render job listings
    */
-  async loadRecentApplications() {
-    const applicationsContainer = document.getElementById('recentApplicationsTable');
-    if (!applicationsContainer) return;
+  renderJobListings(jobs) {
+    const jobsContainer = document.getElementById('jobListingsTable');
+    if (!jobsContainer) return;
 
-    try {
-      applicationsContainer.innerHTML = `
+    if (jobs.length === 0) {
+      jobsContainer.innerHTML = `
         <tr>
           <td colspan="5" class="empty-state-cell">
             <div class="empty-state">
-              <div class="empty-state-icon">📄</div>
-              <div class="empty-state-title">Loading applications…</div>
+              <div class="empty-state-icon">💼</div>
+              <div class="empty-state-title">No job listings yet</div>
+              <div class="empty-state-text">Create your first job posting to get started!</div>
             </div>
           </td>
         </tr>
       `;
+      return;
+    }
 
-      const res = await Auth.apiCall('/applications/employer/recent?limit=5', { method: 'GET' });
-      const applications = await res.json();
+    // Render jobs table
+    jobsContainer.innerHTML = jobs
+      .map(
+        (job) => `
+      <tr>
+        <td><strong>${job.jobTitle}</strong></td>
+        <td>${job.applicationsCount ?? 0}</td>
+        <td>${this.getStatusBadge(job.status)}</td>
+        <td>${DashboardBase.formatDate(job.createdAt)}</td>
+        <td>
+          <div class="action-buttons">
+            <button class="btn btn-sm btn-secondary" onclick="EmployerDashboard.editJob(${job.jobId})">
+              Edit
+            </button>
+            <button class="btn btn-sm btn-secondary" onclick="EmployerDashboard.closeJob(${job.jobId})">
+              Close Job
+            </button>
+            <button class="btn btn-sm btn-danger" onclick="EmployerDashboard.deleteJob(${job.jobId})">
+              Delete
+            </button>
+          </div>
+        </td>
+      </tr>
+    `
+      )
+      .join('');
+  },
 
-      if (applications.length === 0) {
-        applicationsContainer.innerHTML = `
-          <tr>
-            <td colspan="5" class="empty-state-cell">
-              <div class="empty-state">
-                <div class="empty-state-icon">📄</div>
-                <div class="empty-state-title">No applications yet</div>
-                <div class="empty-state-text">Applications will appear here once candidates apply to your jobs.</div>
-              </div>
-            </td>
-          </tr>
-        `;
-        return;
-      }
+  /**
+   * Render recent applications
+   */
+  renderRecentApplications(applications) {
+    const applicationsContainer = document.getElementById('recentApplicationsTable');
+    if (!applicationsContainer) return;
 
-      // Render applications table
-      applicationsContainer.innerHTML = applications
-        .map(
-          (app) => `
+    if (applications.length === 0) {
+      applicationsContainer.innerHTML = `
         <tr>
-          <td><strong>${app.candidateName}</strong></td>
-          <td>${app.jobTitle}</td>
-          <td>${this.getStatusBadge(app.status)}</td>
-          <td>${DashboardBase.formatDate(app.appliedAt)}</td>
-          <td>
-            <button class="btn btn-sm btn-primary" onclick="EmployerDashboard.viewApplication(${app.applicationId})">
-              Review
-            </button>
+          <td colspan="5" class="empty-state-cell">
+            <div class="empty-state">
+              <div class="empty-state-icon">📄</div>
+              <div class="empty-state-title">No applications yet</div>
+              <div class="empty-state-text">Applications will appear here once candidates apply to your jobs.</div>
+            </div>
           </td>
         </tr>
-      `
-        )
-        .join('');
-    } catch (error) {
-      console.error('Error loading recent applications:', error);
-      DashboardBase.showError('Failed to load applications', applicationsContainer);
+      `;
+      return;
     }
+
+    // Render applications table
+    applicationsContainer.innerHTML = applications
+      .map(
+        (app) => `
+      <tr>
+        <td><strong>${app.candidateName}</strong></td>
+        <td>${app.jobTitle}</td>
+        <td>${this.getStatusBadge(app.status)}</td>
+        <td>${DashboardBase.formatDate(app.appliedAt)}</td>
+        <td>
+          <button class="btn btn-sm btn-primary" onclick="EmployerDashboard.viewApplication(${app.applicationId})">
+            Review
+          </button>
+        </td>
+      </tr>
+    `
+      )
+      .join('');
   },
 
   /**
    * Update KPI cards
    */
-  updateKPIs() {
-    const totalJobs = Array.isArray(this.jobs) ? this.jobs.length : 0;
-    const activeJobs = Array.isArray(this.jobs)
-      ? this.jobs.filter((j) => (j.status || '').toLowerCase() === 'active').length
-      : 0;
-
-    // Update KPI values
-    const totalJobsEl = document.getElementById('kpiTotalJobs');
-    if (totalJobsEl) totalJobsEl.textContent = totalJobs;
-
-    const activeJobsEl = document.getElementById('kpiActiveJobs');
-    if (activeJobsEl) activeJobsEl.textContent = activeJobs;
-
-    // Employer application summary
-    Auth.apiCall('/applications/employer/summary', { method: 'GET' })
-      .then((res) => res.json())
-      .then((summary) => {
-        const totalApplications = summary?.total ?? 0;
-        const pendingApplications = summary?.pending ?? 0;
-
-        const totalAppsEl = document.getElementById('kpiTotalApplications');
-        if (totalAppsEl) totalAppsEl.textContent = totalApplications;
-
-        const pendingAppsEl = document.getElementById('kpiPendingApplications');
-        if (pendingAppsEl) pendingAppsEl.textContent = pendingApplications;
-      })
-      .catch(() => {
-        // keep existing values on error
-      });
+  updateKPIs(summary) {
+    const kpis = {
+      kpiTotalJobs: summary.totalJobs ?? 0,
+      kpiActiveJobs: summary.activeJobs ?? 0,
+      kpiTotalApplications: summary.totalApplications ?? 0,
+      kpiPendingApplications: summary.pendingApplications ?? 0,
+    };
+    Object.entries(kpis).forEach(([id, value]) => {
+      const el = document.getElementById(id);
+      if (el) el.textContent = value;
+    });
   },
 
   /**
@@ -243,7 +240,7 @@ const EmployerDashboard = {
         body: JSON.stringify({ status: 'closed' }),
       });
       DashboardBase.showSuccess('Job closed successfully', document.querySelector('.dashboard-content'));
-      await this.loadJobListings();
+      await this.loadDashboardData();
     } catch (error) {
       console.error('Error closing job:', error);
       DashboardBase.showError(error.message || 'Failed to close job', document.querySelector('.dashboard-content'));
@@ -261,7 +258,7 @@ const EmployerDashboard = {
     try {
       await Auth.apiCall(`/jobs/${jobId}`, { method: 'DELETE' });
       DashboardBase.showSuccess('Job deleted successfully', document.querySelector('.dashboard-content'));
-      await this.loadJobListings();
+      await this.loadDashboardData();
     } catch (error) {
       console.error('Error deleting job:', error);
       DashboardBase.showError(error.message || 'Failed to delete job', document.querySelector('.dashboard-content'));
@@ -0,0 +1,68 @@
+"""
+tools/backfill_salaries.py
+
+Fill salary_min/salary_max/salary_currency/salary_period (schema migration 6)
+for job listings written before they existed, in small batches so the table
+is never locked for long.
+
+Usage:
+    python -m project.tools.backfill_salaries              # rows not parsed yet
+    python -m project.tools.backfill_salaries --all        # re-parse every row (after parser changes)
+    python -m project.tools.backfill_salaries --batch-size 500
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select, update
+
+from project.database import dispose_engines
+from project.job_service.database import engine
+from project.job_service.models import JobListing
+from project.job_service.salary import salary_columns
+
+
+async def _run(*, reparse_all: bool, batch_size: int) -> int:
+    scanned = parsed = 0
+    last_id = 0
+    try:
+        while True:
+            stmt = (
+                select(JobListing.job_id, JobListing.salary_range)
+                .where(JobListing.job_id > last_id, JobListing.salary_range.is_not(None))
+                .order_by(JobListing.job_id)
+                .limit(batch_size)
+            )
+            if not reparse_all:
+                stmt = stmt.where(JobListing.salary_period.is_(None))
+
+            # One short transaction per batch
+            async with engine.begin() as conn:
+                rows = (await conn.execute(stmt)).all()
+                for job_id, salary_range in rows:
+                    columns = salary_columns(salary_range)
+                    await conn.execute(update(JobListing).where(JobListing.job_id == job_id).values(**columns))
+                    parsed += columns["salary_period"] is not None
+            if not rows:
+                break
+            scanned += len(rows)
+            last_id = rows[-1][0]
+            print(f"... {scanned} rows scanned, {parsed} with a salary", flush=True)
+
+        print(f"done: {scanned} rows scanned, {parsed} with a salary")
+        return 0
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--all", action="store_true", help="Re-parse rows that already have salary columns")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_run(reparse_all=args.all, batch_size=args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
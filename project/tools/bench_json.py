@@ -0,0 +1,108 @@
+"""
+tools/bench_json.py
+
+Per-row cost of encoding a job list response, the old way (a JobPublicListItem
+per row, .model_dump(), then FastAPI's jsonable_encoder and json.dumps) against
+the RowEncoder + pydantic-core path of project/responses.py. No database needed;
+rows are in-memory tuples shaped like JobService.list_public_jobs rows.
+
+Usage:
+    python -m project.tools.bench_json
+    python -m project.tools.bench_json --rows 100 --repeat 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+
+from project.job_service.fields import LIST_FIELDS, row_encoder
+from project.job_service.schemas import JobPublicListItem
+from project.responses import json_response
+
+
+def _rows(count: int) -> list[tuple]:
+    created = datetime(2026, 1, 1)
+    return [
+        (
+            SimpleNamespace(
+                job_id=i,
+                job_title=f"Senior Python Developer {i}",
+                company_name="Acme Technologies",
+                location="Bengaluru, KA",
+                job_type="Full-time",
+                salary_range="10-15 LPA",
+                created_at=created + timedelta(minutes=i),
+            ),
+            "Acme Technologies",
+        )
+        for i in range(count)
+    ]
+
+
+def _models_path(rows) -> bytes:
+    content = {
+        "items": [
+            JobPublicListItem(
+                jobId=job.job_id,
+                jobTitle=job.job_title,
+                companyName=company_name or "",
+                location=job.location,
+                jobType=job.job_type,
+                salaryRange=job.salary_range,
+                createdAt=job.created_at,
+            ).model_dump()
+            for job, company_name in rows
+        ],
+        "nextCursor": None,
+        "totalEstimate": None,
+    }
+    # What FastAPI does with a returned dict (JSONResponse.render)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _fast_path(rows) -> bytes:
+    encoder = row_encoder(LIST_FIELDS)
+    return json_response(
+        {"items": encoder.items(row for row, _ in rows), "nextCursor": None, "totalEstimate": None}
+    ).body
+
+
+def _per_row_us(fn, rows, repeat: int) -> float:
+    fn(rows)  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(rows)
+    return (time.perf_counter() - started) / (repeat * len(rows)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="rows per response (default 100, JOB_PAGE_MAX_SIZE)")
+    parser.add_argument("--repeat", type=int, default=500, help="responses encoded per path (default 500)")
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    old = json.loads(_models_path(rows))
+    new = json.loads(_fast_path(rows))
+    # Same document; only the datetime spelling may differ (both ISO 8601).
+    if [sorted(item) for item in old["items"]] != [sorted(item) for item in new["items"]]:
+        print("encoders disagree on the item shape", file=sys.stderr)
+        sys.exit(1)
+
+    before = _per_row_us(_models_path, rows, args.repeat)
+    after = _per_row_us(_fast_path, rows, args.repeat)
+    print(f"{args.rows} rows x {args.repeat} responses")
+    print(f"  model + model_dump + jsonable_encoder + json.dumps: {before:8.2f} us/row")
+    print(f"  RowEncoder + pydantic-core to_json:                 {after:8.2f} us/row")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
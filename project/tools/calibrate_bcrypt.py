@@ -0,0 +1,66 @@
+"""
+tools/calibrate_bcrypt.py
+
+Pick the bcrypt work factor (BCRYPT_ROUNDS) that fits a latency budget on this machine.
+
+Usage:
+    python -m project.tools.calibrate_bcrypt --target-ms 250
+
+Times one hash per cost (median of a few runs) and recommends the highest
+cost whose hash stays within the target. Existing hashes move to the new
+cost on the next login of each user (see auth.rehash_password).
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 16
+
+
+def time_hash(rounds: int, samples: int) -> float:
+    """
+    Median seconds for one bcrypt hash at `rounds`.
+    Hashes a 32-byte value, the same size as the SHA-256 prehash used by auth.hash_password.
+    """
+    secret = os.urandom(32)
+    timings = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds=rounds)
+        started = time.perf_counter()
+        bcrypt.hashpw(secret, salt)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int = 3) -> tuple[int, list[tuple[int, float]]]:
+    chosen = MIN_ROUNDS
+    measured: list[tuple[int, float]] = []
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed_ms = time_hash(rounds, samples) * 1000
+        measured.append((rounds, elapsed_ms))
+        if elapsed_ms > target_ms:
+            break
+        chosen = rounds
+    return chosen, measured
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Latency budget for one hash (default: 250)")
+    parser.add_argument("--samples", type=int, default=3, help="Runs per cost (default: 3)")
+    args = parser.parse_args()
+
+    chosen, measured = calibrate(args.target_ms, args.samples)
+    for rounds, elapsed_ms in measured:
+        marker = "  <- recommended" if rounds == chosen else ""
+        print(f"rounds={rounds:>2}  {elapsed_ms:8.1f} ms{marker}")
+    print(f"\nBCRYPT_ROUNDS={chosen}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+tools/check_query_plans.py
+
+Query-plan regression check for the service queries.
+
+Seeds a SCRATCH database with a realistic volume of users, employers, jobs and
+applications, runs each service method against it, captures the SQL it
+issues and EXPLAINs it. Fails (exit 1) when a plan sequentially scans a large
+table or sorts a large input, which is how a missing or unused index shows up.
+
+Usage:
+    python -m project.tools.check_query_plans --database-url postgresql+asyncpg://.../plan_check
+    python -m project.tools.check_query_plans --database-url sqlite+aiosqlite:///plan_check.db
+
+The target database is wiped (all tables dropped) before seeding; never point it at real data.
+Postgres plans are read from EXPLAIN (FORMAT JSON); SQLite from EXPLAIN QUERY PLAN.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from project.application_service.service import ApplicationService
+from project.job_service.pagination import encode_cursor
+from project.job_service.salary import SalaryFilter
+from project.job_service.service import JobService
+from project.migrations import metadata, migrate
+
+LARGE_TABLES = {"users", "job_listings", "job_applications", "employer_profiles", "job_seeker_profiles"}
+# Postgres Sort nodes estimated above this many rows count as "sorting a large table".
+MAX_SORT_ROWS = 1000
+
+
+@dataclass
+class Seed:
+    employers: int
+    seekers: int
+    jobs_per_employer: int
+    applications_per_seeker: int
+    employer_ids: list[int] = field(default_factory=list)
+    seeker_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class PlanCheck:
+    name: str
+    run: Callable[[AsyncSession, Seed], Awaitable[object]]
+    # Sorting the rows of one employer/seeker after an index lookup is bounded; say why when allowed.
+    allow_sort: str = ""
+
+
+CHECKS = [
+    PlanCheck("JobService.list_public_jobs", lambda db, s: JobService.list_public_jobs(db=db, status_filter="ACTIVE")),
+    PlanCheck(
+        "JobService.list_public_jobs (cursor page)",
+        lambda db, s: JobService.list_public_jobs(
+            db=db, status_filter="ACTIVE", cursor=encode_cursor(created_at=datetime.now(timezone.utc), job_id=s.employers)
+        ),
+    ),
+    PlanCheck(
+        "JobService.search_jobs (min salary, sort=salary)",
+        lambda db, s: JobService.search_jobs(
+            db=db, q=None, salary=SalaryFilter(min_salary=1_000_000), sort="salary"
+        ),
+    ),
+    PlanCheck("JobService.get_job", lambda db, s: JobService.get_job(db=db, job_id=s.employers)),
+    PlanCheck("JobService.job_version", lambda db, s: JobService.job_version(db=db, job_id=s.employers)),
+    PlanCheck(
+        "JobService.list_employer_jobs",
+        lambda db, s: JobService.list_employer_jobs(db=db, employer_id=s.employer_ids[0]),
+    ),
+    PlanCheck(
+        "JobService.count_employer_jobs",
+        lambda db, s: JobService.count_employer_jobs(db=db, employer_id=s.employer_ids[0]),
+    ),
+    PlanCheck(
+        "ApplicationService.employer_jobs_overview",
+        lambda db, s: ApplicationService.employer_jobs_overview(db=db, employer_id=s.employer_ids[0]),
+        allow_sort="groups and orders one employer's jobs (reached through job_listings.employer_id)",
+    ),
+    PlanCheck(
+        "ApplicationService.list_my_applications",
+        lambda db, s: ApplicationService.list_my_applications(db=db, job_seeker_id=s.seeker_ids[0]),
+    ),
+    PlanCheck(
+        "ApplicationService.summarize_my_applications",
+        lambda db, s: ApplicationService.summarize_my_applications(db=db, job_seeker_id=s.seeker_ids[0]),
+    ),
+    PlanCheck(
+        "ApplicationService.list_employer_recent",
+        lambda db, s: ApplicationService.list_employer_recent(db=db, employer_id=s.employer_ids[0]),
+        allow_sort="orders one employer's applications (reached through job_listings.employer_id)",
+    ),
+    PlanCheck(
+        "ApplicationService.summarize_employer_applications",
+        lambda db, s: ApplicationService.summarize_employer_applications(db=db, employer_id=s.employer_ids[0]),
+        allow_sort="groups one employer's applications",
+    ),
+    PlanCheck(
+        "ApplicationService.employer_job_counts",
+        lambda db, s: ApplicationService.employer_job_counts(db=db, employer_id=s.employer_ids[0]),
+        allow_sort="groups one employer's applications",
+    ),
+]
+
+
+# -------------------------
+# Seeding
+# -------------------------
+async def seed(engine, spec: Seed) -> Seed:
+    tables = metadata.tables
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+    await migrate(engine)
+
+    async with engine.begin() as conn:
+        users = [
+            {"id": i, "email": f"user{i}@example.com", "hashed_password": "x", "role": "employer" if i <= spec.employers else "job_seeker", "is_active": True}
+            for i in range(1, spec.employers + spec.seekers + 1)
+        ]
+        await conn.execute(tables["users"].insert(), users)
+        spec.employer_ids = [u["id"] for u in users if u["role"] == "employer"]
+        spec.seeker_ids = [u["id"] for u in users if u["role"] == "job_seeker"]
+
+        await conn.execute(
+            tables["employer_profiles"].insert(),
+            [{"user_id": uid, "company_name": f"Company {uid}"} for uid in spec.employer_ids],
+        )
+        await conn.execute(
+            tables["job_seeker_profiles"].insert(),
+            [{"user_id": uid, "full_name": f"Seeker {uid}", "email": f"user{uid}@example.com"} for uid in spec.seeker_ids],
+        )
+
+        jobs = []
+        for employer_id in spec.employer_ids:
+            for _ in range(spec.jobs_per_employer):
+                created = now - timedelta(minutes=rng.randint(0, 525_600))
+                jobs.append(
+                    {
+                        "employer_id": employer_id,
+                        "job_title": "Engineer",
+                        "job_description": "Build things",
+                        "job_type": "Full-time",
+                        "location": "Remote",
+                        "salary_min": (low := rng.randint(3, 40) * 100_000),
+                        "salary_max": low + 500_000,
+                        "salary_currency": "INR",
+                        "salary_period": "year",
+                        "status": rng.choice(["ACTIVE", "ACTIVE", "CLOSED", "DRAFT"]),
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                )
+        await conn.execute(tables["job_listings"].insert(), jobs)
+        job_count = len(jobs)
+
+        applications = []
+        for seeker_id in spec.seeker_ids:
+            for job_id in rng.sample(range(1, job_count + 1), spec.applications_per_seeker):
+                applications.append(
+                    {
+                        "job_id": job_id,
+                        "job_seeker_id": seeker_id,
+                        "status": rng.choice(["PENDING", "ACCEPTED", "REJECTED"]),
+                        "created_at": now - timedelta(minutes=rng.randint(0, 525_600)),
+                    }
+                )
+        await conn.execute(tables["job_applications"].insert(), applications)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+    return spec
+
+
+# -------------------------
+# Plan inspection
+# -------------------------
+def _postgres_problems(plan: dict, allow_sort: bool) -> list[str]:
+    problems = []
+    node_type = plan.get("Node Type")
+    relation = plan.get("Relation Name")
+    if node_type == "Seq Scan" and relation in LARGE_TABLES:
+        problems.append(f"Seq Scan on {relation}")
+    if node_type in {"Sort", "Incremental Sort"} and plan.get("Plan Rows", 0) > MAX_SORT_ROWS and not allow_sort:
+        problems.append(f"{node_type} of ~{plan['Plan Rows']} rows")
+    for child in plan.get("Plans", []):
+        problems.extend(_postgres_problems(child, allow_sort))
+    return problems
+
+
+def _sqlite_problems(rows: list, allow_sort: bool) -> list[str]:
+    problems = []
+    for row in rows:
+        detail = str(row[-1])
+        words = detail.split()
+        if words[:1] == ["SCAN"] and len(words) > 1 and words[1] in LARGE_TABLES and "INDEX" not in detail:
+            problems.append(detail)
+        if "TEMP B-TREE FOR ORDER BY" in detail and not allow_sort:
+            problems.append(detail)
+    return problems
+
+
+async def explain(conn, statement: str, parameters) -> list[str]:
+    if conn.dialect.name == "postgresql":
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        document = result.scalar()
+        plan = (json.loads(document) if isinstance(document, str) else document)[0]["Plan"]
+        return [json.dumps(plan)]
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [json.dumps(list(row)) for row in result.all()]
+
+
+async def check(database_url: str, spec: Seed) -> int:
+    engine = create_async_engine(database_url)
+    try:
+        await seed(engine, spec)
+        captured: list[tuple[str, object]] = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        failures = 0
+        for plan_check in CHECKS:
+            captured.clear()
+            async with sessions() as db:
+                await plan_check.run(db, spec)
+            statements = list(captured)
+
+            problems: list[str] = []
+            async with engine.connect() as conn:
+                for statement, parameters in statements:
+                    for line in await explain(conn, statement, parameters):
+                        if conn.dialect.name == "postgresql":
+                            problems.extend(_postgres_problems(json.loads(line), bool(plan_check.allow_sort)))
+                        else:
+                            problems.extend(_sqlite_problems([json.loads(line)], bool(plan_check.allow_sort)))
+
+            status = "FAIL" if problems else "ok"
+            note = f"  (sort allowed: {plan_check.allow_sort})" if plan_check.allow_sort else ""
+            print(f"[{status:>4}] {plan_check.name}{note}")
+            for problem in problems:
+                print(f"         {problem}")
+            failures += bool(problems)
+        return 1 if failures else 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="Scratch database (it is wiped and re-seeded)")
+    parser.add_argument("--employers", type=int, default=500)
+    parser.add_argument("--seekers", type=int, default=5000)
+    parser.add_argument("--jobs-per-employer", type=int, default=40)
+    parser.add_argument("--applications-per-seeker", type=int, default=10)
+    args = parser.parse_args()
+
+    spec = Seed(
+        employers=args.employers,
+        seekers=args.seekers,
+        jobs_per_employer=args.jobs_per_employer,
+        applications_per_seeker=args.applications_per_seeker,
+    )
+    sys.exit(asyncio.run(check(args.database_url, spec)))
+
+
+if __name__ == "__main__":
+    main()
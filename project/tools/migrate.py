@@ -0,0 +1,40 @@
+"""
+tools/migrate.py
+
+Apply pending schema migrations (see migrations.py) before starting workers.
+
+Usage:
+    python -m project.tools.migrate            # migrate the DATABASE_URL database
+    python -m project.tools.migrate --check    # exit 1 if the schema is behind
+"""
+
+import argparse
+import asyncio
+import sys
+
+from project.database import dispose_engines, engine
+from project.migrations import SCHEMA_VERSION, current_version, migrate
+
+
+async def _run(check: bool) -> int:
+    try:
+        current = await current_version(engine)
+        if check:
+            print(f"schema version {current} (code expects {SCHEMA_VERSION})")
+            return 0 if current >= SCHEMA_VERSION else 1
+        version = await migrate(engine)
+        print(f"schema version {current} -> {version}")
+        return 0
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="Only report whether migrations are pending")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_run(args.check)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""
+Unit tests for the pure helpers (no database, no running app).
+
+Run from the repository root:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# `project.*` imports, whichever directory pytest is started from
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from project.job_service.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at=created_at, job_id=42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == {"created_at": created_at, "job_id": 42, "score": None, "salary": None}
+
+
+def test_cursor_round_trip_with_score_and_salary():
+    created_at = datetime(2026, 1, 2, 3, 4, 5)
+    cursor = encode_cursor(created_at=created_at, job_id=7, score=1.25, salary=1_500_000)
+    assert decode_cursor(cursor) == {"created_at": created_at, "job_id": 7, "score": 1.25, "salary": 1_500_000}
+
+
+@pytest.mark.parametrize("cursor", [None, ""])
+def test_no_cursor_is_the_first_page(cursor):
+    assert decode_cursor(cursor) is None
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "eyJjIjoieCIsImkiOjF9", "W10"])
+def test_invalid_cursor_is_400(cursor):
+    # "e30" is {}, "eyJjIjoieCIsImkiOjF9" has a bad date, "W10" is []
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor)
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,64 @@
+import pytest
+
+from project.job_service.salary import SALARY_MAX_AMOUNT, SalaryFilter, parse_salary_range, salary_columns
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("10-15 LPA", (1_000_000, 1_500_000, "INR", "year")),
+        ("₹5,00,000 - ₹8,00,000", (500_000, 800_000, "INR", "year")),
+        ("$80k-$100k", (80_000, 100_000, "USD", "year")),
+        ("€3000/month", (3000, 3000, "EUR", "month")),
+        ("50000-80000", (50_000, 80_000, None, "year")),
+        ("10 to 12 lpa", (1_000_000, 1_200_000, "INR", "year")),
+        ("Up to 12 LPA", (None, 1_200_000, "INR", "year")),
+        ("$50/h", (50, 50, "USD", "hour")),
+        ("Rs. 40000 per month", (40_000, 40_000, "INR", "month")),
+        ("300 cr", (3_000_000_000, 3_000_000_000, "INR", "year")),
+        # Experience and years are not pay
+        ("3-5 years exp, 10 LPA", (1_000_000, 1_000_000, "INR", "year")),
+        ("2024 grad, 6 LPA", (600_000, 600_000, "INR", "year")),
+        ("2-4 yrs, $50/h", (50, 50, "USD", "hour")),
+    ],
+)
+def test_parse_salary_range(raw, expected):
+    parsed = parse_salary_range(raw)
+    assert (parsed.salary_min, parsed.salary_max, parsed.currency, parsed.period) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        None,
+        "",
+        "Negotiable",
+        "50000",  # bare number
+        "3-5 years",
+        "10 LPA + 2 LPA bonus",  # two amounts
+        "10-15-20 LPA",
+        "99999999999999999 cr",  # past BIGINT
+    ],
+)
+def test_parse_salary_range_gives_no_bounds(raw):
+    assert parse_salary_range(raw) is None
+
+
+def test_salary_columns_are_null_without_bounds():
+    assert salary_columns("Negotiable") == {
+        "salary_min": None,
+        "salary_max": None,
+        "salary_currency": None,
+        "salary_period": None,
+    }
+    assert salary_columns("10-15 LPA")["salary_max"] == 1_500_000
+    assert SALARY_MAX_AMOUNT == 2**63 - 1
+
+
+def test_salary_filter_matches():
+    salary = SalaryFilter(period="year", min_salary=1_000_000, currency="INR")
+    assert salary.matches("year", "INR", 1_500_000)
+    assert not salary.matches("month", "INR", 1_500_000)
+    assert not salary.matches("year", "USD", 1_500_000)
+    assert not salary.matches("year", "INR", 900_000)
+    assert not salary.matches("year", "INR", None)
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from project.job_service.search import InvertedIndex, SearchFilter, SearchTerm, parse_query
+
+
+def _row(job_id: int, title: str, description: str = "", **extra) -> SimpleNamespace:
+    values = {
+        "job_id": job_id,
+        "employer_id": 1,
+        "job_title": title,
+        "qualifications": None,
+        "responsibilities": None,
+        "job_description": description,
+        "location": "Pune",
+        "location_id": None,
+        "job_type": "Full-time",
+        "salary_range": None,
+        "salary_min": None,
+        "salary_max": None,
+        "salary_currency": None,
+        "salary_period": None,
+        "created_at": datetime(2026, 1, 1) + timedelta(minutes=job_id),
+        "updated_at": None,
+    }
+    values.update(extra)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture
+def index() -> InvertedIndex:
+    index = InvertedIndex()
+    index.add(_row(1, "Senior Data Engineer", "Build data pipelines"), "Acme")
+    index.add(_row(2, "Data Analyst", "Engineer reports from data"), "Acme")
+    index.add(_row(3, "Backend Engineer", "Python services"), "Beta")
+    index.add(_row(4, "Engineering Manager", "Lead the data team", job_type="Contract"), "Beta")
+    return index
+
+
+def _ids(index: InvertedIndex, query: str, search_filter: SearchFilter = SearchFilter()) -> list[int]:
+    return [job_id for job_id, _ in index.search(parse_query(query), search_filter)]
+
+
+def test_parse_query():
+    assert parse_query('"data engineer" engin* full-time the') == [
+        SearchTerm(words=((0, "data"), (1, "engineer"))),
+        SearchTerm(words=((0, "engin"),), prefix=True),
+        SearchTerm(words=((0, "full"), (1, "time"))),
+    ]
+
+
+def test_words_are_and_ed_and_title_hits_rank_first(index):
+    assert _ids(index, "engineer") == [3, 1, 2]
+    assert _ids(index, "data engineer") == [1, 2]
+
+
+def test_phrase_needs_adjacent_words_in_one_field(index):
+    assert _ids(index, '"data engineer"') == [1]
+    # Job 2 has "analyst" at the end of its title and "engineer" opening its description
+    assert _ids(index, '"analyst engineer"') == []
+
+
+def test_prefix_matches_every_word_starting_with_it(index):
+    assert sorted(_ids(index, "engin*")) == [1, 2, 3, 4]
+    assert _ids(index, "manag*") == [4]
+    assert _ids(index, "zz*") == []
+
+
+def test_filters_and_removal(index):
+    assert _ids(index, "data", SearchFilter(job_type="Contract")) == [4]
+    index.remove(4)
+    assert _ids(index, "manag*") == []
+    assert "manager" not in index.vocabulary
+    assert len(index) == 3
+
+
+def test_re_adding_a_job_replaces_its_words(index):
+    index.add(_row(3, "Frontend Developer", "React"), "Beta")
+    assert 3 not in _ids(index, "backend")
+    assert _ids(index, "frontend") == [3]
@@ -0,0 +1,81 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from project.singleflight import SingleFlight, single_flight
+
+
+def _db(pin_primary: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(info={"pin_primary": pin_primary})
+
+
+def test_concurrent_identical_calls_share_one_run():
+    calls = []
+
+    @single_flight("test.coalesce")
+    async def load(*, db, key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return {"key": key}
+
+    async def main():
+        return await asyncio.gather(*(load(db=_db(), key=1) for _ in range(5)), load(db=_db(), key=2))
+
+    results = asyncio.run(main())
+    assert calls == [1, 2]
+    assert results[:5] == [{"key": 1}] * 5 and all(r is results[0] for r in results[:5])
+    assert load.flight.leaders == 2 and load.flight.coalesced == 4
+
+
+def test_primary_pinned_calls_do_not_join_replica_calls():
+    calls = []
+
+    @single_flight("test.pinned")
+    async def load(*, db):
+        calls.append(db.info["pin_primary"])
+        await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(load(db=_db()), load(db=_db(pin_primary=True)))
+
+    asyncio.run(main())
+    assert sorted(calls) == [False, True]
+
+
+def test_followers_get_the_leaders_exception():
+    flight = SingleFlight("test.error")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [type(r) for r in results] == [ValueError, ValueError]
+    assert flight.stats()["inFlight"] == 0
+
+
+def test_follower_runs_itself_when_the_leader_is_cancelled():
+    flight = SingleFlight("test.cancel")
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "done"
+    assert len(runs) == 2